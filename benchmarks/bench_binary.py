@@ -0,0 +1,71 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from synthetic import make_scan_document
+
+from core.exporter import DataExporter
+
+EXPORTERS = {
+    'json': DataExporter.export_json,
+    'binary': DataExporter.export_binary,
+}
+
+
+def best_of(repeat, func):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run(data, fmt, compression, repeat, directory):
+    path = os.path.join(directory, f'scan.{fmt}')
+    encode_seconds, result = best_of(repeat, lambda: EXPORTERS[fmt](data, path, compression))
+    if not result['success']:
+        raise RuntimeError(result['error'])
+
+    decode_seconds, decoded = best_of(repeat, lambda: DataExporter.read(result['filename']))
+    size = os.path.getsize(result['filename'])
+    os.unlink(result['filename'])
+    return {
+        'format': fmt,
+        'compression': compression or 'none',
+        'size_mb': round(size / 1024**2, 2),
+        'encode_seconds': round(encode_seconds, 3),
+        'decode_seconds': round(decode_seconds, 3),
+        'roundtrip_exact': decoded == data,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк бинарного формата против JSON")
+    parser.add_argument('--size-mb', type=float, default=20)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--compression', choices=['gzip', 'xz'], nargs='*', default=['gzip'])
+    args = parser.parse_args()
+
+    data = make_scan_document(args.size_mb)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for compression in [None] + args.compression:
+            for fmt in EXPORTERS:
+                results.append(run(data, fmt, compression, args.repeat, tmp))
+
+    for result in results:
+        print(f"{result['format']:<7} {result['compression']:<5} {result['size_mb']:>8.2f} MB  "
+              f"encode {result['encode_seconds']:>7.3f} s  decode {result['decode_seconds']:>7.3f} s  "
+              f"exact {result['roundtrip_exact']}")
+    print(json.dumps(results))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
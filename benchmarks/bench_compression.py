@@ -0,0 +1,83 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from synthetic import make_scan_document
+
+from core.exporter import DataExporter
+
+# Варианты сжатия: (алгоритм, уровень)
+LEVELS = [
+    (None, None),
+    ('gzip', 1),
+    ('gzip', 6),
+    ('gzip', 9),
+    ('xz', 0),
+    ('xz', 3),
+    ('xz', 6),
+]
+
+EXPORTERS = {
+    'json': DataExporter.export_json,
+    'xml': DataExporter.export_xml,
+}
+
+
+def run(data, fmt, compression, level, directory):
+    start = time.perf_counter()
+    result = EXPORTERS[fmt](data, os.path.join(directory, f'scan.{fmt}'), compression, level)
+    write_seconds = time.perf_counter() - start
+    if not result['success']:
+        raise RuntimeError(result['error'])
+
+    start = time.perf_counter()
+    DataExporter.read(result['filename'])
+    read_seconds = time.perf_counter() - start
+
+    size = os.path.getsize(result['filename'])
+    os.unlink(result['filename'])
+    return {
+        'format': fmt,
+        'compression': compression or 'none',
+        'level': level,
+        'size_mb': round(size / 1024**2, 2),
+        'write_seconds': round(write_seconds, 3),
+        'read_seconds': round(read_seconds, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк экспорта со сжатием")
+    parser.add_argument('--size-mb', type=float, default=20)
+    parser.add_argument('--format', choices=list(EXPORTERS), nargs='+', default=list(EXPORTERS))
+    args = parser.parse_args()
+
+    data = make_scan_document(args.size_mb)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in args.format:
+            plain_size = None
+            for compression, level in LEVELS:
+                result = run(data, fmt, compression, level, tmp)
+                if plain_size is None:
+                    plain_size = result['size_mb']
+                result['ratio'] = round(plain_size / result['size_mb'], 1) if result['size_mb'] else None
+                # Пропускная способность считается по несжатому объему
+                result['write_mb_s'] = round(plain_size / result['write_seconds'], 1)
+                results.append(result)
+
+    for result in results:
+        level = '' if result['level'] is None else result['level']
+        print(f"{result['format']:<5} {result['compression']:<5} {level!s:>2}  "
+              f"{result['size_mb']:>8.2f} MB  x{result['ratio']:<5}  "
+              f"write {result['write_seconds']:>7.3f} s ({result['write_mb_s']} MB/s)  "
+              f"read {result['read_seconds']:>7.3f} s")
+    print(json.dumps(results))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,52 @@
+import argparse
+import json
+import sys
+import time
+
+from synthetic import make_scan_document
+
+from core.diff import diff_scans
+
+
+def mutate(data, changes):
+    hardware = data['scan_categories']['hardware']
+    interfaces = data['scan_categories']['network']['interfaces']
+    step = max(1, len(interfaces) // changes)
+    for index in range(0, len(interfaces), step):
+        interfaces[index]['addresses'][0]['address'] = '192.0.2.1'
+    hardware['disks'][10]['free'] = 1.0
+    hardware['memory']['available'] = 1.0
+    interfaces.pop()
+    interfaces.insert(0, {'name': 'veth-new', 'addresses': []})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк структурного сравнения снимков")
+    parser.add_argument('--size-mb', type=float, default=50)
+    parser.add_argument('--changes', type=int, default=100)
+    args = parser.parse_args()
+
+    old = make_scan_document(args.size_mb)
+    # Независимые копии, как при загрузке двух снимков из файлов
+    new = json.loads(json.dumps(old))
+    identical = json.loads(json.dumps(old))
+    mutate(new, args.changes)
+
+    report = {'size_mb': round(len(json.dumps(old)) / 1024**2, 1)}
+
+    start = time.perf_counter()
+    changes = diff_scans(old, identical)
+    report['identical_seconds'] = round(time.perf_counter() - start, 3)
+    report['identical_changes'] = len(changes)
+
+    start = time.perf_counter()
+    changes = diff_scans(old, new)
+    report['changed_seconds'] = round(time.perf_counter() - start, 3)
+    report['changed_changes'] = len(changes)
+
+    print(json.dumps(report))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
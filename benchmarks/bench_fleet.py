@@ -0,0 +1,68 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from synthetic import make_scan_document
+
+from core.exporter import DataExporter
+from core.fleet import aggregate
+
+
+def write_snapshots(directory, files, size_mb, disks):
+    # Снимки одинакового размера отличаются именем хоста и загрузкой памяти
+    document = make_scan_document(size_mb, disks)
+    hardware = document['scan_categories']['hardware']
+    os_info = document['scan_categories']['software']['os']
+    for index in range(files):
+        os_info['hostname'] = f'host-{index:06d}'
+        hardware['memory']['used_percent'] = float(index % 100)
+        result = DataExporter.export_json(document, os.path.join(directory, f'system_info_{index:06d}.json'))
+        if not result['success']:
+            raise RuntimeError(result['error'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк сводного отчета по снимкам парка")
+    parser.add_argument('--files', type=int, default=2000)
+    parser.add_argument('--size-mb', type=float, default=0.2)
+    parser.add_argument('--disks', type=int, default=50)
+    parser.add_argument('--processes', type=int, nargs='+', default=None,
+                        help="число процессов (по умолчанию 1, 2, 4 ... до числа ядер)")
+    args = parser.parse_args()
+
+    processes = args.processes
+    if processes is None:
+        processes = [1]
+        while processes[-1] * 2 <= (os.cpu_count() or 1):
+            processes.append(processes[-1] * 2)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        write_snapshots(tmp, args.files, args.size_mb, args.disks)
+        for count in processes:
+            start = time.perf_counter()
+            report = aggregate([tmp], processes=count)
+            seconds = time.perf_counter() - start
+            if report['hosts'] != args.files:
+                raise RuntimeError(f"Обработано {report['hosts']} снимков из {args.files}")
+            results.append({
+                'processes': count,
+                'seconds': round(seconds, 3),
+                'files_per_s': round(args.files / seconds, 1),
+            })
+
+    base = results[0]['files_per_s']
+    for result in results:
+        # Ускорение относительно одного процесса; при линейном масштабировании равно числу процессов
+        result['speedup'] = round(result['files_per_s'] / base, 2)
+        print(f"{result['processes']:>3} proc  {result['seconds']:>8.3f} s  "
+              f"{result['files_per_s']:>9.1f} files/s  x{result['speedup']}", file=sys.stderr)
+    print(json.dumps(results))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
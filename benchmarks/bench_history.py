@@ -0,0 +1,83 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from synthetic import make_disk
+
+from core.history import HistoryStore
+
+
+def make_minute_snapshot(when):
+    return {
+        'timestamp': when.isoformat(),
+        'scan_categories': {
+            'hardware': {
+                'memory': {'total': 64.0, 'available': 31.5, 'used_percent': 50.8},
+                'disks': [make_disk(i) for i in range(4)]
+            },
+            'network': {'interfaces': [{'name': 'eth0', 'addresses': []}]}
+        }
+    }
+
+
+def timed(function, repeat=20):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return round((time.perf_counter() - start) / repeat * 1000, 3), result
+
+
+def measure_queries(store, last):
+    day_start = last - timedelta(days=1)
+    results = {}
+    results['latest_10_ms'], _ = timed(lambda: store.latest(10))
+    results['latest_10_network_ms'], _ = timed(lambda: store.latest(10, categories=['network']))
+    results['range_1h_ms'], snapshots = timed(
+        lambda: store.query_range(last - timedelta(hours=1), last))
+    results['range_1h_rows'] = len(snapshots)
+    results['range_1d_hardware_ms'], snapshots = timed(
+        lambda: store.query_range(day_start, last, categories=['hardware']), repeat=3)
+    results['range_1d_rows'] = len(snapshots)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк SQLite-истории снимков")
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--batch', type=int, default=1000)
+    args = parser.parse_args()
+
+    checkpoints = sorted({min(30, args.days), args.days})
+    start = datetime(2024, 1, 1)
+    report = {'days': args.days, 'checkpoints': []}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = HistoryStore(os.path.join(tmp, 'history.db'), batch_size=args.batch)
+        minute = 0
+        insert_seconds = 0.0
+        for days in checkpoints:
+            insert_start = time.perf_counter()
+            while minute < days * 24 * 60:
+                store.add(make_minute_snapshot(start + timedelta(minutes=minute)))
+                minute += 1
+            store.flush()
+            insert_seconds += time.perf_counter() - insert_start
+
+            last = start + timedelta(minutes=minute)
+            checkpoint = {'days': days, 'snapshots': minute,
+                          'inserts_per_second': round(minute / insert_seconds)}
+            checkpoint.update(measure_queries(store, last))
+            report['checkpoints'].append(checkpoint)
+            print(checkpoint, file=sys.stderr)
+        store.close()
+
+    print(json.dumps(report))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,220 @@
+import argparse
+import gc
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from datetime import datetime
+from unittest.mock import patch
+
+from fake_psutil import FakePsutil
+
+from core.engine import CATEGORY_PROBES
+from core.exporter import DataExporter
+from core.scanner import SystemScanner
+from core.software import SoftwareInventory
+
+EXPORTERS = {
+    'json': DataExporter.export_json,
+    'xml': DataExporter.export_xml,
+    'binary': DataExporter.export_binary,
+}
+
+# Метрики, рост которых считается регрессией при сравнении с базовым отчетом
+REGRESSION_SUFFIXES = ('_ms', '_kb', '_blocks', '_objects')
+
+
+def write_dpkg_status(path, packages):
+    with open(path, 'w', encoding='utf-8') as f:
+        for index in range(packages):
+            f.write(f"Package: lib-bench-{index:05d}\nStatus: install ok installed\n"
+                    f"Architecture: amd64\nVersion: 1.{index % 40}.{index % 7}-1\n"
+                    f"Description: synthetic package\n continuation line\n\n")
+
+
+def count_allocations(function):
+    # sys.getallocatedblocks() - число живых блоков, поэтому его изменение за
+    # прогон показывает только утечки. Созданные объекты считаются по
+    # приростам счетчика младшего поколения сборщика мусора между событиями
+    # профилировщика во всех потоках: временные кортежи, списки и словари
+    # горячих циклов освобождаются позже, чем создаются, и попадают в сумму.
+    # Сборщик на время прогона отключен, чтобы счетчик не обнулялся, а полная
+    # сборка перед ним очищает списки свободных объектов - иначе объекты
+    # прошлых прогонов переиспользуются мимо счетчика
+    gc.collect()
+    enabled = gc.isenabled()
+    gc.disable()
+    state = {'last': gc.get_count()[0], 'allocated': 0}
+
+    def hook(frame, event, arg):
+        current = gc.get_count()[0]
+        if current > state['last']:
+            state['allocated'] += current - state['last']
+        state['last'] = current
+
+    threading.setprofile(hook)
+    sys.setprofile(hook)
+    try:
+        result = function()
+    finally:
+        sys.setprofile(None)
+        threading.setprofile(None)
+        hook(None, None, None)
+        if enabled:
+            gc.enable()
+    return result, state['allocated']
+
+
+def measure(function, repeat):
+    # Задержка - лучшая из repeat попыток без трассировки; память, число
+    # выделений и число оставшихся блоков - в отдельных прогонах, чтобы
+    # трассировка не искажала время
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    result = function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    retained = sys.getallocatedblocks() - blocks_before
+
+    _, allocated = count_allocations(function)
+
+    return result, {
+        'latency_ms': round(best * 1000, 2),
+        'peak_kb': round(peak / 1024, 1),
+        'allocated_objects': allocated,
+        'retained_blocks': retained,
+    }
+
+
+def bench_scan(scanner, fake, repeat):
+    results = {}
+    for category, probe_name in CATEGORY_PROBES.items():
+        fake.calls.clear()
+        _, metrics = measure(getattr(scanner, probe_name), repeat)
+        # Вызовы backend за один прогон
+        metrics['psutil_calls'] = {name: count // (repeat + 2) for name, count in fake.calls.items()}
+        results[category] = metrics
+
+    categories = {name: True for name in CATEGORY_PROBES}
+    with redirect_stdout(io.StringIO()):
+        document, results['full_scan'] = measure(lambda: scanner.selective_scan(categories), repeat)
+        # Та же полная проверка с инструментацией - для оценки ее накладных расходов
+        _, results['full_scan_instrumented'] = measure(
+            lambda: scanner.selective_scan(categories, instrument=True), repeat)
+    return document, results
+
+
+def bench_export(document, repeat, directory):
+    results = {}
+    for fmt, exporter in EXPORTERS.items():
+        path = os.path.join(directory, f'scan.{fmt}')
+        result, metrics = measure(lambda: exporter(document, path), repeat)
+        if not result['success']:
+            raise RuntimeError(result['error'])
+        metrics['output_kb'] = round(os.path.getsize(result['filename']) / 1024, 1)
+        results[fmt] = metrics
+    return results
+
+
+def flatten(report, prefix=''):
+    for key, value in report.items():
+        path = f'{prefix}{key}'
+        if isinstance(value, dict):
+            yield from flatten(value, path + '.')
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield path, value
+
+
+def compare(report, baseline, tolerance):
+    # Метрики с допуском: регрессией считается рост более чем в (1 + tolerance) раз
+    current = dict(flatten({'scan': report['scan'], 'export': report['export']}))
+    previous = dict(flatten({'scan': baseline.get('scan', {}), 'export': baseline.get('export', {})}))
+    regressions = []
+    for path, value in current.items():
+        if not path.endswith(REGRESSION_SUFFIXES) or path not in previous:
+            continue
+        old = previous[path]
+        if old > 0 and value > old * (1 + tolerance):
+            regressions.append({'metric': path, 'baseline': old, 'current': value,
+                                'ratio': round(value / old, 2)})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк сканера и экспорта на синтетическом хосте")
+    parser.add_argument('--mounts', type=int, default=2000)
+    parser.add_argument('--interfaces', type=int, default=5000)
+    parser.add_argument('--processes', type=int, default=50000)
+    parser.add_argument('--packages', type=int, default=3000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help="файл для сохранения отчета в JSON")
+    parser.add_argument('--baseline', help="отчет предыдущего запуска для поиска регрессий")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="допустимый относительный рост метрик (по умолчанию 0.25)")
+    args = parser.parse_args()
+
+    fake = FakePsutil(mounts=args.mounts, interfaces=args.interfaces, processes=args.processes)
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+        },
+        'host': {
+            'mounts': args.mounts,
+            'interfaces': args.interfaces,
+            'processes': args.processes,
+            'packages': args.packages,
+        },
+    }
+
+    with tempfile.TemporaryDirectory() as tmp, patch('core.scanner.psutil', fake):
+        dpkg_status = os.path.join(tmp, 'status')
+        write_dpkg_status(dpkg_status, args.packages)
+
+        # Без дополнения окна загрузки ядер: повторные прогоны идут подряд,
+        # и ожидание cpu_interval вошло бы в задержку
+        scanner = SystemScanner(cpu_interval=0.0)
+        scanner.software_inventory = SoftwareInventory(dpkg_status=dpkg_status, rpmdb_paths=(),
+                                                       site_dirs=[])
+
+        document, report['scan'] = bench_scan(scanner, fake, args.repeat)
+        report['export'] = bench_export(document, args.repeat, tmp)
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('host') != report['host']:
+            print("Базовый отчет снят на хосте другого размера, сравнение невозможно",
+                  file=sys.stderr)
+            return 2
+        report['regressions'] = compare(report, baseline, args.tolerance)
+        for regression in report['regressions']:
+            print(f"Регрессия {regression['metric']}: {regression['baseline']} -> "
+                  f"{regression['current']} (x{regression['ratio']})", file=sys.stderr)
+        exit_code = 1 if report['regressions'] else 0
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    print(json.dumps(report))
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
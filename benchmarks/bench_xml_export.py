@@ -0,0 +1,90 @@
+import argparse
+import hashlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from synthetic import make_scan_document
+
+from core.exporter import DataExporter
+import xml.etree.ElementTree as ET
+
+
+def write_elementtree(data, stream):
+    # Прежняя реализация export_xml: полное дерево в памяти и рекурсивный обход
+    root = ET.Element("SystemInfo")
+    timestamp_elem = ET.SubElement(root, "timestamp")
+    timestamp_elem.text = data.get('timestamp', '')
+    categories = ET.SubElement(root, "categories")
+    for category_name, category_data in data.get('scan_categories', {}).items():
+        category_elem = ET.SubElement(categories, category_name)
+        DataExporter._dict_to_xml(category_elem, category_data)
+    ET.ElementTree(root).write(stream, encoding='utf-8', xml_declaration=True)
+
+
+VARIANTS = {
+    'elementtree': write_elementtree,
+    'streaming': DataExporter.write_xml,
+}
+
+
+def peak_rss_mb():
+    # ru_maxrss на Linux в килобайтах
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_variant(variant, size_mb, output):
+    data = make_scan_document(size_mb)
+    baseline = peak_rss_mb()
+
+    start = time.perf_counter()
+    with open(output, 'wb') as f:
+        VARIANTS[variant](data, f)
+    seconds = time.perf_counter() - start
+
+    return {
+        'variant': variant,
+        'seconds': round(seconds, 3),
+        'peak_rss_delta_mb': round(peak_rss_mb() - baseline, 1),
+        'output_mb': round(os.path.getsize(output) / 1024**2, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк экспорта XML")
+    parser.add_argument('--size-mb', type=float, default=100)
+    parser.add_argument('--variant', choices=list(VARIANTS))
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    if args.variant:
+        print(json.dumps(run_variant(args.variant, args.size_mb, args.output)))
+        return 0
+
+    # Каждый вариант запускается в отдельном процессе, чтобы пиковая память не смешивалась
+    results = []
+    digests = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for variant in VARIANTS:
+            output = os.path.join(tmp, f'{variant}.xml')
+            proc = subprocess.run([sys.executable, __file__, '--variant', variant,
+                                   '--size-mb', str(args.size_mb), '--output', output],
+                                  capture_output=True, text=True, check=True)
+            results.append(json.loads(proc.stdout))
+            with open(output, 'rb') as f:
+                digests[variant] = hashlib.sha256(f.read()).hexdigest()
+
+    for result in results:
+        print(f"{result['variant']:<12} {result['seconds']:>8.3f} s  "
+              f"peak +{result['peak_rss_delta_mb']:>7.1f} MB  output {result['output_mb']} MB")
+    print(f"byte-identical: {len(set(digests.values())) == 1}")
+    print(json.dumps(results))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
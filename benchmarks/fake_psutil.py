@@ -0,0 +1,145 @@
+import os
+import socket
+import sys
+from collections import namedtuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Подмена модуля psutil для бенчмарков: синтетический "большой" хост,
+# данные строятся заранее и не зависят от оборудования машины
+
+scpufreq = namedtuple('scpufreq', ['current', 'min', 'max'])
+scputimes = namedtuple('scputimes', ['user', 'system', 'idle', 'iowait'])
+svmem = namedtuple('svmem', ['total', 'available', 'percent', 'used', 'free'])
+sdiskpart = namedtuple('sdiskpart', ['device', 'mountpoint', 'fstype', 'opts'])
+sdiskusage = namedtuple('sdiskusage', ['total', 'used', 'free', 'percent'])
+snicaddr = namedtuple('snicaddr', ['family', 'address', 'netmask', 'broadcast', 'ptp'])
+pmem = namedtuple('pmem', ['rss', 'vms'])
+sdiskio = namedtuple('sdiskio', ['read_count', 'write_count', 'read_bytes', 'write_bytes',
+                                 'read_time', 'write_time'])
+snetio = namedtuple('snetio', ['bytes_sent', 'bytes_recv', 'packets_sent', 'packets_recv',
+                               'errin', 'errout', 'dropin', 'dropout'])
+
+AF_LINK = socket.AF_PACKET if hasattr(socket, 'AF_PACKET') else -1
+
+GIB = 1024**3
+
+
+class FakeProcess:
+    __slots__ = ('info',)
+
+    def __init__(self, info):
+        self.info = info
+
+
+class FakePsutil:
+    def __init__(self, mounts=2000, interfaces=5000, processes=50000, cores=128):
+        self.cores = cores
+        self.calls = {}
+
+        self._partitions = [
+            sdiskpart(f'/dev/mapper/vg-lv{index:05d}',
+                      f'/var/lib/containers/storage/overlay/{index:05d}/merged', 'xfs', 'rw')
+            for index in range(mounts)
+        ]
+        self._usage = {
+            partition.mountpoint: sdiskusage(
+                (100 + index % 50) * GIB, (40 + index % 30) * GIB,
+                (60 - index % 30 + index % 50) * GIB,
+                round((40 + index % 30) / (100 + index % 50) * 100, 1))
+            for index, partition in enumerate(self._partitions)
+        }
+        self._interfaces = {
+            f'veth{index:07d}': [
+                snicaddr(socket.AF_INET,
+                         f'10.{index >> 16 & 255}.{index >> 8 & 255}.{index & 255}',
+                         '255.255.255.0', None, None),
+                snicaddr(socket.AF_INET6, f'fe80::{index:x}:1', 'ffff:ffff:ffff:ffff::', None, None),
+                snicaddr(AF_LINK, f'02:42:00:00:{index >> 8 & 255:02x}:{index & 255:02x}',
+                         None, 'ff:ff:ff:ff:ff:ff', None),
+            ]
+            for index in range(interfaces)
+        }
+        self._processes = [
+            FakeProcess({
+                'pid': pid,
+                'name': f'worker-{pid % 97}',
+                'cpu_percent': (pid * 7919 % 1000) / 10,
+                'memory_info': pmem((pid * 104729 % 4096) * 1024**2, 0),
+            })
+            for pid in range(1, processes + 1)
+        ]
+
+    def _count(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def cpu_freq(self, percpu=False):
+        self._count('cpu_freq')
+        if percpu:
+            return [scpufreq(2000.0 + core % 16 * 50, 800.0, 3500.0) for core in range(self.cores)]
+        return scpufreq(2450.0, 800.0, 3500.0)
+
+    def cpu_times(self, percpu=False):
+        # Каждый вызов - секунда работы: ядро core загружено на core * 37 % 101 %
+        self._count('cpu_times')
+        tick = self.calls['cpu_times']
+        times = [scputimes(tick * (core * 37 % 101), 0.0, tick * (100 - core * 37 % 101), 0.0)
+                 for core in range(self.cores)]
+        if percpu:
+            return times
+        return scputimes(*(sum(column) for column in zip(*times)))
+
+    def cpu_count(self, logical=True):
+        self._count('cpu_count')
+        return self.cores if logical else self.cores // 2
+
+    def virtual_memory(self):
+        self._count('virtual_memory')
+        return svmem(1024 * GIB, 512 * GIB, 50.0, 512 * GIB, 256 * GIB)
+
+    def disk_partitions(self, all=False):
+        self._count('disk_partitions')
+        return list(self._partitions)
+
+    def disk_usage(self, path):
+        self._count('disk_usage')
+        return self._usage[path]
+
+    def disk_io_counters(self, perdisk=False, nowrap=True):
+        self._count('disk_io_counters')
+        tick = self.calls['disk_io_counters']
+        counters = {
+            partition.device.rsplit('/', 1)[-1]: sdiskio(
+                tick * (index % 50 + 1), tick * (index % 30 + 1),
+                tick * (index % 50 + 1) * 4096, tick * (index % 30 + 1) * 8192,
+                tick * (index % 50 + 1) * 2, tick * (index % 30 + 1) * 3)
+            for index, partition in enumerate(self._partitions)
+        }
+        if perdisk:
+            return counters
+        return sdiskio(*(sum(values) for values in zip(*counters.values())))
+
+    def net_if_addrs(self):
+        self._count('net_if_addrs')
+        return dict(self._interfaces)
+
+    def pids(self):
+        self._count('pids')
+        return [process.info['pid'] for process in self._processes]
+
+    def net_io_counters(self, pernic=False, nowrap=True):
+        self._count('net_io_counters')
+        # Счетчики растут с каждым вызовом, как при постоянном трафике
+        tick = self.calls['net_io_counters']
+        counters = {
+            name: snetio(tick * (index + 1) * 1500, tick * (index + 1) * 3000,
+                         tick * (index + 1), tick * (index + 1) * 2, 0, 0, index % 3, 0)
+            for index, name in enumerate(self._interfaces)
+        }
+        if pernic:
+            return counters
+        return snetio(*(sum(values) for values in zip(*counters.values())))
+
+    def process_iter(self, attrs=None, ad_value=None):
+        self._count('process_iter')
+        return iter(self._processes)
@@ -0,0 +1,62 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Примерный размер одного интерфейса с четырьмя адресами в XML/JSON, байт
+INTERFACE_SIZE = 480
+
+
+def make_interface(index):
+    return {
+        'name': f'veth{index:07d}',
+        'addresses': [
+            {'family': 'AddressFamily.AF_INET',
+             'address': f'10.{index >> 16 & 255}.{index >> 8 & 255}.{index & 255}',
+             'netmask': '255.255.255.0'},
+            {'family': 'AddressFamily.AF_INET6',
+             'address': f'fe80::{index:x}:1',
+             'netmask': 'ffff:ffff:ffff:ffff::'},
+            {'family': 'AddressFamily.AF_PACKET',
+             'address': f'02:42:{index >> 24 & 255:02x}:{index >> 16 & 255:02x}:{index >> 8 & 255:02x}:{index & 255:02x}',
+             'netmask': None},
+            {'family': 'AddressFamily.AF_INET',
+             'address': f'172.16.{index >> 8 & 255}.{index & 255}',
+             'netmask': '255.255.0.0'},
+        ]
+    }
+
+
+def make_disk(index):
+    return {
+        'device': f'/dev/mapper/vg-lv{index:05d}',
+        'mountpoint': f'/var/lib/containers/storage/overlay/{index:05d}/merged',
+        'total': 100.0 + index % 50,
+        'used': 40.25 + index % 30,
+        'free': 59.75 - index % 30 + index % 50,
+        'percent': round((40.25 + index % 30) / (100.0 + index % 50) * 100, 1),
+        'status': 'ok'
+    }
+
+
+def make_scan_document(size_mb=100, disks=2000):
+    interfaces = max(1, int(size_mb * 1024 * 1024) // INTERFACE_SIZE)
+    return {
+        'timestamp': '2024-01-01T12:00:00',
+        'scan_categories': {
+            'hardware': {
+                'cpu': {'processor': 'x86_64', 'physical_cores': 64,
+                        'total_cores': 128, 'frequency': 2450.0},
+                'memory': {'total': 1007.5, 'available': 512.25, 'used_percent': 49.2},
+                'disks': [make_disk(i) for i in range(disks)]
+            },
+            'software': {
+                'os': {'system': 'Linux', 'release': '6.1.0', 'version': '#1 SMP',
+                       'hostname': 'bench-host'},
+                'installed_software': []
+            },
+            'network': {
+                'interfaces': [make_interface(i) for i in range(interfaces)]
+            }
+        }
+    }
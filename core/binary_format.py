@@ -0,0 +1,306 @@
+import io
+import struct
+import sys
+from array import array
+
+# Формат снимка: сигнатура, версия и одно значение верхнего уровня.
+# Каждое значение начинается с байта-тега; длины и целые - varint,
+# отрицательные целые - в zigzag-кодировке, вещественные - double (little-endian).
+# Строки до INTERN_MAX_LENGTH символов интернируются: первое вхождение пишется
+# целиком и получает номер в таблице, повторные - только номер. Набор ключей
+# словаря (форма) тоже интернируется: однотипные записи - диски, интерфейсы,
+# процессы - после первой пишутся как номер формы и значения без ключей
+MAGIC = b'SICB'
+VERSION = 1
+
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT = 3
+TAG_FLOAT = 4
+TAG_STR = 5
+TAG_STR_NEW = 6
+TAG_STR_REF = 7
+TAG_LIST = 8
+TAG_SHAPE_NEW = 9
+TAG_SHAPE_REF = 10
+TAG_FLOATS = 11
+
+# Строки длиннее этого порога пишутся без интернирования
+INTERN_MAX_LENGTH = 32
+
+CHUNK_SIZE = 64 * 1024
+
+_double = struct.Struct('<d')
+_BIG_ENDIAN = sys.byteorder == 'big'
+_END = object()
+
+
+def _write_varint(out, value):
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _write_text(out, text):
+    encoded = text.encode('utf-8', 'surrogatepass')
+    _write_varint(out, len(encoded))
+    out += encoded
+
+
+def _write_string(out, table, text):
+    if len(text) > INTERN_MAX_LENGTH:
+        out.append(TAG_STR)
+        _write_text(out, text)
+        return
+    index = table.get(text)
+    if index is None:
+        table[text] = len(table)
+        out.append(TAG_STR_NEW)
+        _write_text(out, text)
+    else:
+        out.append(TAG_STR_REF)
+        _write_varint(out, index)
+
+
+def dump(data, stream):
+    table = {}
+    shapes = {}
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+
+    # Обход в глубину на явном стеке, как при записи XML: вложенность
+    # не упирается в лимит рекурсии. Словари после заголовка формы
+    # пишутся так же, как списки - последовательностью значений
+    stack = []
+    value = data
+    while True:
+        kind = type(value)
+        if kind is str:
+            # Частый случай - повторная короткая строка - без вызова функций
+            index = table.get(value)
+            if index is not None and index < 0x80:
+                out.append(TAG_STR_REF)
+                out.append(index)
+            else:
+                _write_string(out, table, value)
+        elif kind is int:
+            number = value << 1 if value >= 0 else ((-value) << 1) - 1
+            out.append(TAG_INT)
+            if number < 0x80:
+                out.append(number)
+            else:
+                _write_varint(out, number)
+        elif kind is float:
+            out.append(TAG_FLOAT)
+            out += _double.pack(value)
+        elif kind is dict:
+            shape = tuple(value)
+            index = shapes.get(shape)
+            if index is None:
+                shapes[shape] = len(shapes)
+                out.append(TAG_SHAPE_NEW)
+                _write_varint(out, len(shape))
+                for key in shape:
+                    if type(key) is not str:
+                        raise TypeError(f"Ключ {key!r} не является строкой")
+                    _write_string(out, table, key)
+            elif index < 0x80:
+                out.append(TAG_SHAPE_REF)
+                out.append(index)
+            else:
+                out.append(TAG_SHAPE_REF)
+                _write_varint(out, index)
+            if value:
+                stack.append(iter(value.values()))
+        elif kind is list or kind is tuple:
+            if value and all(type(item) is float for item in value):
+                # Однородные списки вещественных пишутся одним массивом
+                packed = array('d', value)
+                if _BIG_ENDIAN:
+                    packed.byteswap()
+                out.append(TAG_FLOATS)
+                _write_varint(out, len(packed))
+                out += packed.tobytes()
+            else:
+                out.append(TAG_LIST)
+                _write_varint(out, len(value))
+                if value:
+                    stack.append(iter(value))
+        elif value is None:
+            out.append(TAG_NONE)
+        elif kind is bool:
+            out.append(TAG_TRUE if value else TAG_FALSE)
+        elif isinstance(value, int):
+            value = int(value)
+            continue
+        elif isinstance(value, float):
+            value = float(value)
+            continue
+        elif isinstance(value, str):
+            value = str(value)
+            continue
+        else:
+            raise TypeError(f"Тип {kind.__name__} не поддерживается бинарным форматом")
+
+        if len(out) >= CHUNK_SIZE:
+            stream.write(out)
+            out = bytearray()
+
+        while stack:
+            value = next(stack[-1], _END)
+            if value is not _END:
+                break
+            stack.pop()
+        else:
+            break
+
+    stream.write(out)
+
+
+def dumps(data):
+    buffer = io.BytesIO()
+    dump(data, buffer)
+    return buffer.getvalue()
+
+
+def load(stream):
+    return loads(stream.read())
+
+
+def loads(data):
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Данные не являются бинарным снимком")
+    if data[len(MAGIC)] != VERSION:
+        raise ValueError(f"Неподдерживаемая версия бинарного снимка: {data[len(MAGIC)]}")
+
+    try:
+        value, pos = _decode(data, len(MAGIC) + 1)
+    except IndexError:
+        raise ValueError("Бинарный снимок обрезан") from None
+    if pos > len(data):
+        raise ValueError("Бинарный снимок обрезан")
+    if pos < len(data):
+        raise ValueError("Лишние данные после бинарного снимка")
+    return value
+
+
+def _decode(data, pos):
+    table = []
+    shapes = []
+    # Элемент стека: [прочитанные значения, сколько осталось, ключи формы
+    # или None для списка]; контейнер собирается, когда прочитан целиком
+    stack = []
+    while True:
+        tag = data[pos]
+        pos += 1
+        if tag == TAG_STR_REF:
+            index = data[pos]
+            if index < 0x80:
+                pos += 1
+            else:
+                index, pos = _read_varint(data, pos)
+            value = table[index]
+        elif tag == TAG_SHAPE_REF:
+            index = data[pos]
+            if index < 0x80:
+                pos += 1
+            else:
+                index, pos = _read_varint(data, pos)
+            keys = shapes[index]
+            if keys:
+                stack.append([[], len(keys), keys])
+                continue
+            value = {}
+        elif tag == TAG_STR_NEW or tag == TAG_STR:
+            length, pos = _read_varint(data, pos)
+            value = str(data[pos:pos + length], 'utf-8', 'surrogatepass')
+            pos += length
+            if tag == TAG_STR_NEW:
+                table.append(value)
+        elif tag == TAG_INT:
+            number = data[pos]
+            if number < 0x80:
+                pos += 1
+            else:
+                number, pos = _read_varint(data, pos)
+            value = (number >> 1) ^ -(number & 1)
+        elif tag == TAG_FLOAT:
+            value = _double.unpack_from(data, pos)[0]
+            pos += 8
+        elif tag == TAG_LIST:
+            length, pos = _read_varint(data, pos)
+            if length:
+                stack.append([[], length, None])
+                continue
+            value = []
+        elif tag == TAG_SHAPE_NEW:
+            length, pos = _read_varint(data, pos)
+            keys = []
+            for _ in range(length):
+                key_tag = data[pos]
+                pos += 1
+                if key_tag == TAG_STR_REF:
+                    index, pos = _read_varint(data, pos)
+                    keys.append(table[index])
+                elif key_tag == TAG_STR_NEW or key_tag == TAG_STR:
+                    key_length, pos = _read_varint(data, pos)
+                    key = str(data[pos:pos + key_length], 'utf-8', 'surrogatepass')
+                    pos += key_length
+                    if key_tag == TAG_STR_NEW:
+                        table.append(key)
+                    keys.append(key)
+                else:
+                    raise ValueError(f"Некорректный ключ с тегом {key_tag} в позиции {pos - 1}")
+            keys = tuple(keys)
+            shapes.append(keys)
+            if keys:
+                stack.append([[], len(keys), keys])
+                continue
+            value = {}
+        elif tag == TAG_NONE:
+            value = None
+        elif tag == TAG_TRUE:
+            value = True
+        elif tag == TAG_FALSE:
+            value = False
+        elif tag == TAG_FLOATS:
+            length, pos = _read_varint(data, pos)
+            end = pos + length * 8
+            if end > len(data):
+                raise IndexError(end)
+            packed = array('d')
+            packed.frombytes(data[pos:end])
+            if _BIG_ENDIAN:
+                packed.byteswap()
+            value = packed.tolist()
+            pos = end
+        else:
+            raise ValueError(f"Неизвестный тег {tag} в позиции {pos - 1}")
+
+        # Готовое значение добавляется в текущий контейнер; завершенные
+        # контейнеры сами становятся значениями своих родителей
+        while stack:
+            frame = stack[-1]
+            frame[0].append(value)
+            frame[1] -= 1
+            if frame[1]:
+                break
+            stack.pop()
+            keys = frame[2]
+            value = frame[0] if keys is None else dict(zip(keys, frame[0]))
+        else:
+            return value, pos
@@ -0,0 +1,125 @@
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+from math import floor
+from operator import add, attrgetter, mul, sub, truediv
+
+# NumPy необязателен (pip install numpy) и импортируется при первой сводке,
+# чтобы не замедлять запуск; без него используются array, map и встроенные
+# функции, без циклов Python по ядрам
+numpy = None
+_numpy_loaded = False
+
+# Ядро считается насыщенным, если его средняя загрузка за окно не ниже порога, %
+SATURATION_PERCENT = 90.0
+
+# Поля cpu_times, не входящие в занятое время, и поля гостевых систем, которые
+# в Linux уже учтены в user и nice
+IDLE_FIELDS = ('idle', 'iowait')
+GUEST_FIELDS = ('guest', 'guest_nice')
+
+# Нижняя граница общего времени ядра: без делений на ноль у простаивающих замеров
+_MIN_TOTAL = 1e-9
+
+
+def _load_numpy():
+    global numpy, _numpy_loaded
+    if not _numpy_loaded:
+        _numpy_loaded = True
+        try:
+            import numpy as module
+        except ImportError:
+            module = None
+        numpy = module
+    return numpy
+
+
+def _percentile(ordered, fraction):
+    # Линейная интерполяция между соседними рангами, как numpy.percentile по умолчанию
+    position = (len(ordered) - 1) * fraction
+    lower = floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def busy_percent(previous, current):
+    # Загрузка каждого ядра между двумя замерами cpu_times(percpu=True) - то
+    # же, что psutil.cpu_percent, но без его отсчетов, привязанных к потоку:
+    # пробы каждого сканирования выполняются в новых потоках
+    if len(previous) != len(current):
+        # Число ядер изменилось: загрузка за этот интервал неизвестна
+        previous = current
+    fields = current[0]._fields if len(current) else ()
+    counted = [field for field in fields if field not in GUEST_FIELDS]
+
+    if _load_numpy() is not None:
+        index = {field: position for position, field in enumerate(fields)}
+        delta = numpy.clip(numpy.asarray(current, dtype=float) - numpy.asarray(previous, dtype=float),
+                           0, None).reshape(len(current), len(fields))
+        total = delta[:, [index[field] for field in counted]].sum(axis=1)
+        idle = delta[:, [index[field] for field in counted if field in IDLE_FIELDS]].sum(axis=1)
+        return (total - idle) * 100 / numpy.maximum(total, _MIN_TOTAL)
+
+    # Цикл идет по полям cpu_times, а не по ядрам: разности по всем ядрам
+    # считаются map на уровне C
+    total = array('d', bytes(8 * len(current)))
+    idle = array('d', total)
+    for field in counted:
+        value = attrgetter(field)
+        delta = array('d', map(max, map(sub, map(value, current), map(value, previous)), repeat(0.0)))
+        total = array('d', map(add, total, delta))
+        if field in IDLE_FIELDS:
+            idle = array('d', map(add, idle, delta))
+    busy = map(mul, map(sub, total, idle), repeat(100.0))
+    return array('d', map(truediv, busy, map(max, total, repeat(_MIN_TOTAL))))
+
+
+def core_means(samples):
+    # samples - замеры окна, каждый - загрузка всех ядер; результат - средняя
+    # загрузка каждого ядра за окно
+    if _load_numpy() is not None:
+        return numpy.asarray(samples, dtype=float).mean(axis=0)
+    if len(samples) == 1:
+        return array('d', samples[0])
+    # Без циклов Python по ядрам: zip транспонирует окно, суммы и деление
+    # по всем ядрам идут через map на уровне C
+    return array('d', map(truediv, map(sum, zip(*samples)), repeat(len(samples))))
+
+
+def summarize(values, saturation=SATURATION_PERCENT):
+    # Сводка по ядрам: min, max, mean, p95 и, если задан порог, число ядер
+    # не ниже порога насыщения
+    if not len(values):
+        summary = {'min': None, 'max': None, 'mean': None, 'p95': None}
+        if saturation is not None:
+            summary['saturated_cores'] = 0
+        return summary
+
+    if _load_numpy() is not None:
+        data = numpy.asarray(values, dtype=float)
+        summary = {
+            'min': round(float(data.min()), 2),
+            'max': round(float(data.max()), 2),
+            'mean': round(float(data.mean()), 2),
+            'p95': round(float(numpy.percentile(data, 95)), 2)
+        }
+        if saturation is not None:
+            summary['saturated_cores'] = int(numpy.count_nonzero(data >= saturation))
+        return summary
+
+    ordered = sorted(values)
+    summary = {
+        'min': round(ordered[0], 2),
+        'max': round(ordered[-1], 2),
+        'mean': round(sum(ordered) / len(ordered), 2),
+        'p95': round(_percentile(ordered, 0.95), 2)
+    }
+    if saturation is not None:
+        summary['saturated_cores'] = len(ordered) - bisect_left(ordered, saturation)
+    return summary
+
+
+def to_list(values, digits=2):
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return numpy.round(values, digits).tolist()
+    return list(map(round, values, repeat(digits)))
@@ -0,0 +1,99 @@
+# Естественные ключи элементов списков по имени поля, в котором лежит список
+LIST_KEYS = {
+    'disks': ('device',),
+    'interfaces': ('name',),
+    'addresses': ('family', 'address'),
+    'installed_software': ('source', 'name'),
+    'top_cpu': ('pid',),
+    'top_memory': ('pid',),
+}
+
+
+def _keyed(items, fields):
+    try:
+        if len(fields) == 1:
+            field = fields[0]
+            keys = [str(item[field]) for item in items]
+        else:
+            keys = [':'.join([str(item[field]) for field in fields]) for item in items]
+    except (KeyError, TypeError, IndexError):
+        return None
+
+    keyed = dict(zip(keys, items))
+    if len(keyed) == len(items):
+        return keyed
+
+    # Повторяющиеся ключи (например, bind-монтирования одного устройства) нумеруются
+    keyed = {}
+    for key, item in zip(keys, items):
+        unique = key
+        counter = 1
+        while unique in keyed:
+            counter += 1
+            unique = f"{key}#{counter}"
+        keyed[unique] = item
+    return keyed
+
+
+def diff_scans(old, new):
+    changes = []
+    # Обход на явном стеке; элементы стека - либо пара поддеревьев для
+    # сравнения, либо готовое изменение, чтобы сохранить порядок полей
+    stack = [(None, '', old.get('scan_categories', {}), new.get('scan_categories', {}), None)]
+
+    while stack:
+        change, path, old_node, new_node, field = stack.pop()
+        if change is not None:
+            changes.append(change)
+            continue
+
+        # Неизмененные поддеревья отсекаются сравнением на уровне C еще до
+        # попадания в стек: совпадающие объекты - по идентичности, остальные -
+        # с выходом на первом отличии
+        if old_node is new_node or old_node == new_node:
+            continue
+
+        children = []
+        if isinstance(old_node, dict) and isinstance(new_node, dict):
+            for key, old_value in old_node.items():
+                if key in new_node:
+                    new_value = new_node[key]
+                    if old_value is not new_value and old_value != new_value:
+                        child_path = f"{path}/{key}" if path else str(key)
+                        children.append((None, child_path, old_value, new_value, key))
+                else:
+                    child_path = f"{path}/{key}" if path else str(key)
+                    children.append(({'op': 'remove', 'path': child_path, 'old': old_value},
+                                     None, None, None, None))
+            for key, new_value in new_node.items():
+                if key not in old_node:
+                    child_path = f"{path}/{key}" if path else str(key)
+                    children.append(({'op': 'add', 'path': child_path, 'new': new_value},
+                                     None, None, None, None))
+        elif isinstance(old_node, list) and isinstance(new_node, list):
+            fields = LIST_KEYS.get(field)
+            old_items = _keyed(old_node, fields) if fields else None
+            new_items = _keyed(new_node, fields) if old_items is not None else None
+            if new_items is None:
+                # Без естественного ключа элементы сопоставляются по позиции
+                old_items = {str(index): item for index, item in enumerate(old_node)}
+                new_items = {str(index): item for index, item in enumerate(new_node)}
+            for key, old_item in old_items.items():
+                if key in new_items:
+                    new_item = new_items[key]
+                    if old_item is not new_item and old_item != new_item:
+                        children.append((None, f"{path}[{key}]", old_item, new_item, None))
+                else:
+                    children.append(({'op': 'remove', 'path': f"{path}[{key}]", 'old': old_item},
+                                     None, None, None, None))
+            for key, new_item in new_items.items():
+                if key not in old_items:
+                    children.append(({'op': 'add', 'path': f"{path}[{key}]", 'new': new_item},
+                                     None, None, None, None))
+        else:
+            changes.append({'op': 'change', 'path': path, 'old': old_node, 'new': new_node})
+            continue
+
+        stack.extend(reversed(children))
+
+    return changes
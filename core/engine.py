@@ -0,0 +1,263 @@
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from datetime import datetime
+
+# Категории сканирования в порядке их следования в результате
+CATEGORY_PROBES = {
+    'hardware': 'scan_hardware',
+    'software': 'scan_software',
+    'network': 'scan_network',
+    'processes': 'scan_processes',
+}
+
+# Состояние текущего сканирования (событие отмены, инструментация, прогресс), видимое
+# пробам в рабочем потоке категории. Потоки прерванного сканирования
+# продолжают видеть свое состояние и не пишут в следующее сканирование
+_context = threading.local()
+
+# Период проверки события отмены при синхронном сканировании, с
+CANCEL_POLL_INTERVAL = 0.05
+
+
+class ScanCancelled(Exception):
+    pass
+
+
+def raise_if_cancelled():
+    # Пробы вызывают проверку в длинных циклах; вне сканирования - no-op
+    cancel = getattr(_context, 'cancel', None)
+    if cancel is not None and cancel.is_set():
+        raise ScanCancelled()
+
+
+def current_instrumentation():
+    # Инструментация сканирования, которому принадлежит текущий поток; вне
+    # сканирования или без instrument - None
+    return getattr(_context, 'instrumentation', None)
+
+
+def current_scan_progress():
+    # Прогресс сканирования, которому принадлежит текущий поток; вне сканирования - None
+    return getattr(_context, 'progress', None)
+
+
+class DaemonExecutor(Executor):
+    # Пул категорий на daemon-потоках. Потоки ThreadPoolExecutor ждутся при
+    # выходе из интерпретатора, поэтому проба, зависшая после таймаута или
+    # отмены, не давала завершить процесс; daemon-поток, как и поток опроса
+    # диска, просто брошен
+    def __init__(self, max_workers, thread_name_prefix='scan'):
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._tasks = queue.SimpleQueue()
+        self._threads = []
+        self._shutdown = False
+        self._lock = threading.Lock()
+
+    def submit(self, fn, /, *args, **kwargs):
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Пул сканирования уже остановлен")
+            future = Future()
+            self._tasks.put((future, fn, args, kwargs))
+            if len(self._threads) < self.max_workers:
+                thread = threading.Thread(target=self._work, daemon=True,
+                                          name=f'{self.thread_name_prefix}_{len(self._threads)}')
+                self._threads.append(thread)
+                thread.start()
+        return future
+
+    def _work(self):
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+            future, fn, args, kwargs = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        task = self._tasks.get_nowait()
+                    except queue.Empty:
+                        break
+                    if task is not None:
+                        task[0].cancel()
+            # Каждый поток завершается, дойдя до своей метки в очереди
+            for _ in self._threads:
+                self._tasks.put(None)
+            threads = list(self._threads)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+
+class ScanEngine:
+    def __init__(self, scanner, max_workers=4):
+        self.scanner = scanner
+        self.max_workers = max_workers
+
+    def _selected(self, categories):
+        return [name for name in CATEGORY_PROBES if categories.get(name, False)]
+
+    def _new_result(self):
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'scan_categories': {},
+            'scan_info': {}
+        }
+
+    def _executor(self, selected):
+        # Пул ограничен, чтобы при добавлении категорий не плодить потоки
+        workers = max(1, min(self.max_workers, len(selected)))
+        return DaemonExecutor(max_workers=workers, thread_name_prefix='scan')
+
+    def run(self, categories, on_status=None, timeout=None, cancel=None, instrumentation=None,
+            progress=None):
+        selected = self._selected(categories)
+        result = self._new_result()
+
+        if not selected:
+            return result
+
+        if timeout is None and cancel is None:
+            with self._executor(selected) as executor:
+                futures = {
+                    name: executor.submit(self._run_category, name, on_status,
+                                          instrumentation=instrumentation, progress=progress)
+                    for name in selected
+                }
+            return self._collect(result, selected, futures, None, on_status)
+
+        # Сканирование с ограничением по времени или внешней отменой: ожидание
+        # короткими интервалами, чтобы вовремя заметить событие cancel
+        deadline = None if timeout is None else time.monotonic() + timeout
+        stop = threading.Event()
+        executor = self._executor(selected)
+        futures = {
+            name: executor.submit(self._run_category, name, on_status, stop, instrumentation,
+                                  progress)
+            for name in selected
+        }
+        pending = set(futures.values())
+        unfinished_status = None
+        try:
+            while pending:
+                if cancel is not None and cancel.is_set():
+                    unfinished_status = 'cancelled'
+                    break
+                wait_for = CANCEL_POLL_INTERVAL if cancel is not None else None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        unfinished_status = 'timeout'
+                        break
+                    wait_for = remaining if wait_for is None else min(wait_for, remaining)
+                _, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+        finally:
+            if pending:
+                stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return self._collect(result, selected, futures, unfinished_status, on_status)
+
+    async def run_async(self, categories, on_status=None, timeout=None, instrumentation=None,
+                        progress=None):
+        # Блокирующие пробы выполняются в собственном пуле сканирования;
+        # on_status вызывается из рабочих потоков
+        selected = self._selected(categories)
+        result = self._new_result()
+
+        if not selected:
+            return result
+
+        loop = asyncio.get_running_loop()
+        cancel = threading.Event()
+        executor = self._executor(selected)
+        futures = {
+            name: loop.run_in_executor(executor, self._run_category, name, on_status, cancel,
+                                       instrumentation, progress)
+            for name in selected
+        }
+
+        try:
+            await asyncio.wait(futures.values(), timeout=timeout)
+        finally:
+            # И по таймауту, и при отмене задачи пробы останавливаются
+            # кооперативно, а еще не начатые категории снимаются с пула;
+            # потоки пула завершаются вместе с последней пробой
+            pending = [future for future in futures.values() if not future.done()]
+            if pending:
+                cancel.set()
+                for future in pending:
+                    future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return self._collect(result, selected, futures, 'timeout', on_status)
+
+    def _collect(self, result, selected, futures, unfinished_status, on_status):
+        for name in selected:
+            future = futures[name]
+            if future.done() and not future.cancelled():
+                error = future.exception()
+                if error is None:
+                    data, info = future.result()
+                    result['scan_categories'][name] = data
+                    result['scan_info'][name] = info
+                    continue
+                # Проба, успевшая заметить остановку, считается незавершенной
+                if not isinstance(error, ScanCancelled) or unfinished_status is None:
+                    raise error
+
+            result['scan_info'][name] = {'status': unfinished_status}
+            if on_status:
+                on_status(name, unfinished_status)
+
+        return result
+
+    def _run_category(self, name, on_status, cancel=None, instrumentation=None, progress=None):
+        if cancel is not None and cancel.is_set():
+            raise ScanCancelled()
+
+        if on_status:
+            on_status(name, 'scanning')
+
+        started = datetime.now().isoformat()
+        start = time.perf_counter()
+        probe = getattr(self.scanner, CATEGORY_PROBES[name])
+        _context.cancel = cancel
+        _context.instrumentation = instrumentation
+        _context.progress = progress
+        try:
+            if instrumentation is None:
+                data = probe()
+            else:
+                with instrumentation.category(name):
+                    data = probe()
+        finally:
+            _context.cancel = None
+            _context.instrumentation = None
+            _context.progress = None
+        duration = time.perf_counter() - start
+
+        if on_status:
+            on_status(name, 'completed')
+
+        return data, {
+            'started': started,
+            'duration': round(duration, 4),
+            'status': 'completed'
+        }
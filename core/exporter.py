@@ -1,54 +1,194 @@
+import gzip
 import json
+import lzma
 import xml.etree.ElementTree as ET
+from core import binary_format
 from datetime import datetime
 import os
+import time
+
+# Суффиксы файлов для поддерживаемых алгоритмов сжатия
+COMPRESSION_SUFFIXES = {
+    'gzip': '.gz',
+    'xz': '.xz',
+}
+
+GZIP_MAGIC = b'\x1f\x8b'
+XZ_MAGIC = b'\xfd7zXZ\x00'
+
+
+def _compressed_name(filename, compression):
+    if compression is None:
+        return filename
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Неизвестный алгоритм сжатия: {compression}")
+    suffix = COMPRESSION_SUFFIXES[compression]
+    return filename if filename.endswith(suffix) else filename + suffix
+
+
+def open_output(target, compression, level=None, text=False):
+    # Сжатие выполняется по мере записи: несжатый документ в памяти не собирается.
+    # target - имя файла или уже открытый двоичный поток (например, stdout)
+    if compression is None:
+        if text:
+            return open(target, 'w', encoding='utf-8')
+        return open(target, 'wb')
+    
+    mode = 'wt' if text else 'wb'
+    encoding = 'utf-8' if text else None
+    if compression == 'gzip':
+        return gzip.open(target, mode, compresslevel=6 if level is None else level,
+                         encoding=encoding)
+    if compression == 'xz':
+        return lzma.open(target, mode, preset=level, encoding=encoding)
+    raise ValueError(f"Неизвестный алгоритм сжатия: {compression}")
+
 
 class DataExporter:
     @staticmethod
-    def export_json(data, filename=None):
+    def export_json(data, filename=None, compression=None, level=None):
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"system_info_{timestamp}.json"
         
         try:
+            filename = _compressed_name(filename, compression)
             directory = os.path.dirname(filename)
             if directory:
                 os.makedirs(directory, exist_ok=True)
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open_output(filename, compression, level, text=True) as f:
+                DataExporter.write_json(data, f)
             return {'success': True, 'filename': filename}
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
     @staticmethod
-    def export_xml(data, filename=None):
+    def export_xml(data, filename=None, compression=None, level=None):
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"system_info_{timestamp}.xml"
         
+        created = None
         try:
+            filename = _compressed_name(filename, compression)
             directory = os.path.dirname(filename)
             if directory:
                 os.makedirs(directory, exist_ok=True)
             
-            root = ET.Element("SystemInfo")
-
-            timestamp_elem = ET.SubElement(root, "timestamp")
-            timestamp_elem.text = data.get('timestamp', '')
-
-            categories = ET.SubElement(root, "categories")
-            for category_name, category_data in data.get('scan_categories', {}).items():
-                category_elem = ET.SubElement(categories, category_name)
-
-                DataExporter._dict_to_xml(category_elem, category_data)
-
-            tree = ET.ElementTree(root)
-            tree.write(filename, encoding='utf-8', xml_declaration=True)
+            with open_output(filename, compression, level) as f:
+                created = filename
+                DataExporter.write_xml(data, f)
             return {'success': True, 'filename': filename}
         except Exception as e:
+            # Не оставляем на диске недописанный документ
+            if created and os.path.exists(created):
+                os.unlink(created)
             return {'success': False, 'error': str(e)}
     
+    @staticmethod
+    def export_binary(data, filename=None, compression=None, level=None):
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"system_info_{timestamp}.sicb"
+        
+        created = None
+        try:
+            filename = _compressed_name(filename, compression)
+            directory = os.path.dirname(filename)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            
+            with open_output(filename, compression, level) as f:
+                created = filename
+                DataExporter.write_binary(data, f)
+            return {'success': True, 'filename': filename}
+        except Exception as e:
+            if created and os.path.exists(created):
+                os.unlink(created)
+            return {'success': False, 'error': str(e)}
+    
+    @staticmethod
+    def read(filename):
+        # Сжатие определяется по сигнатуре, формат - по первому значащему символу
+        with open(filename, 'rb') as f:
+            magic = f.read(6)
+        
+        if magic.startswith(GZIP_MAGIC):
+            opener = gzip.open
+        elif magic.startswith(XZ_MAGIC):
+            opener = lzma.open
+        else:
+            opener = open
+        
+        with opener(filename, 'rb') as f:
+            head = f.read(64).lstrip()
+        
+        with opener(filename, 'rb') as f:
+            if head.startswith(binary_format.MAGIC):
+                return binary_format.load(f)
+            if head.startswith(b'<'):
+                return DataExporter.read_xml(f)
+            return json.load(f)
+    
+    @staticmethod
+    def read_xml(stream):
+        # Разбор по событиям: каждый закрытый элемент сразу превращается в
+        # значение родителя и очищается, дерево целиком не хранится.
+        # Значения листьев возвращаются строками - типы в XML не сохраняются
+        stack = [[]]
+        for event, elem in ET.iterparse(stream, events=('start', 'end')):
+            if event == 'start':
+                stack.append([])
+                continue
+            
+            children = stack.pop()
+            if not children:
+                value = elem.text or ''
+            elif all(tag == 'item' for tag, _ in children):
+                value = [child for _, child in children]
+            else:
+                value = dict(children)
+            stack[-1].append((elem.tag, value))
+            elem.clear()
+        
+        root = stack[0][0][1] if stack[0] else {}
+        if not isinstance(root, dict):
+            root = {}
+        categories = root.get('categories')
+        return {
+            'timestamp': root.get('timestamp', ''),
+            'scan_categories': categories if isinstance(categories, dict) else {}
+        }
+    
+    @staticmethod
+    def write_json(data, stream):
+        json.dump(data, stream, indent=2, ensure_ascii=False)
+    
+    @staticmethod
+    def write_binary(data, stream):
+        binary_format.dump(data, stream)
+    
+    @staticmethod
+    def write_xml(data, stream):
+        # Потоковая запись без построения ElementTree; вывод побайтно
+        # совпадает с ElementTree.write(encoding='utf-8', xml_declaration=True)
+        writer = _XmlStreamWriter(stream)
+        writer.write("<?xml version='1.0' encoding='utf-8'?>\n<SystemInfo>")
+        writer.text_element('timestamp', data.get('timestamp', ''))
+
+        categories = data.get('scan_categories', {})
+        if categories:
+            writer.write("<categories>")
+            for category_name, category_data in categories.items():
+                writer.element(category_name, category_data)
+            writer.write("</categories>")
+        else:
+            writer.write("<categories />")
+
+        writer.write("</SystemInfo>")
+        writer.flush()
+    
     @staticmethod
     def _dict_to_xml(parent, data):
         if isinstance(data, dict):
@@ -60,4 +200,153 @@ class DataExporter:
                 child = ET.SubElement(parent, 'item')
                 DataExporter._dict_to_xml(child, item)
         else:
-            parent.text = str(data)
\ No newline at end of file
+            parent.text = str(data)
+
+class _XmlStreamWriter:
+    CHUNK_SIZE = 64 * 1024
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._parts = []
+        self._buffered = 0
+    
+    def write(self, text):
+        self._parts.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.CHUNK_SIZE:
+            self.flush()
+    
+    def flush(self):
+        if self._parts:
+            self.stream.write(''.join(self._parts).encode('utf-8', 'xmlcharrefreplace'))
+            self._parts = []
+            self._buffered = 0
+    
+    def element(self, tag, value):
+        # Обход в глубину на явном стеке: память ограничена текущим путем,
+        # глубина вложенности не упирается в лимит рекурсии
+        stack = []
+        while True:
+            if isinstance(value, dict):
+                children = ((key.replace(' ', '_'), child) for key, child in value.items())
+            elif isinstance(value, list):
+                children = (('item', child) for child in value)
+            else:
+                children = None
+            
+            if children is None:
+                self.text_element(tag, str(value))
+            elif value:
+                self.write(f"<{tag}>")
+                stack.append((tag, children))
+            else:
+                self.write(f"<{tag} />")
+            
+            while stack:
+                parent_tag, parent_children = stack[-1]
+                next_child = next(parent_children, None)
+                if next_child is None:
+                    self.write(f"</{parent_tag}>")
+                    stack.pop()
+                else:
+                    tag, value = next_child
+                    break
+            else:
+                return
+    
+    def text_element(self, tag, text):
+        if not text:
+            self.write(f"<{tag} />")
+            return
+        if "&" in text:
+            text = text.replace("&", "&amp;")
+        if "<" in text:
+            text = text.replace("<", "&lt;")
+        if ">" in text:
+            text = text.replace(">", "&gt;")
+        self.write(f"<{tag}>{text}</{tag}>")
+
+
+class JsonLinesWriter:
+    def __init__(self, filename, max_bytes=None, max_age=None, flush_every=1, fsync_every=0):
+        self.filename = filename
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.flush_every = flush_every
+        self.fsync_every = fsync_every
+        self._file = None
+        self._open()
+    
+    def _open(self):
+        directory = os.path.dirname(self.filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        # Файл открывается один раз в режиме дозаписи; запись стоит O(record)
+        self._file = open(self.filename, 'ab')
+        self._size = os.fstat(self._file.fileno()).st_size
+        self._opened_at = time.monotonic()
+        self._unflushed = 0
+        self._unsynced = 0
+    
+    def write(self, record):
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+        
+        if self._should_rotate(len(line)):
+            self.rotate()
+        
+        self._file.write(line)
+        self._size += len(line)
+        self._unflushed += 1
+        self._unsynced += 1
+        
+        if self.fsync_every and self._unsynced >= self.fsync_every:
+            self.sync()
+        elif self.flush_every and self._unflushed >= self.flush_every:
+            self.flush()
+    
+    def _should_rotate(self, incoming):
+        if self._size == 0:
+            return False
+        if self.max_bytes and self._size + incoming > self.max_bytes:
+            return True
+        if self.max_age and time.monotonic() - self._opened_at >= self.max_age:
+            return True
+        return False
+    
+    def rotate(self):
+        self.close()
+        
+        base, ext = os.path.splitext(self.filename)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        rotated = f"{base}.{timestamp}{ext}"
+        counter = 1
+        while os.path.exists(rotated):
+            rotated = f"{base}.{timestamp}_{counter}{ext}"
+            counter += 1
+        
+        os.replace(self.filename, rotated)
+        self._open()
+        return rotated
+    
+    def flush(self):
+        self._file.flush()
+        self._unflushed = 0
+    
+    def sync(self):
+        self.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+    
+    def close(self):
+        if self._file and not self._file.closed:
+            self.flush()
+            if self.fsync_every and self._unsynced:
+                os.fsync(self._file.fileno())
+            self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
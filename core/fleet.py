@@ -0,0 +1,188 @@
+import os
+from multiprocessing import Pool
+
+from core.exporter import DataExporter
+
+# Расширения снимков, которые собираются из каталога, в том числе сжатые
+SNAPSHOT_SUFFIXES = tuple(
+    base + compression
+    for base in ('.json', '.xml', '.sicb')
+    for compression in ('', '.gz', '.xz')
+)
+
+# Пороги загрузки по умолчанию, %
+MEMORY_THRESHOLD = 90.0
+DISK_THRESHOLD = 90.0
+
+# Ширина корзины гистограмм распределений, %
+HISTOGRAM_STEP = 10
+
+# Сколько ошибок чтения сохраняется в отчете; остальные только считаются
+MAX_REPORTED_ERRORS = 100
+
+# Снимков на одно задание пула: меньше обменов между процессами
+CHUNK_SIZE = 32
+
+
+def iter_snapshots(paths):
+    # Каталоги обходятся на явном стеке через scandir: список из сотен
+    # тысяч имен не строится целиком
+    stack = list(reversed(paths))
+    while stack:
+        path = stack.pop()
+        if not os.path.isdir(path):
+            yield path
+            continue
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    stack.append(entry.path)
+                elif entry.name.endswith(SNAPSHOT_SUFFIXES):
+                    yield entry.path
+
+
+def _number(value):
+    # В XML все значения - строки; пустые и нечисловые значения пропускаются
+    if value is None or value == '':
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def summarize_snapshot(path):
+    # Выполняется в процессе пула: из снимка остается несколько чисел,
+    # поэтому в основной процесс передается запись фиксированного размера
+    try:
+        data = DataExporter.read(path)
+        categories = data.get('scan_categories') or {}
+        hardware = categories.get('hardware') or {}
+        software = categories.get('software') or {}
+        os_info = software.get('os') or {}
+
+        disk_used = disk_total = 0.0
+        disk_max = None
+        for disk in hardware.get('disks') or []:
+            used, total = _number(disk.get('used')), _number(disk.get('total'))
+            percent = _number(disk.get('percent'))
+            if used is not None and total:
+                disk_used += used
+                disk_total += total
+            if percent is not None and (disk_max is None or percent > disk_max):
+                disk_max = percent
+
+        os_name = ' '.join(str(part) for part in (os_info.get('system'), os_info.get('release')) if part)
+        return {
+            'file': path,
+            'host': os_info.get('hostname') or os.path.basename(path),
+            'os': os_name or None,
+            'memory_percent': _number((hardware.get('memory') or {}).get('used_percent')),
+            'disk_percent': round(disk_used / disk_total * 100, 2) if disk_total else None,
+            'disk_max_percent': disk_max
+        }
+    except Exception as e:
+        return {'file': path, 'error': str(e)}
+
+
+class Distribution:
+    # Потоковое распределение: счетчики корзин и агрегаты без хранения значений
+    def __init__(self, step=HISTOGRAM_STEP):
+        self.step = step
+        self.bins = [0] * (100 // step)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        index = min(max(int(value // self.step), 0), len(self.bins) - 1)
+        self.bins[index] += 1
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'min': self.min,
+            'max': self.max,
+            'mean': round(self.total / self.count, 2) if self.count else None,
+            'histogram': {
+                f'{index * self.step}-{(index + 1) * self.step}': count
+                for index, count in enumerate(self.bins)
+            }
+        }
+
+
+class FleetReducer:
+    def __init__(self, memory_threshold=MEMORY_THRESHOLD, disk_threshold=DISK_THRESHOLD):
+        self.memory_threshold = memory_threshold
+        self.disk_threshold = disk_threshold
+        self.hosts = 0
+        self.memory = Distribution()
+        self.disk = Distribution()
+        self.os_versions = {}
+        self.over_threshold = []
+        self.errors = []
+        self.error_count = 0
+
+    def add(self, summary):
+        if 'error' in summary:
+            self.error_count += 1
+            if len(self.errors) < MAX_REPORTED_ERRORS:
+                self.errors.append(summary)
+            return
+
+        self.hosts += 1
+        memory_percent = summary['memory_percent']
+        disk_percent = summary['disk_percent']
+        if memory_percent is not None:
+            self.memory.add(memory_percent)
+        if disk_percent is not None:
+            self.disk.add(disk_percent)
+        os_name = summary['os'] or 'unknown'
+        self.os_versions[os_name] = self.os_versions.get(os_name, 0) + 1
+
+        # Хост превышает порог по памяти или хотя бы по одному диску
+        disk_max = summary['disk_max_percent']
+        if ((memory_percent is not None and memory_percent >= self.memory_threshold) or
+                (disk_max is not None and disk_max >= self.disk_threshold)):
+            self.over_threshold.append({
+                'host': summary['host'],
+                'file': summary['file'],
+                'memory_percent': memory_percent,
+                'disk_max_percent': disk_max
+            })
+
+    def report(self):
+        return {
+            'hosts': self.hosts,
+            'thresholds': {'memory': self.memory_threshold, 'disk': self.disk_threshold},
+            'memory': self.memory.summary(),
+            'disk': self.disk.summary(),
+            'os_versions': dict(sorted(self.os_versions.items(), key=lambda item: (-item[1], item[0]))),
+            'over_threshold': sorted(self.over_threshold, key=lambda item: (item['host'], item['file'])),
+            'error_count': self.error_count,
+            'errors': self.errors
+        }
+
+
+def aggregate(paths, processes=None, memory_threshold=MEMORY_THRESHOLD,
+              disk_threshold=DISK_THRESHOLD, chunksize=CHUNK_SIZE):
+    # Снимки разбираются в пуле процессов; записи приходят в порядке готовности
+    # и сразу сворачиваются, поэтому в основном процессе из каждого файла
+    # остается только путь в очереди заданий и счетчики редьюсера
+    reducer = FleetReducer(memory_threshold, disk_threshold)
+    snapshots = iter_snapshots(list(paths))
+
+    if processes == 1:
+        for summary in map(summarize_snapshot, snapshots):
+            reducer.add(summary)
+        return reducer.report()
+
+    with Pool(processes) as pool:
+        for summary in pool.imap_unordered(summarize_snapshot, snapshots, chunksize):
+            reducer.add(summary)
+    return reducer.report()
@@ -0,0 +1,198 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts REAL NOT NULL,
+    timestamp TEXT NOT NULL,
+    scan_info TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_ts ON snapshots (ts);
+CREATE TABLE IF NOT EXISTS snapshot_categories (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id) ON DELETE CASCADE,
+    category TEXT NOT NULL,
+    ts REAL NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (snapshot_id, category)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_categories_category_ts ON snapshot_categories (category, ts);
+"""
+
+
+def to_epoch(value):
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.timestamp()
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+class HistoryStore:
+    def __init__(self, path, batch_size=100):
+        self.path = path
+        self.batch_size = batch_size
+        self._pending = []
+        self._lock = threading.RLock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Одно соединение на все время жизни хранилища
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA foreign_keys=ON')
+        self._conn.executescript(SCHEMA)
+
+    def add(self, scan_result):
+        with self._lock:
+            self._pending.append(scan_result)
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+
+    def flush(self):
+        with self._lock:
+            if self._pending:
+                pending, self._pending = self._pending, []
+                self.save_many(pending)
+
+    def save(self, scan_result):
+        return self.save_many([scan_result])[0]
+
+    def save_many(self, scan_results):
+        ids = []
+        category_rows = []
+        with self._lock, self._conn:
+            # Вся пачка записывается одной транзакцией
+            for result in scan_results:
+                timestamp = result.get('timestamp') or datetime.now().isoformat()
+                ts = to_epoch(timestamp)
+                scan_info = result.get('scan_info')
+                cursor = self._conn.execute(
+                    'INSERT INTO snapshots (ts, timestamp, scan_info) VALUES (?, ?, ?)',
+                    (ts, timestamp, _dumps(scan_info) if scan_info is not None else None)
+                )
+                ids.append(cursor.lastrowid)
+                for category, data in result.get('scan_categories', {}).items():
+                    category_rows.append((cursor.lastrowid, category, ts, _dumps(data)))
+
+            self._conn.executemany(
+                'INSERT INTO snapshot_categories (snapshot_id, category, ts, data) VALUES (?, ?, ?, ?)',
+                category_rows
+            )
+        return ids
+
+    def query_range(self, start=None, end=None, categories=None):
+        # Снимки в хронологическом порядке, end не включается
+        start = to_epoch(start)
+        end = to_epoch(end)
+        with self._lock:
+            self.flush()
+            if categories:
+                conditions = [f"c.category IN ({', '.join('?' * len(categories))})"]
+                params = list(categories)
+                if start is not None:
+                    conditions.append('c.ts >= ?')
+                    params.append(start)
+                if end is not None:
+                    conditions.append('c.ts < ?')
+                    params.append(end)
+                rows = self._conn.execute(
+                    'SELECT s.id, s.timestamp, s.scan_info, c.category, c.data '
+                    'FROM snapshot_categories c JOIN snapshots s ON s.id = c.snapshot_id '
+                    f"WHERE {' AND '.join(conditions)} ORDER BY c.ts, s.id",
+                    params
+                ).fetchall()
+            else:
+                conditions = []
+                params = []
+                if start is not None:
+                    conditions.append('s.ts >= ?')
+                    params.append(start)
+                if end is not None:
+                    conditions.append('s.ts < ?')
+                    params.append(end)
+                where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+                rows = self._conn.execute(
+                    'SELECT s.id, s.timestamp, s.scan_info, c.category, c.data '
+                    'FROM snapshots s LEFT JOIN snapshot_categories c ON c.snapshot_id = s.id '
+                    f"{where} ORDER BY s.ts, s.id",
+                    params
+                ).fetchall()
+        return self._assemble(rows)
+
+    def latest(self, n=1, categories=None):
+        # Последние n снимков, начиная с самого свежего
+        with self._lock:
+            self.flush()
+            if categories:
+                # Каждая категория читается по индексу (category, ts) не дальше n строк
+                candidates = set()
+                for category in categories:
+                    candidates.update(self._conn.execute(
+                        'SELECT ts, snapshot_id FROM snapshot_categories WHERE category = ? '
+                        'ORDER BY ts DESC, snapshot_id DESC LIMIT ?', (category, n)
+                    ))
+                ids = [snapshot_id for ts, snapshot_id in sorted(candidates, reverse=True)[:n]]
+            else:
+                ids = [row[0] for row in self._conn.execute(
+                    'SELECT id FROM snapshots ORDER BY ts DESC, id DESC LIMIT ?', (n,)
+                )]
+            if not ids:
+                return []
+
+            id_list = ', '.join('?' * len(ids))
+            category_filter = ''
+            params = []
+            if categories:
+                category_filter = f" AND c.category IN ({', '.join('?' * len(categories))})"
+                params.extend(categories)
+            params.extend(ids)
+            rows = self._conn.execute(
+                'SELECT s.id, s.timestamp, s.scan_info, c.category, c.data '
+                f'FROM snapshots s LEFT JOIN snapshot_categories c ON c.snapshot_id = s.id{category_filter} '
+                f'WHERE s.id IN ({id_list}) ORDER BY s.ts DESC, s.id DESC',
+                params
+            ).fetchall()
+        return self._assemble(rows)
+
+    def count(self):
+        with self._lock:
+            self.flush()
+            return self._conn.execute('SELECT COUNT(*) FROM snapshots').fetchone()[0]
+
+    def _assemble(self, rows):
+        snapshots = []
+        current_id = None
+        for snapshot_id, timestamp, scan_info, category, data in rows:
+            if snapshot_id != current_id:
+                current_id = snapshot_id
+                snapshot = {'timestamp': timestamp, 'scan_categories': {}}
+                if scan_info is not None:
+                    snapshot['scan_info'] = json.loads(scan_info)
+                snapshots.append(snapshot)
+            if category is not None:
+                snapshot['scan_categories'][category] = json.loads(data)
+        return snapshots
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
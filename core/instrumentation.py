@@ -0,0 +1,131 @@
+import copy
+import threading
+import time
+
+
+class CountingProxy:
+    # Обертка над модулем psutil: каждый вызов функции засчитывается
+    # пробе, открытой в текущем потоке
+    def __init__(self, module, instrumentation):
+        self._module = module
+        self._instrumentation = instrumentation
+
+    def __getattr__(self, name):
+        attr = getattr(self._module, name)
+        if not callable(attr):
+            return attr
+
+        count = self._instrumentation.count
+
+        def counted(*args, **kwargs):
+            count()
+            return attr(*args, **kwargs)
+        return counted
+
+
+class _Frame:
+    __slots__ = ('category', 'name', 'calls', 'wall', 'cpu', 'foreign')
+
+    def __init__(self, category, name, foreign):
+        self.category = category
+        self.name = name
+        self.calls = 0
+        self.foreign = foreign
+        self.wall = time.perf_counter()
+        self.cpu = time.thread_time()
+
+
+class _Probe:
+    __slots__ = ('instrumentation', 'category', 'name', 'frame')
+
+    def __init__(self, instrumentation, category, name):
+        self.instrumentation = instrumentation
+        self.category = category
+        self.name = name
+
+    def __enter__(self):
+        self.frame = self.instrumentation._push(self.category, self.name)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.instrumentation._pop(self.frame)
+        return False
+
+
+class Instrumentation:
+    # Хуки - вызываемые объекты, получающие запись о каждой завершенной пробе:
+    # {'category', 'probe' (None для категории целиком), 'wall', 'cpu', 'psutil_calls'}
+    def __init__(self, hooks=None):
+        self.hooks = list(hooks or [])
+        self._meta = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._proxies = {}
+
+    def wrap(self, module):
+        proxy = self._proxies.get(id(module))
+        if proxy is None or proxy._module is not module:
+            proxy = self._proxies[id(module)] = CountingProxy(module, self)
+        return proxy
+
+    def category(self, name):
+        return _Probe(self, name, None)
+
+    def probe(self, category, name):
+        return _Probe(self, category, name)
+
+    def count(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack:
+            stack[-1].calls += 1
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _push(self, category, name):
+        stack = self._stack()
+        # Проба в чужом потоке (например, опрос диска) не входит во время
+        # процессора потока категории и добавляется к нему отдельно
+        frame = _Frame(category, name, foreign=not stack)
+        stack.append(frame)
+        return frame
+
+    def _pop(self, frame):
+        wall = time.perf_counter() - frame.wall
+        cpu = time.thread_time() - frame.cpu
+        self._stack().pop()
+
+        record = {
+            'category': frame.category,
+            'probe': frame.name,
+            'wall': round(wall, 6),
+            'cpu': round(cpu, 6),
+            'psutil_calls': frame.calls
+        }
+        with self._lock:
+            entry = self._meta.setdefault(frame.category, {
+                'wall': 0.0, 'cpu': 0.0, 'psutil_calls': 0, 'probes': {}
+            })
+            entry['psutil_calls'] += frame.calls
+            if frame.name is None:
+                entry['wall'] = record['wall']
+                entry['cpu'] = round(entry['cpu'] + record['cpu'], 6)
+            else:
+                entry['probes'][frame.name] = {
+                    'wall': record['wall'],
+                    'cpu': record['cpu'],
+                    'psutil_calls': frame.calls
+                }
+                if frame.foreign:
+                    entry['cpu'] = round(entry['cpu'] + record['cpu'], 6)
+
+        for hook in self.hooks:
+            hook(record)
+
+    def summary(self, categories=None):
+        with self._lock:
+            names = categories if categories is not None else list(self._meta)
+            return {name: copy.deepcopy(self._meta[name]) for name in names if name in self._meta}
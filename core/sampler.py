@@ -0,0 +1,169 @@
+import array
+import threading
+import time
+import psutil
+from core.scanner import SystemScanner
+
+# Поля одного замера; все значения хранятся как float
+SAMPLE_FIELDS = (
+    'timestamp',
+    'cpu_percent',
+    'memory_used',
+    'memory_available',
+    'memory_percent',
+    'disk_used',
+    'disk_total',
+    'disk_timeouts',
+    'net_bytes_sent',
+    'net_bytes_recv',
+    'net_packets_sent',
+    'net_packets_recv',
+    'missed_ticks',
+)
+
+
+class RingBuffer:
+    def __init__(self, capacity, fields=SAMPLE_FIELDS):
+        if capacity < 1:
+            raise ValueError("Емкость буфера должна быть положительной")
+
+        self.capacity = capacity
+        self.fields = tuple(fields)
+        # По одному массиву double на поле: память выделяется один раз
+        self._columns = {field: array.array('d', bytes(8 * capacity)) for field in self.fields}
+        self._next = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def append(self, sample):
+        for field in self.fields:
+            self._columns[field][self._next] = sample.get(field, 0.0)
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def _indexes(self):
+        start = (self._next - self._size) % self.capacity
+        return [(start + offset) % self.capacity for offset in range(self._size)]
+
+    def column(self, field):
+        values = self._columns[field]
+        return [values[index] for index in self._indexes()]
+
+    def samples(self):
+        return [self._row(index) for index in self._indexes()]
+
+    def latest(self):
+        if not self._size:
+            return None
+        return self._row((self._next - 1) % self.capacity)
+
+    def _row(self, index):
+        return {field: self._columns[field][index] for field in self.fields}
+
+
+class MetricsSampler:
+    def __init__(self, interval=1.0, capacity=3600, scanner=None, on_sample=None, disk_every=1):
+        if interval <= 0:
+            raise ValueError("Интервал должен быть положительным")
+        if disk_every < 1:
+            raise ValueError("Период опроса дисков должен быть положительным")
+
+        self.interval = interval
+        self.buffer = RingBuffer(capacity)
+        self.scanner = scanner or SystemScanner()
+        self.on_sample = on_sample
+        # Опрос дисков - самая дорогая часть замера: на хостах с тысячами
+        # точек монтирования он выполняется раз в disk_every замеров, а в
+        # промежутках повторяются последние значения
+        self.disk_every = disk_every
+        self._disk_countdown = 0
+        self._disk_values = (0, 0, 0)
+        self.missed_ticks = 0
+        self._stop_event = threading.Event()
+        self._thread = None
+
+        # Первый вызов cpu_percent(None) только запоминает отсчет
+        psutil.cpu_percent(interval=None)
+
+    def sample(self):
+        memory = psutil.virtual_memory()
+        net = psutil.net_io_counters()
+
+        if self._disk_countdown <= 0:
+            self._disk_values = self._sample_disks()
+            self._disk_countdown = self.disk_every
+        self._disk_countdown -= 1
+        disk_used, disk_total, disk_timeouts = self._disk_values
+
+        return {
+            'timestamp': time.time(),
+            'cpu_percent': psutil.cpu_percent(interval=None),
+            'memory_used': memory.used,
+            'memory_available': memory.available,
+            'memory_percent': memory.percent,
+            'disk_used': disk_used,
+            'disk_total': disk_total,
+            'disk_timeouts': disk_timeouts,
+            'net_bytes_sent': net.bytes_sent if net else 0,
+            'net_bytes_recv': net.bytes_recv if net else 0,
+            'net_packets_sent': net.packets_sent if net else 0,
+            'net_packets_recv': net.packets_recv if net else 0,
+            'missed_ticks': self.missed_ticks,
+        }
+
+    def _sample_disks(self):
+        disk_used = disk_total = 0
+        disk_timeouts = 0
+        for partition, usage, elapsed in self.scanner.probe_disks(psutil.disk_partitions()):
+            if usage is None:
+                disk_timeouts += 1
+            else:
+                disk_used += usage.used
+                disk_total += usage.total
+        return disk_used, disk_total, disk_timeouts
+
+    def run(self, count=None):
+        self._stop_event.clear()
+        self._loop(count)
+
+    def _loop(self, count=None):
+        start = time.monotonic()
+        tick = 0
+        taken = 0
+
+        while not self._stop_event.is_set():
+            sample = self.sample()
+            self.buffer.append(sample)
+            if self.on_sample:
+                self.on_sample(sample)
+
+            taken += 1
+            if count is not None and taken >= count:
+                break
+
+            # Моменты замеров привязаны к start + k * interval, поэтому
+            # задержки отдельных замеров не накапливаются
+            tick += 1
+            lag = time.monotonic() - (start + tick * self.interval)
+            if lag > 0:
+                # Пропущенные такты учитываются явно, замер переносится на следующий
+                missed = int(lag // self.interval) + 1
+                self.missed_ticks += missed
+                tick += missed
+
+            self._stop_event.wait(max(start + tick * self.interval - time.monotonic(), 0))
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, name='metrics-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
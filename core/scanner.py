@@ -1,75 +1,476 @@
 import psutil
+import os
 import platform
 import socket
-from datetime import datetime
+import queue
+import threading
+import time
+import heapq
+from collections import deque
+from contextlib import nullcontext
+from operator import attrgetter, itemgetter
+from core.engine import ScanEngine, current_instrumentation, current_scan_progress, raise_if_cancelled
+from core.software import SoftwareInventory
+from core.instrumentation import Instrumentation
+from core import cpu_stats
+
+# Время жизни статических сведений в кэше, с (None - до явной инвалидации, 0 - не кэшировать)
+DEFAULT_FACT_TTLS = {
+    'cpu.processor': None,
+    'cpu.physical_cores': 300,
+    'cpu.total_cores': 300,
+    'os.version': None,
+    'os.hostname': 60,
+}
+
+# Атрибуты процессов, читаемые одним пакетом через process_iter
+PROCESS_ATTRS = ['pid', 'name', 'cpu_percent', 'memory_info']
+
+# Пустой контекст пробы при выключенной инструментации
+NO_PROBE = nullcontext()
+
+# Число процессов на одно событие прогресса
+PROGRESS_BATCH = 1000
+
+# Счетчики net_io_counters, по которым считаются скорости интерфейсов
+NET_RATE_FIELDS = (
+    ('bytes_recv', 'rx_bytes_per_s'),
+    ('bytes_sent', 'tx_bytes_per_s'),
+    ('packets_recv', 'rx_packets_per_s'),
+    ('packets_sent', 'tx_packets_per_s'),
+)
+
+# Счетчики disk_io_counters, по которым считаются пропускная способность и IOPS
+DISK_RATE_FIELDS = (
+    ('read_bytes', 'read_bytes_per_s'),
+    ('write_bytes', 'write_bytes_per_s'),
+    ('read_count', 'read_iops'),
+    ('write_count', 'write_iops'),
+)
+
+class FactCache:
+    def __init__(self, ttls):
+        self.ttls = dict(ttls)
+        self._entries = {}
+        self._lock = threading.Lock()
+    
+    def get(self, field, loader):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(field)
+        if entry is not None and (entry[1] is None or now < entry[1]):
+            return entry[0], True
+        
+        value = loader()
+        ttl = self.ttls.get(field, 0)
+        if ttl != 0:
+            with self._lock:
+                self._entries[field] = (value, None if ttl is None else now + ttl)
+        return value, False
+    
+    def invalidate(self, *fields):
+        with self._lock:
+            if not fields:
+                self._entries.clear()
+            for field in fields:
+                self._entries.pop(field, None)
+
+class ScanProgress:
+    # Прогресс одного сканирования: получатель событий и доли выполнения
+    # выбранных категорий. Передается пробам через контекст сканирования,
+    # поэтому потоки прерванного сканирования сообщают только в свой объект
+    def __init__(self, categories, listener=None):
+        self.listener = listener
+        self.fractions = {name: 0.0 for name, selected in categories.items() if selected}
+        self.progress = 0
+        self._lock = threading.Lock()
+    
+    def report(self, category, done, total, item=None):
+        # Общий прогресс - среднее долей выполнения выбранных категорий. Общее
+        # число шагов уточняется по ходу пробы, поэтому доля не убывает
+        fraction = min(done / total, 1.0) if total else 1.0
+        with self._lock:
+            if category in self.fractions:
+                self.fractions[category] = max(self.fractions[category], fraction)
+                self.progress = round(sum(self.fractions.values()) / len(self.fractions) * 100, 1)
+            progress = self.progress
+        
+        event = {
+            'category': category,
+            'done': done,
+            'total': total,
+            'item': item,
+            'progress': progress
+        }
+        if self.listener is not None:
+            self.listener(event)
+        return event
 
 class SystemScanner:
-    def __init__(self):
+    def __init__(self, max_workers=4, disk_timeout=2.0, disk_workers=8, fact_ttls=None,
+                 process_top_n=10, cpu_samples=1, cpu_interval=0.1, cpu_per_core=False):
         self.scan_data = {}
         self.current_progress = 0
         self.current_operation = ""
+        self.engine = ScanEngine(self, max_workers=max_workers)
+        self.disk_timeout = disk_timeout
+        self.disk_workers = disk_workers
+        # Точки монтирования, чей поток опроса еще не вернулся после таймаута:
+        # повторно они не опрашиваются, чтобы зависшие потоки не копились
+        self._disk_probes_running = set()
+        self._disk_probes_lock = threading.Lock()
+        self.facts = FactCache({**DEFAULT_FACT_TTLS, **(fact_ttls or {})})
+        self.software_inventory = SoftwareInventory()
+        self.process_top_n = process_top_n
+        # Окно загрузки ядер: первый замер охватывает время с предыдущего
+        # сканирования, остальные cpu_samples - 1 снимаются через cpu_interval.
+        # Ряды по ядрам попадают в результат только с cpu_per_core
+        self.cpu_samples = max(1, cpu_samples)
+        self.cpu_interval = cpu_interval
+        self.cpu_per_core = cpu_per_core
+        # Хуки получают замеры каждой пробы при сканировании с instrument=True
+        self.probe_hooks = []
+        # Прогресс последнего запущенного сканирования; current_progress
+        # показывает только его
+        self._progress = None
+        self._progress_lock = threading.Lock()
+        # Предыдущий замер сетевых счетчиков: (момент, {интерфейс: счетчики});
+        # скорость считается по двум соседним сканированиям без ожидания
+        self._net_io_sample = None
+        # То же для счетчиков блочных устройств и имена устройств в их ключах
+        self._disk_io_sample = None
+        self._disk_io_names = {}
+        # Отсчет загрузки ядер хранится в сканере, а не в psutil: отсчеты
+        # cpu_percent(None) привязаны к потоку, а категории каждого
+        # сканирования выполняются в новых потоках
+        self._cpu_times = psutil.cpu_times(percpu=True)
+        self._cpu_sampled_at = time.monotonic()
+    
+    # Инструментация берется из контекста сканирования потока категории,
+    # а не из атрибута сканера: параллельные и прерванные сканирования
+    # пишут замеры каждое в свой scan_meta
+    @property
+    def _psutil(self):
+        instrumentation = current_instrumentation()
+        if instrumentation is None:
+            return psutil
+        return instrumentation.wrap(psutil)
+    
+    def _probe(self, category, name):
+        instrumentation = current_instrumentation()
+        if instrumentation is None:
+            return NO_PROBE
+        return instrumentation.probe(category, name)
+    
+    def _begin_progress(self, categories, listener=None):
+        progress = ScanProgress(categories, listener)
+        with self._progress_lock:
+            self._progress = progress
+            self.current_progress = 0
+        return progress
+    
+    def _report_progress(self, category, done, total, item=None):
+        # Событие на каждый диск, интерфейс или пачку процессов; вне
+        # сканирования сообщать некому
+        progress = current_scan_progress()
+        if progress is None:
+            return
+        
+        event = progress.report(category, done, total, item)
+        with self._progress_lock:
+            if progress is self._progress:
+                self.current_progress = max(self.current_progress, event['progress'])
+    
+    def invalidate_facts(self, *fields):
+        self.facts.invalidate(*fields)
+    
+    def _fact(self, field, loader, cached_fields):
+        value, hit = self.facts.get(field, loader)
+        if hit:
+            cached_fields.append(field)
+        return value
     
     def scan_hardware(self):
         self.current_operation = "Сканирование аппаратного обеспечения"
+        cached_fields = []
+        backend = self._psutil
         
         # Процессор
-        cpu_info = {
-            'processor': platform.processor(),
-            'physical_cores': psutil.cpu_count(logical=False),
-            'total_cores': psutil.cpu_count(logical=True),
-            'frequency': psutil.cpu_freq().current if psutil.cpu_freq() else None
-        }
+        steps = 2
+        with self._probe('hardware', 'cpu'):
+            frequency = backend.cpu_freq()
+            cpu_info = {
+                'processor': self._fact('cpu.processor', platform.processor, cached_fields),
+                'physical_cores': self._fact('cpu.physical_cores',
+                                             lambda: backend.cpu_count(logical=False), cached_fields),
+                'total_cores': self._fact('cpu.total_cores',
+                                          lambda: backend.cpu_count(logical=True), cached_fields),
+                'frequency': frequency.current if frequency else None
+            }
+        with self._probe('hardware', 'cpu_per_core'):
+            cpu_info.update(self._per_core_cpu(backend))
+        self._report_progress('hardware', 1, steps, 'cpu')
         
         # Память
-        memory = psutil.virtual_memory()
-        memory_info = {
-            'total': round(memory.total / (1024**3), 2),
-            'available': round(memory.available / (1024**3), 2),
-            'used_percent': memory.percent
-        }
+        with self._probe('hardware', 'memory'):
+            memory = backend.virtual_memory()
+            memory_info = {
+                'total': round(memory.total / (1024**3), 2),
+                'available': round(memory.available / (1024**3), 2),
+                'used_percent': memory.percent
+            }
         
         # Диски
+        with self._probe('hardware', 'disk_partitions'):
+            partitions = backend.disk_partitions()
+        total = steps + len(partitions)
+        self._report_progress('hardware', steps, total, 'memory')
+        
+        def on_disk_done(done, partition):
+            self._report_progress('hardware', steps + done, total, partition.mountpoint)
+        
         disks = []
-        for partition in psutil.disk_partitions():
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                disk_info = {
+        for partition, usage, elapsed in self.probe_disks(partitions, category='hardware',
+                                                          on_done=on_disk_done):
+            if usage is None:
+                disks.append({
                     'device': partition.device,
-                    'total': round(usage.total / (1024**3), 2),
-                    'used': round(usage.used / (1024**3), 2),
-                    'free': round(usage.free / (1024**3), 2),
-                    'percent': usage.percent
-                }
-                disks.append(disk_info)
-            except PermissionError:
-                continue
+                    'mountpoint': partition.mountpoint,
+                    'status': 'timeout',
+                    'elapsed': round(elapsed, 3)
+                })
+            else:
+                disks.append(self._disk_entry(partition, usage))
+        
+        # Счетчики ввода-вывода читаются без обращения к точкам монтирования,
+        # поэтому есть и у дисков, не ответивших вовремя
+        with self._probe('hardware', 'disk_io_counters'):
+            counters = backend.disk_io_counters(perdisk=True) or {}
+        now = time.monotonic()
+        previous_sample, self._disk_io_sample = self._disk_io_sample, (now, counters)
+        if previous_sample is None:
+            interval, previous_counters = None, {}
+        else:
+            interval, previous_counters = now - previous_sample[0], previous_sample[1]
+        # Кэш имен хранит только текущие устройства и не растет при смене монтирований
+        known, names = self._disk_io_names, {}
+        for disk in disks:
+            device = disk['device']
+            name = names[device] = known.get(device) or self._disk_io_name(device, counters)
+            if name in counters:
+                disk['io'] = self._disk_io(counters[name], previous_counters.get(name), interval)
+        self._disk_io_names = names
         
         return {
             'cpu': cpu_info,
             'memory': memory_info,
-            'disks': disks
+            'disks': disks,
+            'cached_fields': cached_fields
+        }
+    
+    def _per_core_cpu(self, backend):
+        # Первый замер охватывает время с предыдущего отсчета; если сканер
+        # только что создан или сканирование повторяется сразу, окно
+        # дополняется до cpu_interval, иначе загрузка за миллисекунды - ноль
+        remaining = self._cpu_sampled_at + self.cpu_interval - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+            raise_if_cancelled()
+        
+        started = self._cpu_sampled_at
+        previous = self._cpu_times
+        samples = []
+        for index in range(self.cpu_samples):
+            if index:
+                time.sleep(self.cpu_interval)
+                raise_if_cancelled()
+            current = backend.cpu_times(percpu=True)
+            samples.append(cpu_stats.busy_percent(previous, current))
+            previous = current
+        self._cpu_times = previous
+        self._cpu_sampled_at = time.monotonic()
+        window = self._cpu_sampled_at - started
+        
+        frequencies = list(map(attrgetter('current'), backend.cpu_freq(percpu=True) or ()))
+        utilization = cpu_stats.core_means(samples) if len(samples[0]) else ()
+        
+        result = {
+            'utilization': {
+                **cpu_stats.summarize(utilization),
+                'samples': len(samples),
+                'window': round(window, 3)
+            },
+            'core_frequency': cpu_stats.summarize(frequencies, saturation=None)
+        }
+        if self.cpu_per_core:
+            result['per_core'] = {
+                'utilization': cpu_stats.to_list(utilization),
+                'frequency': frequencies
+            }
+        return result
+    
+    def _disk_io_name(self, device, counters):
+        # Ключи disk_io_counters - имена блочных устройств без /dev; ссылки
+        # вроде /dev/mapper/vg-root разрешаются в dm-N
+        name = os.path.basename(device)
+        if name not in counters:
+            name = os.path.basename(os.path.realpath(device))
+        return name
+    
+    def _disk_io(self, current, previous, interval):
+        if previous is None or not interval or interval <= 0:
+            io = {key: None for _, key in DISK_RATE_FIELDS}
+            io['await_ms'] = None
+            return io
+        
+        io = {}
+        for field, key in DISK_RATE_FIELDS:
+            io[key] = round(self._counter_delta(current, previous, field) / interval, 2)
+        # Среднее время обслуживания операции за интервал; read_time и
+        # write_time в psutil - суммарные миллисекунды
+        operations = (self._counter_delta(current, previous, 'read_count') +
+                      self._counter_delta(current, previous, 'write_count'))
+        busy = (self._counter_delta(current, previous, 'read_time') +
+                self._counter_delta(current, previous, 'write_time'))
+        io['await_ms'] = round(busy / operations, 3) if operations else None
+        return io
+    
+    def _counter_delta(self, current, previous, field):
+        value = getattr(current, field)
+        delta = value - getattr(previous, field)
+        # Переполнение 32-битных счетчиков psutil компенсирует сам (nowrap);
+        # уменьшение значит, что устройство пересоздано и счет идет с нуля
+        return value if delta < 0 else delta
+    
+    def probe_disks(self, partitions, category=None, on_done=None):
+        # Каждая точка монтирования опрашивается в отдельном daemon-потоке:
+        # зависший statvfs (NFS/CIFS) не блокирует ни сканирование, ни выход
+        results = [None] * len(partitions)
+        pending = deque(range(len(partitions)))
+        active = {}
+        completions = queue.Queue()
+        backend = self._psutil
+        # Потоки опроса не видят контекст сканирования, поэтому инструментация
+        # передается им явно
+        instrumentation = current_instrumentation() if category else None
+        finished = 0
+        
+        def probe(index, mountpoint):
+            try:
+                with instrumentation.probe(category, f'disk:{mountpoint}') if instrumentation else NO_PROBE:
+                    usage = backend.disk_usage(mountpoint)
+                completions.put((index, usage, None))
+            except Exception as e:
+                completions.put((index, None, e))
+            finally:
+                with self._disk_probes_lock:
+                    self._disk_probes_running.discard(mountpoint)
+        
+        while pending or active:
+            raise_if_cancelled()
+            while pending and len(active) < self.disk_workers:
+                index = pending.popleft()
+                mountpoint = partitions[index].mountpoint
+                with self._disk_probes_lock:
+                    hung = mountpoint in self._disk_probes_running
+                    if not hung:
+                        self._disk_probes_running.add(mountpoint)
+                if hung:
+                    # Прошлый опрос еще висит: точка монтирования сразу
+                    # считается не ответившей, новый поток не запускается
+                    results[index] = (partitions[index], None, 0.0)
+                    finished += 1
+                    if on_done:
+                        on_done(finished, partitions[index])
+                    continue
+                active[index] = time.monotonic()
+                threading.Thread(target=probe, args=(index, mountpoint),
+                                 name='disk-probe', daemon=True).start()
+            
+            if not active:
+                continue
+            wait = min(started + self.disk_timeout for started in active.values()) - time.monotonic()
+            try:
+                index, usage, error = completions.get(timeout=max(wait, 0))
+            except queue.Empty:
+                pass
+            else:
+                # Поздние ответы уже просроченных точек монтирования игнорируются
+                started = active.pop(index, None)
+                if started is not None:
+                    if error is None:
+                        results[index] = (partitions[index], usage, time.monotonic() - started)
+                    finished += 1
+                    if on_done:
+                        on_done(finished, partitions[index])
+            
+            now = time.monotonic()
+            for index, started in list(active.items()):
+                if now - started >= self.disk_timeout:
+                    del active[index]
+                    # usage=None означает, что точка монтирования не ответила вовремя
+                    results[index] = (partitions[index], None, now - started)
+                    finished += 1
+                    if on_done:
+                        on_done(finished, partitions[index])
+        
+        # Недоступные точки монтирования (PermissionError и т.п.) пропускаются
+        return [item for item in results if item is not None]
+    
+    def _disk_entry(self, partition, usage):
+        return {
+            'device': partition.device,
+            'mountpoint': partition.mountpoint,
+            'total': round(usage.total / (1024**3), 2),
+            'used': round(usage.used / (1024**3), 2),
+            'free': round(usage.free / (1024**3), 2),
+            'percent': usage.percent,
+            'status': 'ok'
         }
     
     def scan_software(self):
         self.current_operation = "Сканирование программного обеспечения"
+        cached_fields = []
         
-        os_info = {
-            'system': platform.system(),
-            'release': platform.release(),
-            'version': platform.version(),
-            'hostname': socket.gethostname()
-        }
+        with self._probe('software', 'os'):
+            os_info = {
+                'system': platform.system(),
+                'release': platform.release(),
+                'version': self._fact('os.version', platform.version, cached_fields),
+                'hostname': self._fact('os.hostname', socket.gethostname, cached_fields)
+            }
+        self._report_progress('software', 1, 2, 'os')
+        
+        with self._probe('software', 'installed_software'):
+            installed_software, cached_sources = self.software_inventory.collect()
+        self._report_progress('software', 2, 2, 'installed_software')
+        cached_fields.extend(f'installed_software.{source}' for source in cached_sources)
         
         return {
             'os': os_info,
-            'installed_software': []
+            'installed_software': installed_software,
+            'cached_fields': cached_fields
         }
     
     def scan_network(self):
         self.current_operation = "Сканирование сетевых настроек"
         
+        with self._probe('network', 'net_if_addrs'):
+            addresses_by_name = self._psutil.net_if_addrs()
+        
+        with self._probe('network', 'net_io_counters'):
+            counters = self._psutil.net_io_counters(pernic=True)
+        now = time.monotonic()
+        # Замер заменяется целиком: исчезнувшие интерфейсы не копятся в состоянии
+        previous_sample, self._net_io_sample = self._net_io_sample, (now, counters)
+        if previous_sample is None:
+            interval, previous_counters = None, {}
+        else:
+            interval, previous_counters = now - previous_sample[0], previous_sample[1]
+        
+        total = len(addresses_by_name)
         interfaces = []
-        for name, addresses in psutil.net_if_addrs().items():
+        for name, addresses in addresses_by_name.items():
             interface_info = {
                 'name': name,
                 'addresses': [
@@ -81,32 +482,117 @@ class SystemScanner:
                     for addr in addresses
                 ]
             }
+            current = counters.get(name)
+            if current is not None:
+                interface_info['io'] = self._interface_io(current, previous_counters.get(name), interval)
             interfaces.append(interface_info)
+            self._report_progress('network', len(interfaces), total, name)
+        if not interfaces:
+            self._report_progress('network', 0, 0)
         
         return {
-            'interfaces': interfaces
+            'interfaces': interfaces,
+            'io_interval': round(interval, 3) if interval else None
         }
     
-    def selective_scan(self, categories):
-        print("Запуск выборочного сканирования...")
-        
-        result = {
-            'timestamp': datetime.now().isoformat(),
-            'scan_categories': {}
+    def _interface_io(self, current, previous, interval):
+        io = {
+            'errors_in': current.errin,
+            'errors_out': current.errout,
+            'drops_in': current.dropin,
+            'drops_out': current.dropout
         }
+        # Для нового интерфейса скоростей еще нет - только со следующего сканирования
+        if previous is None or not interval or interval <= 0:
+            for _, key in NET_RATE_FIELDS:
+                io[key] = None
+            return io
         
-        if categories.get('hardware', False):
-            result['scan_categories']['hardware'] = self.scan_hardware()
+        for field, key in NET_RATE_FIELDS:
+            io[key] = round(self._counter_delta(current, previous, field) / interval, 2)
+        return io
+    
+    def scan_processes(self):
+        self.current_operation = "Сканирование процессов"
+        
+        # process_iter кэширует объекты Process между вызовами, поэтому
+        # cpu_percent считается от предыдущего сканирования без ожидания;
+        # attrs читаются внутри oneshot() одним проходом по /proc
+        backend = self._psutil
+        # Число процессов заранее неизвестно; оценка по списку pid
+        # уточняется, если процессов оказалось больше
+        expected = len(backend.pids())
+        processes = []
+        with self._probe('processes', 'process_iter'):
+            for index, process in enumerate(backend.process_iter(attrs=PROCESS_ATTRS,
+                                                                 ad_value=None)):
+                if not index & 1023:
+                    raise_if_cancelled()
+                if index and not index % PROGRESS_BATCH:
+                    self._report_progress('processes', index, max(expected, index + 1))
+                info = process.info
+                memory_info = info['memory_info']
+                processes.append((
+                    info['cpu_percent'] or 0.0,
+                    memory_info.rss if memory_info else 0,
+                    info['pid'],
+                    info['name'] or ''
+                ))
+        self._report_progress('processes', len(processes), len(processes))
+        
+        with self._probe('processes', 'top_n'):
+            top_cpu = heapq.nlargest(self.process_top_n, processes, key=itemgetter(0))
+            top_memory = heapq.nlargest(self.process_top_n, processes, key=itemgetter(1))
+        
+        return {
+            'count': len(processes),
+            'top_cpu': [self._process_entry(process) for process in top_cpu],
+            'top_memory': [self._process_entry(process) for process in top_memory]
+        }
+    
+    def _process_entry(self, process):
+        cpu_percent, rss, pid, name = process
+        return {
+            'pid': pid,
+            'name': name,
+            'cpu_percent': cpu_percent,
+            'rss_mb': round(rss / (1024**2), 2)
+        }
+    
+    def selective_scan(self, categories, on_status=None, instrument=False, timeout=None, cancel=None,
+                       on_progress=None):
+        print("Запуск выборочного сканирования...")
         
-        if categories.get('software', False):
-            result['scan_categories']['software'] = self.scan_software()
+        # Без instrument пробы сводятся к пустому контексту, а psutil
+        # вызывается напрямую, без счетчиков
+        instrumentation = Instrumentation(self.probe_hooks) if instrument else None
+        # on_progress вызывается из рабочих потоков сканирования
+        progress = self._begin_progress(categories, on_progress)
+        # При timeout или установленном cancel возвращаются готовые категории,
+        # остальные помечаются в scan_info статусом 'timeout' или 'cancelled'
+        result = self.engine.run(categories, on_status=on_status, timeout=timeout, cancel=cancel,
+                                 instrumentation=instrumentation, progress=progress)
         
-        if categories.get('network', False):
-            result['scan_categories']['network'] = self.scan_network()
+        if instrument:
+            result['scan_meta'] = instrumentation.summary(list(result['scan_categories']))
         
         print("Выборочное сканирование завершено!")
         return result
     
+    async def scan_async(self, categories, timeout=None, on_status=None, instrument=False,
+                         on_progress=None):
+        # Категории сканируются параллельно в пуле потоков, цикл событий не
+        # блокируется; по истечении timeout возвращаются готовые категории,
+        # у остальных в scan_info статус 'timeout'
+        instrumentation = Instrumentation(self.probe_hooks) if instrument else None
+        progress = self._begin_progress(categories, on_progress)
+        result = await self.engine.run_async(categories, on_status=on_status, timeout=timeout,
+                                             instrumentation=instrumentation, progress=progress)
+        
+        if instrument:
+            result['scan_meta'] = instrumentation.summary(list(result['scan_categories']))
+        return result
+    
     def get_scan_progress(self):
         return {
             'current_operation': self.current_operation,
@@ -0,0 +1,198 @@
+import os
+import site
+import sqlite3
+import struct
+import threading
+from urllib.parse import quote
+
+DPKG_STATUS = '/var/lib/dpkg/status'
+RPMDB_PATHS = ('/var/lib/rpm/rpmdb.sqlite', '/usr/lib/sysimage/rpm/rpmdb.sqlite')
+
+# Теги и типы заголовка RPM
+RPMTAG_NAME = 1000
+RPMTAG_VERSION = 1001
+RPMTAG_RELEASE = 1002
+RPMTAG_EPOCH = 1003
+RPMTAG_ARCH = 1022
+RPM_INT32_TYPE = 4
+RPM_STRING_TYPE = 6
+
+
+def default_site_dirs():
+    dirs = list(getattr(site, 'getsitepackages', lambda: [])())
+    if site.ENABLE_USER_SITE:
+        dirs.append(site.getusersitepackages())
+    return dirs
+
+
+def parse_dpkg_status(path):
+    packages = []
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        content = f.read()
+
+    for paragraph in content.split('\n\n'):
+        fields = {}
+        for line in paragraph.split('\n'):
+            # Интересуют только поля верхнего уровня, продолжения строк пропускаются
+            if line[:1] in ('P', 'S', 'V', 'A'):
+                key, _, value = line.partition(': ')
+                if key in ('Package', 'Status', 'Version', 'Architecture'):
+                    fields[key] = value
+        if 'Package' in fields and fields.get('Status', '').endswith(' installed'):
+            packages.append({
+                'name': fields['Package'],
+                'version': fields.get('Version', ''),
+                'arch': fields.get('Architecture', ''),
+                'source': 'dpkg'
+            })
+    return packages
+
+
+def parse_rpm_header(blob):
+    index_count, data_length = struct.unpack_from('>II', blob, 0)
+    data_start = 8 + index_count * 16
+    tags = {}
+
+    for entry in range(index_count):
+        tag, tag_type, offset, count = struct.unpack_from('>IIII', blob, 8 + entry * 16)
+        if tag not in (RPMTAG_NAME, RPMTAG_VERSION, RPMTAG_RELEASE, RPMTAG_EPOCH, RPMTAG_ARCH):
+            continue
+        position = data_start + offset
+        if tag_type == RPM_STRING_TYPE:
+            end = blob.index(b'\0', position)
+            tags[tag] = blob[position:end].decode('utf-8', 'replace')
+        elif tag_type == RPM_INT32_TYPE and count:
+            tags[tag] = struct.unpack_from('>i', blob, position)[0]
+
+    return tags
+
+
+def parse_rpmdb(path):
+    uri = f"file:{quote(path)}?mode=ro"
+    connection = sqlite3.connect(uri, uri=True)
+    try:
+        rows = connection.execute('SELECT blob FROM Packages').fetchall()
+    finally:
+        connection.close()
+
+    packages = []
+    for (blob,) in rows:
+        tags = parse_rpm_header(blob)
+        if RPMTAG_NAME not in tags:
+            continue
+        version = f"{tags.get(RPMTAG_VERSION, '')}-{tags.get(RPMTAG_RELEASE, '')}"
+        if RPMTAG_EPOCH in tags:
+            version = f"{tags[RPMTAG_EPOCH]}:{version}"
+        packages.append({
+            'name': tags[RPMTAG_NAME],
+            'version': version,
+            'arch': tags.get(RPMTAG_ARCH, ''),
+            'source': 'rpm'
+        })
+    return packages
+
+
+def _metadata_version(path):
+    for name in ('METADATA', 'PKG-INFO'):
+        try:
+            with open(os.path.join(path, name), 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    if line.startswith('Version:'):
+                        return line[len('Version:'):].strip()
+                    if not line.strip():
+                        break
+        except OSError:
+            continue
+    return ''
+
+
+def parse_site_dir(path):
+    packages = []
+    for entry in os.scandir(path):
+        name = entry.name
+        if name.endswith('.dist-info'):
+            stem = name[:-len('.dist-info')]
+        elif name.endswith('.egg-info'):
+            stem = name[:-len('.egg-info')]
+        else:
+            continue
+
+        # Имя и версия берутся из имени каталога, без чтения метаданных
+        parts = stem.split('-')
+        version = parts[1] if len(parts) > 1 else ''
+        if not version and entry.is_dir():
+            version = _metadata_version(entry.path)
+        packages.append({
+            'name': parts[0],
+            'version': version,
+            'arch': '',
+            'source': 'python'
+        })
+    return packages
+
+
+def _stat_key(*paths):
+    key = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            key.append((path, None))
+        else:
+            key.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(key)
+
+
+class SoftwareInventory:
+    def __init__(self, dpkg_status=DPKG_STATUS, rpmdb_paths=RPMDB_PATHS, site_dirs=None):
+        self.dpkg_status = dpkg_status
+        self.rpmdb_paths = tuple(rpmdb_paths)
+        self.site_dirs = site_dirs
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def _sources(self):
+        sources = []
+        if self.dpkg_status and os.path.isfile(self.dpkg_status):
+            sources.append(('dpkg', parse_dpkg_status, self.dpkg_status, (self.dpkg_status,)))
+
+        for path in self.rpmdb_paths:
+            if os.path.isfile(path):
+                # Изменения в режиме WAL могут не затрагивать mtime основного файла
+                sources.append(('rpm', parse_rpmdb, path, (path, path + '-wal')))
+                break
+
+        site_dirs = default_site_dirs() if self.site_dirs is None else self.site_dirs
+        for path in site_dirs:
+            if os.path.isdir(path):
+                sources.append((f'python:{path}', parse_site_dir, path, (path,)))
+        return sources
+
+    def collect(self):
+        packages = []
+        cached_sources = []
+
+        for name, parser, path, stat_paths in self._sources():
+            # Ключ кэша - mtime и размер исходных файлов: на неизменном хосте
+            # повторное сканирование стоит нескольких вызовов stat
+            key = _stat_key(*stat_paths)
+            with self._lock:
+                entry = self._cache.get(name)
+            if entry is not None and entry[0] == key:
+                cached_sources.append(name)
+                packages.extend(entry[1])
+                continue
+
+            try:
+                parsed = parser(path)
+            except (OSError, sqlite3.Error, struct.error, ValueError):
+                continue
+            with self._lock:
+                self._cache[name] = (key, parsed)
+            packages.extend(parsed)
+
+        return packages, cached_sources
+
+    def invalidate(self):
+        with self._lock:
+            self._cache.clear()
@@ -1,8 +1,28 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
+import queue
 from core.scanner import SystemScanner
 from core.exporter import DataExporter
+from core.sampler import MetricsSampler
+from gui.table_view import TableView
+
+# Период, с которым окно забирает события сканирования из очереди, мс
+SCAN_TICK_MS = 50
+
+# Период обновления живых метрик на странице результатов, с
+LIVE_INTERVAL = 1.0
+
+# Диски опрашиваются раз в столько замеров живых метрик: на хостах с
+# тысячами точек монтирования ежесекундный опрос слишком дорог
+LIVE_DISK_EVERY = 10
+
+CATEGORY_TITLES = {
+    'hardware': "Аппаратное обеспечение",
+    'network': "Сетевые настройки",
+    'software': "Программное обеспечение",
+    'processes': "Процессы"
+}
 
 class MainWindow:
     def __init__(self):
@@ -15,6 +35,19 @@ class MainWindow:
         self.hardware_var = tk.BooleanVar(value=True)
         self.software_var = tk.BooleanVar(value=True)
         self.network_var = tk.BooleanVar(value=True)
+        self.processes_var = tk.BooleanVar(value=True)
+        # Ограничение времени сканирования, с; пустое значение или 0 - без ограничения
+        self.timeout_var = tk.StringVar(value="60")
+        
+        self.scan_data = None
+        self.scan_cancel = None
+        self.scan_id = 0
+        
+        # Живое обновление страницы результатов: замеры идут в фоновом
+        # потоке, окно раз в такт применяет последний из них
+        self.live_sampler = None
+        self.live_id = 0
+        self.live_panel = None
         
         self.setup_styles()
         self.setup_ui()
@@ -23,9 +56,9 @@ class MainWindow:
     def setup_fullscreen(self):
         screen_width = self.root.winfo_screenwidth()
         screen_height = self.root.winfo_screenheight()
-        self.root.minsize(400, 550)
+        self.root.minsize(400, 600)
         window_width = 450
-        window_height = 600
+        window_height = 660
         x = (screen_width - window_width) // 2
         y = (screen_height - window_height) // 2
         self.root.geometry(f"{window_width}x{window_height}+{x}+{y}")
@@ -46,7 +79,8 @@ class MainWindow:
             'border': '#374151',
             'tab_bg': '#2C2C2E',
             'tab_active': '#1791cf',
-            'success': '#34C759'
+            'success': '#34C759',
+            'warning': '#FF9F0A'
         }
         self.root.configure(bg=self.colors['background'])
     
@@ -57,6 +91,7 @@ class MainWindow:
         self.main_container.grid_columnconfigure(0, weight=1)
     
     def clear_container(self):
+        self.stop_live()
         for widget in self.main_container.winfo_children():
             widget.destroy()
     
@@ -96,6 +131,24 @@ class MainWindow:
         self.create_checkbox(checkboxes_frame, "Аппаратное обеспечение", self.hardware_var)
         self.create_checkbox(checkboxes_frame, "Программное обеспечение", self.software_var)
         self.create_checkbox(checkboxes_frame, "Сетевые настройки", self.network_var)
+        self.create_checkbox(checkboxes_frame, "Процессы", self.processes_var)
+        
+        timeout_frame = tk.Frame(content_frame, bg=self.colors['card'])
+        timeout_frame.pack(fill='x', pady=(12, 0))
+        
+        timeout_label = tk.Label(timeout_frame, text="Таймаут сканирования, с",
+                                font=('Inter', 12),
+                                bg=self.colors['card'], fg=self.colors['secondary_text'])
+        timeout_label.pack(side='left')
+        
+        timeout_entry = tk.Entry(timeout_frame, textvariable=self.timeout_var, width=6,
+                                font=('Inter', 12), justify='center',
+                                bg=self.colors['button_bg'], fg=self.colors['text'],
+                                insertbackground=self.colors['text'],
+                                relief='flat', highlightthickness=1,
+                                highlightbackground=self.colors['border'],
+                                highlightcolor=self.colors['primary'])
+        timeout_entry.pack(side='right', ipady=4)
         
         footer_frame = tk.Frame(main_card, bg=self.colors['card'])
         footer_frame.pack(fill='x', pady=(24, 0))
@@ -151,16 +204,26 @@ class MainWindow:
         categories = {
             'hardware': self.hardware_var.get(),
             'software': self.software_var.get(),
-            'network': self.network_var.get()
+            'network': self.network_var.get(),
+            'processes': self.processes_var.get()
         }
         
         if not any(categories.values()):
             messagebox.showerror("Ошибка", "Выберите хотя бы одну категорию для сканирования")
             return
         
-        self.show_scan_page(categories)
+        timeout_text = self.timeout_var.get().strip().replace(',', '.')
+        try:
+            timeout = float(timeout_text) if timeout_text else 0
+        except ValueError:
+            timeout = -1
+        if timeout < 0:
+            messagebox.showerror("Ошибка", "Таймаут должен быть неотрицательным числом секунд")
+            return
+        
+        self.show_scan_page(categories, timeout or None)
     
-    def show_scan_page(self, categories):
+    def show_scan_page(self, categories, timeout=None):
         self.clear_container()
         
         main_frame = tk.Frame(self.main_container, bg=self.colors['background'], padx=20, pady=20)
@@ -172,7 +235,7 @@ class MainWindow:
         back_button = tk.Button(header_frame, text="←", font=('Inter', 16),
                                bg=self.colors['background'], fg=self.colors['text'],
                                relief='flat', border=0, cursor='hand2',
-                               command=self.show_main_page)
+                               command=self.leave_scan_page)
         back_button.pack(side='left')
         
         title_label = tk.Label(header_frame, text="Сканирование системы",
@@ -199,20 +262,24 @@ class MainWindow:
         
         self.category_frames = {}
         
-        if categories.get('hardware', False):
-            self.category_frames['hardware'] = self.create_category_row(
-                self.categories_list, "Аппаратное обеспечение", "waiting"
-            )
-        
-        if categories.get('network', False):
-            self.category_frames['network'] = self.create_category_row(
-                self.categories_list, "Сетевые настройки", "waiting"
-            )
-        
-        if categories.get('software', False):
-            self.category_frames['software'] = self.create_category_row(
-                self.categories_list, "Программное обеспечение", "waiting"
-            )
+        for category, title in CATEGORY_TITLES.items():
+            if categories.get(category, False):
+                self.category_frames[category] = self.create_category_row(
+                    self.categories_list, title, "waiting"
+                )
+        
+        self.cancel_button = tk.Button(
+            main_frame,
+            text="Отменить сканирование",
+            bg=self.colors['button_bg'],
+            fg=self.colors['button_text'],
+            font=('Inter', 12, 'bold'),
+            relief='flat',
+            border=0,
+            cursor='hand2',
+            command=self.cancel_scan
+        )
+        self.cancel_button.pack(fill='x', pady=(20, 0), ipady=8)
         
         self.results_button = tk.Button(
             main_frame, 
@@ -228,7 +295,7 @@ class MainWindow:
         self.results_button.pack(fill='x', pady=(20, 0))
         self.results_button.pack_forget()
         
-        self.start_scanning(categories)
+        self.start_scanning(categories, timeout)
     
     def create_category_row(self, parent, text, status):
         frame = tk.Frame(parent, bg=self.colors['card'], height=56)
@@ -262,73 +329,131 @@ class MainWindow:
         status_config = {
             'waiting': {'text': '⏳', 'fg': '#8E8E93'},
             'scanning': {'text': '🔄', 'fg': self.colors['primary']},
-            'completed': {'text': '✓', 'fg': self.colors['success']}
+            'completed': {'text': '✓', 'fg': self.colors['success']},
+            'timeout': {'text': '⏱', 'fg': self.colors['warning']},
+            'cancelled': {'text': '✕', 'fg': self.colors['secondary_text']}
         }
         
         config = status_config.get(status, status_config['waiting'])
         icon.config(text=config['text'], fg=config['fg'])
     
-    def start_scanning(self, categories):
-        scan_thread = threading.Thread(target=self._perform_scan, args=(categories,))
+    def start_scanning(self, categories, timeout=None):
+        # Номер сканирования отсекает обновления от прерванных ранее сканирований
+        self.scan_id += 1
+        self.scan_cancel = threading.Event()
+        # Рабочий поток не обращается к Tk: события складываются в очередь,
+        # которую окно разбирает раз в SCAN_TICK_MS
+        events = queue.Queue()
+        scan_thread = threading.Thread(target=self._perform_scan,
+                                       args=(categories, timeout, self.scan_cancel, events))
         scan_thread.daemon = True
         scan_thread.start()
+        self.root.after(SCAN_TICK_MS, self._drain_scan_events, self.scan_id, events)
+    
+    def cancel_scan(self):
+        if self.scan_cancel is not None and not self.scan_cancel.is_set():
+            self.scan_cancel.set()
+            self.progress_label.config(text="Отмена сканирования...")
+            self.cancel_button.config(state='disabled')
     
-    def _perform_scan(self, categories):
+    def leave_scan_page(self):
+        # Уход со страницы останавливает сканирование, а не оставляет его в фоне
+        if self.scan_cancel is not None:
+            self.scan_cancel.set()
+        self.scan_id += 1
+        self.show_main_page()
+    
+    def _perform_scan(self, categories, timeout, cancel, events):
         try:
-            total_categories = sum(categories.values())
-            if total_categories == 0:
-                return
+            def on_status(category, status):
+                events.put(('status', category, status))
             
-            progress_per_category = 100 / total_categories
-            current_progress = 0
+            def on_progress(event):
+                events.put(('progress', event))
             
-            scan_data = {'timestamp': '', 'scan_categories': {}}
-            
-            if categories.get('hardware', False):
-                self.root.after(0, self._update_category_status, 'hardware', 'scanning')
-                hardware_data = self.scanner.scan_hardware()
-                scan_data['scan_categories']['hardware'] = hardware_data
-                self.root.after(0, self._update_category_status, 'hardware', 'completed')
-                current_progress += progress_per_category
-                self.root.after(0, self._update_progress_bar, current_progress)
-            
-            if categories.get('network', False):
-                self.root.after(0, self._update_category_status, 'network', 'scanning')
-                network_data = self.scanner.scan_network()
-                scan_data['scan_categories']['network'] = network_data
-                self.root.after(0, self._update_category_status, 'network', 'completed')
-                current_progress += progress_per_category
-                self.root.after(0, self._update_progress_bar, current_progress)
-            
-            if categories.get('software', False):
-                self.root.after(0, self._update_category_status, 'software', 'scanning')
-                software_data = self.scanner.scan_software()
-                scan_data['scan_categories']['software'] = software_data
-                self.root.after(0, self._update_category_status, 'software', 'completed')
-                current_progress += progress_per_category
-                self.root.after(0, self._update_progress_bar, current_progress)
-            
-            self.root.after(0, self._update_progress_bar, 100)
-            self.root.after(0, self.on_scan_complete, scan_data)
+            scan_data = self.scanner.selective_scan(categories, on_status=on_status,
+                                                    timeout=timeout, cancel=cancel,
+                                                    on_progress=on_progress)
+            events.put(('done', scan_data))
             
         except Exception as e:
-            self.root.after(0, self.on_scan_error, str(e))
+            events.put(('error', str(e)))
+    
+    def _drain_scan_events(self, scan_id, events):
+        if scan_id != self.scan_id:
+            return
+        
+        # За один такт применяются все статусы, но только последнее событие
+        # прогресса: тысячи событий по дискам и процессам дают одну перерисовку
+        progress = None
+        while True:
+            try:
+                event = events.get_nowait()
+            except queue.Empty:
+                break
+            
+            kind = event[0]
+            if kind == 'status':
+                self._update_category_status(scan_id, event[1], event[2])
+            elif kind == 'progress':
+                progress = event[1]
+            elif kind == 'done':
+                self._update_progress_bar(scan_id, 100)
+                self.on_scan_complete(scan_id, event[1])
+                return
+            else:
+                self.on_scan_error(scan_id, event[1])
+                return
+        
+        if progress is not None:
+            self._update_progress(scan_id, progress)
+        self.root.after(SCAN_TICK_MS, self._drain_scan_events, scan_id, events)
     
-    def _update_progress_bar(self, value):
+    def _update_progress(self, scan_id, event):
+        self._update_progress_bar(scan_id, event['progress'])
+        if self.scan_cancel is None or self.scan_cancel.is_set():
+            return
+        title = CATEGORY_TITLES.get(event['category'], event['category'])
+        self.progress_label.config(text=f"{title}: {event['done']}/{event['total']}")
+    
+    def _update_progress_bar(self, scan_id, value):
+        if scan_id != self.scan_id:
+            return
         self.progress_bar.place(relx=0, rely=0, relwidth=value/100, relheight=1)
     
-    def _update_category_status(self, category, status):
+    def _update_category_status(self, scan_id, category, status):
+        if scan_id != self.scan_id or self.scan_cancel is None:
+            return
         if category in self.category_frames:
             frame_info = self.category_frames[category]
             self.update_status_icon(frame_info['icon'], status)
     
-    def on_scan_complete(self, scan_data):
+    def on_scan_complete(self, scan_id, scan_data):
+        if scan_id != self.scan_id:
+            return
+        self.scan_cancel = None
+        self.scan_data = scan_data
+        
+        statuses = [info.get('status') for info in scan_data['scan_info'].values()]
+        for category, info in scan_data['scan_info'].items():
+            if category in self.category_frames:
+                self.update_status_icon(self.category_frames[category]['icon'], info.get('status'))
+        
+        if 'cancelled' in statuses or 'timeout' in statuses:
+            # Прерванное сканирование сразу открывает результаты по готовым категориям
+            self.show_results_page(scan_data)
+            return
+        
         self.progress_label.config(text="Сканирование завершено!")
+        self.cancel_button.pack_forget()
         self.results_button.pack(fill='x', pady=(20, 0))
-        self.scan_data = scan_data
     
-    def on_scan_error(self, error_message):
+    def on_scan_error(self, scan_id, error_message):
+        if scan_id != self.scan_id:
+            return
+        self.scan_cancel = None
         self.progress_label.config(text="Ошибка сканирования")
+        self.cancel_button.pack_forget()
         messagebox.showerror("Ошибка", f"Ошибка при сканировании:\n{error_message}")
     
     def show_results_page(self, scan_data):
@@ -351,8 +476,20 @@ class MainWindow:
                               bg=self.colors['background'], fg=self.colors['text'])
         title_label.pack(side='left', padx=10)
         
+        self.live_button = tk.Button(header_frame, text="▶ Обновлять",
+                                     font=('Inter', 12, 'bold'),
+                                     bg=self.colors['button_bg'], fg=self.colors['button_text'],
+                                     relief='flat', border=0, cursor='hand2', padx=12,
+                                     command=self.toggle_live)
+        self.live_button.pack(side='right', ipady=4)
+        self.live_panel = None
+        self.live_frame = main_frame
+        
+        self.create_scan_status_row(main_frame, scan_data)
+        
         tabs_frame = tk.Frame(main_frame, bg=self.colors['tab_bg'], height=40, pady=5)
         tabs_frame.pack(fill='x', pady=(0, 20))
+        self.tabs_frame = tabs_frame
         tabs_frame.pack_propagate(False)
         
         tabs_container = tk.Frame(tabs_frame, bg=self.colors['tab_bg'])
@@ -362,14 +499,172 @@ class MainWindow:
         
         self.content_frame = tk.Frame(main_frame, bg=self.colors['background'])
         self.content_frame.pack(fill='both', expand=True)
+        # Построенные вкладки и данные, по которым они построены
+        self.tab_views = {}
+        self.tab_views_data = scan_data
 
         hardware_tab = self.create_tab(tabs_container, "Аппаратура", "hardware", 0)
         software_tab = self.create_tab(tabs_container, "ПО", "software", 1)
         network_tab = self.create_tab(tabs_container, "Сеть", "network", 2)
-        export_tab = self.create_tab(tabs_container, "Экспорт", "export", 3)
+        processes_tab = self.create_tab(tabs_container, "Процессы", "processes", 3)
+        export_tab = self.create_tab(tabs_container, "Экспорт", "export", 4)
 
         self.show_tab_content("hardware", scan_data)
     
+    def toggle_live(self):
+        if self.live_sampler is None:
+            self.start_live()
+        else:
+            self.stop_live()
+    
+    def start_live(self):
+        # Панель строится один раз; дальше меняются только тексты и ширины полос
+        if self.live_panel is None:
+            self.live_panel = self.create_live_panel(self.live_frame)
+        self.live_panel['frame'].pack(fill='x', pady=(0, 16), before=self.tabs_frame)
+        self.live_button.config(text="⏸ Обновлять")
+        
+        self.live_id += 1
+        self.live_previous = None
+        samples = queue.Queue()
+        # Зависшие точки монтирования сканер не опрашивает повторно, пока
+        # не вернется их прошлый поток опроса
+        self.live_sampler = MetricsSampler(interval=LIVE_INTERVAL, capacity=2,
+                                           scanner=self.scanner, on_sample=samples.put,
+                                           disk_every=LIVE_DISK_EVERY)
+        self.live_sampler.start()
+        self.root.after(int(LIVE_INTERVAL * 1000), self._drain_live_samples, self.live_id, samples)
+    
+    def stop_live(self):
+        if self.live_sampler is None:
+            return
+        # Поток замера не ждем: опрос зависшего диска не должен блокировать окно
+        self.live_sampler.stop(timeout=0)
+        self.live_sampler = None
+        self.live_id += 1
+        self.live_button.config(text="▶ Обновлять")
+    
+    def _drain_live_samples(self, live_id, samples):
+        if live_id != self.live_id:
+            return
+        
+        sample = None
+        while True:
+            try:
+                sample = samples.get_nowait()
+            except queue.Empty:
+                break
+        if sample is not None:
+            self.update_live_panel(sample)
+        self.root.after(int(LIVE_INTERVAL * 1000), self._drain_live_samples, live_id, samples)
+    
+    def create_live_panel(self, parent):
+        frame = tk.Frame(parent, bg=self.colors['card'], padx=16, pady=12)
+        frame.columnconfigure(1, weight=1)
+        frame.columnconfigure(2, weight=2)
+        
+        rows = [
+            ('cpu', "Процессор"),
+            ('memory', "Память"),
+            ('disk', "Диски"),
+            ('network', "Сеть")
+        ]
+        metrics = {}
+        for row, (key, title) in enumerate(rows):
+            title_label = tk.Label(frame, text=title, font=('Inter', 12),
+                                   bg=self.colors['card'], fg=self.colors['secondary_text'])
+            title_label.grid(row=row, column=0, sticky='w', padx=(0, 20), pady=4)
+            
+            value_label = tk.Label(frame, text="…", font=('Inter', 12),
+                                   bg=self.colors['card'], fg=self.colors['text'])
+            value_label.grid(row=row, column=1, sticky='w', pady=4)
+            
+            bar = None
+            if key != 'network':
+                bar_bg = tk.Frame(frame, bg=self.colors['border'], height=8)
+                bar_bg.grid(row=row, column=2, sticky='ew', pady=4)
+                bar = tk.Frame(bar_bg, bg=self.colors['primary'], height=8)
+                bar.place(relx=0, rely=0, relwidth=0.0, relheight=1)
+            
+            # Последние показанные текст и ширина полосы
+            metrics[key] = {'label': value_label, 'bar': bar, 'text': None, 'width': None}
+        
+        return {'frame': frame, 'metrics': metrics}
+    
+    def update_live_panel(self, sample):
+        gib = 1024**3
+        previous, self.live_previous = self.live_previous, sample
+        
+        self.set_live_metric('cpu', f"{sample['cpu_percent']:.0f}%", sample['cpu_percent'] / 100)
+        self.set_live_metric('memory',
+                             f"{sample['memory_percent']:.0f}% "
+                             f"(доступно {sample['memory_available'] / gib:.1f} ГБ)",
+                             sample['memory_percent'] / 100)
+        
+        disk_total = sample['disk_total']
+        disk_text = f"{sample['disk_used'] / gib:.0f} / {disk_total / gib:.0f} ГБ"
+        if sample['disk_timeouts']:
+            disk_text += f", без ответа: {sample['disk_timeouts']:.0f}"
+        self.set_live_metric('disk', disk_text,
+                             sample['disk_used'] / disk_total if disk_total else 0.0)
+        
+        if previous is not None:
+            elapsed = sample['timestamp'] - previous['timestamp']
+            if elapsed > 0:
+                # Сброс счетчиков дает отрицательную разницу - такой интервал считается нулевым
+                received = max(sample['net_bytes_recv'] - previous['net_bytes_recv'], 0) / elapsed
+                sent = max(sample['net_bytes_sent'] - previous['net_bytes_sent'], 0) / elapsed
+                self.set_live_metric('network', f"↓ {received / 1024:.1f} КБ/с  ↑ {sent / 1024:.1f} КБ/с")
+    
+    def set_live_metric(self, key, text, fraction=None):
+        # Виджет обновляется, только если изменилось видимое значение
+        metric = self.live_panel['metrics'][key]
+        if text != metric['text']:
+            metric['text'] = text
+            metric['label'].config(text=text)
+        if fraction is not None and metric['bar'] is not None:
+            width = round(min(max(fraction, 0.0), 1.0), 3)
+            if width != metric['width']:
+                metric['width'] = width
+                metric['bar'].place_configure(relwidth=width)
+    
+    def create_scan_status_row(self, parent, scan_data):
+        # Итог по категориям показывается только для прерванного сканирования
+        statuses = {category: info.get('status')
+                    for category, info in scan_data.get('scan_info', {}).items()}
+        if all(status == 'completed' for status in statuses.values()):
+            return
+        
+        names = {
+            'hardware': "Аппаратура",
+            'software': "ПО",
+            'network': "Сеть",
+            'processes': "Процессы"
+        }
+        labels = {
+            'completed': ("✓", self.colors['success']),
+            'timeout': ("⏱ таймаут", self.colors['warning']),
+            'cancelled': ("✕ отменено", self.colors['secondary_text'])
+        }
+        
+        status_frame = tk.Frame(parent, bg=self.colors['background'])
+        status_frame.pack(fill='x', pady=(0, 12))
+        
+        for category, status in statuses.items():
+            text, color = labels.get(status, ("?", self.colors['secondary_text']))
+            status_label = tk.Label(status_frame, text=f"{names.get(category, category)} {text}",
+                                   font=('Inter', 10, 'bold'),
+                                   bg=self.colors['background'], fg=color)
+            status_label.pack(side='left', padx=(0, 12))
+    
+    def missing_category_text(self, scan_data, category, default):
+        status = scan_data.get('scan_info', {}).get(category, {}).get('status')
+        if status == 'timeout':
+            return "Сканирование категории прервано по таймауту"
+        if status == 'cancelled':
+            return "Сканирование категории отменено"
+        return default
+    
     def create_tab(self, parent, text, value, index):
         tab_frame = tk.Frame(parent, bg=self.colors['tab_bg'], relief='flat', 
                             borderwidth=0, cursor='hand2')
@@ -402,23 +697,43 @@ class MainWindow:
         return tab_frame
     
     def show_tab_content(self, tab, scan_data):
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        if tab == "hardware":
-            self.show_hardware_tab(scan_data)
-        elif tab == "software":
-            self.show_software_tab(scan_data)
-        elif tab == "network":
-            self.show_network_tab(scan_data)
-        elif tab == "export":
-            self.show_export_tab(scan_data)
+        # Вкладка строится один раз и при переключении только скрывается;
+        # пересборка нужна лишь при смене данных сканирования
+        if scan_data is not self.tab_views_data:
+            for view in self.tab_views.values():
+                view.destroy()
+            self.tab_views = {}
+            self.tab_views_data = scan_data
+        
+        for name, view in self.tab_views.items():
+            if name != tab:
+                view.pack_forget()
+        
+        view = self.tab_views.get(tab)
+        if view is None:
+            builders = {
+                "hardware": self.show_hardware_tab,
+                "software": self.show_software_tab,
+                "network": self.show_network_tab,
+                "processes": self.show_processes_tab,
+                "export": self.show_export_tab
+            }
+            if tab not in builders:
+                return
+            view = tk.Frame(self.content_frame, bg=self.colors['background'])
+            builders[tab](view, scan_data)
+            self.tab_views[tab] = view
+        view.pack(fill='both', expand=True)
     
-    def show_hardware_tab(self, scan_data):
-        content = self.create_scrollable_frame(self.content_frame)
+    def show_hardware_tab(self, parent, scan_data):
+        # Список дисков виртуализирован и прокручивается сам, поэтому вкладка
+        # не помещается в прокручиваемый холст
+        content = tk.Frame(parent, bg=self.colors['background'])
+        content.pack(fill='both', expand=True)
         
         if 'hardware' not in scan_data['scan_categories']:
-            no_data_label = tk.Label(content, text="Данные об аппаратном обеспечении не собраны",
+            no_data_label = tk.Label(content, text=self.missing_category_text(
+                                       scan_data, 'hardware', "Данные об аппаратном обеспечении не собраны"),
                                    font=('Inter', 14), bg=self.colors['background'], fg=self.colors['text'])
             no_data_label.pack(pady=20)
             return
@@ -439,6 +754,12 @@ class MainWindow:
             self.create_info_row(system_card, "Ядра", f"{cpu_info.get('physical_cores', '?')} физических, {cpu_info.get('total_cores', '?')} логических")
             if cpu_info.get('frequency'):
                 self.create_info_row(system_card, "Частота", f"{cpu_info['frequency']} ГГц")
+            utilization = cpu_info.get('utilization', {})
+            if utilization.get('mean') is not None:
+                self.create_info_row(system_card, "Загрузка ядер",
+                                     f"среднее {utilization['mean']}%, p95 {utilization['p95']}%, "
+                                     f"макс. {utilization['max']}%, "
+                                     f"насыщено: {utilization['saturated_cores']}")
         
         if 'memory' in hardware_data:
             memory_info = hardware_data['memory']
@@ -446,24 +767,48 @@ class MainWindow:
         
         if 'disks' in hardware_data and hardware_data['disks']:
             disks_card = tk.Frame(content, bg=self.colors['card'], padx=16, pady=16)
-            disks_card.pack(fill='x', pady=(0, 16))
+            disks_card.pack(fill='both', expand=True, pady=(0, 16))
             
             disks_title = tk.Label(disks_card, text="💾 Диски",
                                  font=('Inter', 18, 'bold'),
                                  bg=self.colors['card'], fg=self.colors['text'])
             disks_title.pack(anchor='w', pady=(0, 10))
             
+            # Скорости ввода-вывода появляются со второго сканирования
+            def megabytes(value):
+                return f"{value / 1024**2:.1f}"
+            
+            columns = [
+                {'title': "Устройство", 'width': 3},
+                {'title': "Точка монтирования", 'width': 4},
+                {'title': "Размер, ГБ", 'width': 1},
+                {'title': "Свободно, ГБ", 'width': 1},
+                {'title': "Чтение, МБ/с", 'width': 1, 'format': megabytes},
+                {'title': "Запись, МБ/с", 'width': 1, 'format': megabytes},
+                {'title': "IOPS", 'width': 1},
+                {'title': "Await, мс", 'width': 1},
+                {'title': "Состояние", 'width': 2}
+            ]
+            rows = []
             for disk in hardware_data['disks']:
-                disk_name = disk.get('device', 'Неизвестный диск')
-                total_gb = disk.get('total', 0)
-                free_gb = disk.get('free', 0)
-                self.create_disk_row(disks_card, disk_name, f"{total_gb} ГБ", f"Свободно {free_gb} ГБ")
+                io = disk.get('io', {})
+                iops = None
+                if io.get('read_iops') is not None:
+                    iops = round(io['read_iops'] + io['write_iops'], 1)
+                rows.append((
+                    disk.get('device', 'Неизвестный диск'), disk.get('mountpoint'),
+                    disk.get('total'), disk.get('free'),
+                    io.get('read_bytes_per_s'), io.get('write_bytes_per_s'), iops, io.get('await_ms'),
+                    f"Таймаут {disk.get('elapsed', '?')} с" if disk.get('status') == 'timeout' else "OK"
+                ))
+            TableView(disks_card, columns, rows, self.colors).pack(fill='both', expand=True)
     
-    def show_software_tab(self, scan_data):
-        content = self.create_scrollable_frame(self.content_frame)
+    def show_software_tab(self, parent, scan_data):
+        content = self.create_scrollable_frame(parent)
         
         if 'software' not in scan_data['scan_categories']:
-            no_data_label = tk.Label(content, text="Данные о программном обеспечении не собраны",
+            no_data_label = tk.Label(content, text=self.missing_category_text(
+                                       scan_data, 'software', "Данные о программном обеспечении не собраны"),
                                    font=('Inter', 14), bg=self.colors['background'], fg=self.colors['text'])
             no_data_label.pack(pady=20)
             return
@@ -484,13 +829,30 @@ class MainWindow:
             self.create_info_row(os_card, "Версия", os_info.get('release', 'Неизвестно'))
             self.create_info_row(os_card, "Сборка", os_info.get('version', 'Неизвестно'))
             self.create_info_row(os_card, "Имя хоста", os_info.get('hostname', 'Неизвестно'))
-    
-    def show_network_tab(self, scan_data):
-        content = self.create_scrollable_frame(self.content_frame)
 
+        installed_software = software_data.get('installed_software', [])
+        if installed_software:
+            packages_card = tk.Frame(content, bg=self.colors['card'], padx=16, pady=16)
+            packages_card.pack(fill='x', pady=(0, 16))
+
+            packages_title = tk.Label(packages_card, text="📦 Установленные пакеты",
+                                    font=('Inter', 18, 'bold'),
+                                    bg=self.colors['card'], fg=self.colors['text'])
+            packages_title.pack(anchor='w', pady=(0, 10))
+
+            counts = {}
+            for package in installed_software:
+                counts[package.get('source', '?')] = counts.get(package.get('source', '?'), 0) + 1
+            for source, count in counts.items():
+                self.create_info_row(packages_card, source, f"{count} пакетов")
+    
+    def show_network_tab(self, parent, scan_data):
+        content = tk.Frame(parent, bg=self.colors['background'])
+        content.pack(fill='both', expand=True)
         
         if 'network' not in scan_data['scan_categories']:
-            no_data_label = tk.Label(content, text="Данные о сетевых настройках не собраны",
+            no_data_label = tk.Label(content, text=self.missing_category_text(
+                                       scan_data, 'network', "Данные о сетевых настройках не собраны"),
                                    font=('Inter', 14), bg=self.colors['background'], fg=self.colors['text'])
             no_data_label.pack(pady=20)
             return
@@ -498,7 +860,7 @@ class MainWindow:
         network_data = scan_data['scan_categories']['network']
         
         network_card = tk.Frame(content, bg=self.colors['card'], padx=16, pady=16)
-        network_card.pack(fill='x', pady=(0, 16))
+        network_card.pack(fill='both', expand=True, pady=(0, 16))
         
         network_title = tk.Label(network_card, text="🌐 Сетевые интерфейсы",
                                font=('Inter', 18, 'bold'),
@@ -506,17 +868,66 @@ class MainWindow:
         network_title.pack(anchor='w', pady=(0, 10))
         
         if 'interfaces' in network_data:
+            # Одна строка таблицы на адрес; интерфейс без адресов - одна пустая строка
+            rows = []
             for interface in network_data['interfaces']:
                 interface_name = interface.get('name', 'Неизвестный интерфейс')
-                self.create_info_row(network_card, f"Интерфейс {interface_name}", "")
-                
-                if 'addresses' in interface:
-                    for addr in interface['addresses']:
-                        addr_info = f"{addr.get('family', '')}: {addr.get('address', '')}"
-                        self.create_info_row(network_card, "  Адрес", addr_info, indent=20)
+                io = interface.get('io', {})
+                addresses = interface.get('addresses') or [{}]
+                for addr in addresses:
+                    rows.append((interface_name, addr.get('family'),
+                                 addr.get('address'), addr.get('netmask'),
+                                 io.get('rx_bytes_per_s'), io.get('tx_bytes_per_s')))
+            
+            # Скорости появляются со второго сканирования
+            def rate(value):
+                return f"{value / 1024:.1f}"
+            
+            columns = [
+                {'title': "Интерфейс", 'width': 2},
+                {'title': "Семейство", 'width': 2},
+                {'title': "Адрес", 'width': 3},
+                {'title': "Маска", 'width': 3},
+                {'title': "Прием, КБ/с", 'width': 1, 'format': rate},
+                {'title': "Передача, КБ/с", 'width': 1, 'format': rate}
+            ]
+            TableView(network_card, columns, rows, self.colors).pack(fill='both', expand=True)
+    
+    def show_processes_tab(self, parent, scan_data):
+        content = self.create_scrollable_frame(parent)
+        
+        if 'processes' not in scan_data['scan_categories']:
+            no_data_label = tk.Label(content, text=self.missing_category_text(
+                                       scan_data, 'processes', "Данные о процессах не собраны"),
+                                   font=('Inter', 14), bg=self.colors['background'], fg=self.colors['text'])
+            no_data_label.pack(pady=20)
+            return
+        
+        processes_data = scan_data['scan_categories']['processes']
+        
+        sections = [
+            ("⚙️ Процессы по загрузке CPU", 'top_cpu'),
+            ("🧠 Процессы по памяти", 'top_memory')
+        ]
+        for title, key in sections:
+            card = tk.Frame(content, bg=self.colors['card'], padx=16, pady=16)
+            card.pack(fill='x', pady=(0, 16))
+            
+            card_title = tk.Label(card, text=title,
+                                font=('Inter', 18, 'bold'),
+                                bg=self.colors['card'], fg=self.colors['text'])
+            card_title.pack(anchor='w', pady=(0, 10))
+            
+            if key == 'top_cpu':
+                self.create_info_row(card, "Всего процессов", str(processes_data.get('count', '?')))
+            
+            for process in processes_data.get(key, []):
+                self.create_disk_row(card, f"{process.get('name', '?')} ({process.get('pid', '?')})",
+                                     f"CPU {process.get('cpu_percent', 0)}%",
+                                     f"RSS {process.get('rss_mb', 0)} МБ")
     
-    def show_export_tab(self, scan_data):
-        content = self.create_scrollable_frame(self.content_frame)
+    def show_export_tab(self, parent, scan_data):
+        content = self.create_scrollable_frame(parent)
         
         export_card = tk.Frame(content, bg=self.colors['card'], padx=16, pady=16)
         export_card.pack(fill='x', pady=(0, 16))
@@ -778,7 +1189,10 @@ class MainWindow:
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
 
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # Колесо мыши перехватывается, только пока курсор над холстом:
+        # скрытые вкладки остаются живыми и не должны прокручиваться
+        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", _on_mousewheel))
+        canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
 
         return inner_frame
     
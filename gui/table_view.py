@@ -0,0 +1,218 @@
+import tkinter as tk
+
+# Задержка применения фильтра после ввода, мс
+FILTER_DELAY_MS = 150
+
+
+class TableModel:
+    # Данные таблицы без виджетов: строки - кортежи исходных значений,
+    # колонки - словари {'title', 'width', 'format'}. Представление - номера
+    # строк после фильтра и сортировки; пока они не заданы, это range,
+    # поэтому открытие таблицы не зависит от числа строк
+    def __init__(self, columns, rows):
+        self.columns = columns
+        self.rows = rows
+        self.sort_column = None
+        self.descending = False
+        self.filter_text = ''
+        self._search = None
+        self._view = range(len(rows))
+
+    def __len__(self):
+        return len(self._view)
+
+    def format_cell(self, column, value):
+        if value is None:
+            return ''
+        formatter = self.columns[column].get('format')
+        return formatter(value) if formatter else str(value)
+
+    def window(self, first, count):
+        return [
+            tuple(self.format_cell(column, value) for column, value in enumerate(self.rows[index]))
+            for index in self._view[first:first + count]
+        ]
+
+    def sort(self, column):
+        # Повторный выбор той же колонки меняет направление сортировки
+        if self.sort_column == column:
+            self.descending = not self.descending
+        else:
+            self.sort_column = column
+            self.descending = False
+        self._rebuild()
+
+    def set_filter(self, text):
+        self.filter_text = text.strip().lower()
+        self._rebuild()
+
+    def _rebuild(self):
+        if self.filter_text:
+            if self._search is None:
+                # Строки для поиска строятся один раз, при первом фильтре
+                self._search = [
+                    '\t'.join(self.format_cell(column, value) for column, value in enumerate(row)).lower()
+                    for row in self.rows
+                ]
+            needle = self.filter_text
+            view = [index for index, text in enumerate(self._search) if needle in text]
+        else:
+            view = range(len(self.rows))
+
+        if self.sort_column is not None:
+            column = self.sort_column
+            rows = self.rows
+            # Пустые значения всегда в конце списка
+            present = [index for index in view if rows[index][column] is not None]
+            missing = [index for index in view if rows[index][column] is None]
+            present.sort(key=lambda index: rows[index][column], reverse=self.descending)
+            view = present + missing
+        self._view = view
+
+
+class TableView(tk.Frame):
+    # Виртуализированная таблица: виджеты создаются только для видимых
+    # строк и при прокрутке получают новый текст, поэтому число виджетов
+    # не зависит от числа строк
+    def __init__(self, parent, columns, rows, colors, row_height=28, font=('Inter', 11)):
+        super().__init__(parent, bg=colors['card'])
+        self.model = TableModel(columns, rows)
+        self.colors = colors
+        self.row_height = row_height
+        self.font = font
+        self.first = 0
+        self.visible = 0
+        self.cells = []
+        self._filter_job = None
+
+        filter_frame = tk.Frame(self, bg=colors['card'])
+        filter_frame.pack(fill='x', pady=(0, 8))
+
+        filter_label = tk.Label(filter_frame, text="Фильтр", font=font,
+                                bg=colors['card'], fg=colors['secondary_text'])
+        filter_label.pack(side='left', padx=(0, 10))
+
+        self.filter_var = tk.StringVar()
+        filter_entry = tk.Entry(filter_frame, textvariable=self.filter_var, font=font,
+                                bg=colors['button_bg'], fg=colors['text'],
+                                insertbackground=colors['text'], relief='flat')
+        filter_entry.pack(side='left', fill='x', expand=True, ipady=4)
+        self.filter_var.trace_add('write', self._schedule_filter)
+
+        self.count_label = tk.Label(filter_frame, font=font,
+                                    bg=colors['card'], fg=colors['secondary_text'])
+        self.count_label.pack(side='right', padx=(10, 0))
+
+        self.header = tk.Frame(self, bg=colors['card'])
+        # Отступ справа выравнивает заголовки с колонками над полосой прокрутки
+        self.header.pack(fill='x', padx=(0, 16))
+        self.header_labels = []
+        for column, spec in enumerate(columns):
+            self.header.columnconfigure(column, weight=spec.get('width', 1), uniform='table')
+            label = tk.Label(self.header, text=spec['title'], anchor='w', cursor='hand2',
+                             font=(font[0], font[1], 'bold'),
+                             bg=colors['card'], fg=colors['text'])
+            label.grid(row=0, column=column, sticky='ew', padx=(0, 8))
+            label.bind('<Button-1>', lambda e, column=column: self.sort(column))
+            self.header_labels.append(label)
+
+        table_frame = tk.Frame(self, bg=colors['card'])
+        table_frame.pack(fill='both', expand=True)
+
+        self.scrollbar = tk.Scrollbar(table_frame, orient='vertical', command=self._on_scrollbar)
+        self.scrollbar.pack(side='right', fill='y')
+
+        # Размер тела задается окном, а не содержимым строк
+        self.body = tk.Frame(table_frame, bg=colors['card'])
+        self.body.pack(side='left', fill='both', expand=True)
+        self.body.grid_propagate(False)
+        for column, spec in enumerate(columns):
+            self.body.columnconfigure(column, weight=spec.get('width', 1), uniform='table')
+
+        self.body.bind('<Configure>', self._on_resize)
+        self._bind_wheel(self.body)
+        self.refresh()
+
+    def _bind_wheel(self, widget):
+        widget.bind('<MouseWheel>', self._on_wheel)
+        widget.bind('<Button-4>', self._on_wheel)
+        widget.bind('<Button-5>', self._on_wheel)
+
+    def _on_resize(self, event):
+        visible = max(1, event.height // self.row_height)
+        if visible == self.visible:
+            return
+        self.visible = visible
+
+        # Пул строк только растет: при уменьшении окна лишние строки пустые
+        while len(self.cells) < visible:
+            row = len(self.cells)
+            self.body.rowconfigure(row, minsize=self.row_height)
+            cells = []
+            for column in range(len(self.model.columns)):
+                label = tk.Label(self.body, anchor='w', font=self.font,
+                                 bg=self.colors['card'], fg=self.colors['text'])
+                label.grid(row=row, column=column, sticky='ew', padx=(0, 8))
+                self._bind_wheel(label)
+                cells.append(label)
+            self.cells.append(cells)
+        self.refresh()
+
+    def _on_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.scroll_to(self.first - 3)
+        else:
+            self.scroll_to(self.first + 3)
+        # Прокрутка не доходит до обработчиков bind_all других вкладок
+        return 'break'
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.scroll_to(int(float(amount) * len(self.model)))
+        elif unit == 'pages':
+            self.scroll_to(self.first + int(amount) * max(1, self.visible - 1))
+        else:
+            self.scroll_to(self.first + int(amount))
+
+    def scroll_to(self, first):
+        first = max(0, min(first, len(self.model) - self.visible))
+        if first != self.first:
+            self.first = first
+            self.refresh()
+
+    def sort(self, column):
+        self.model.sort(column)
+        for index, label in enumerate(self.header_labels):
+            title = self.model.columns[index]['title']
+            if index == column:
+                title += ' ▼' if self.model.descending else ' ▲'
+            label.config(text=title)
+        self.first = 0
+        self.refresh()
+
+    def _schedule_filter(self, *args):
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(FILTER_DELAY_MS, self._apply_filter)
+
+    def _apply_filter(self):
+        self._filter_job = None
+        self.model.set_filter(self.filter_var.get())
+        self.first = 0
+        self.refresh()
+
+    def refresh(self):
+        rows = self.model.window(self.first, len(self.cells))
+        for index, cells in enumerate(self.cells):
+            values = rows[index] if index < len(rows) else ()
+            for column, label in enumerate(cells):
+                text = values[column] if values else ''
+                if label.cget('text') != text:
+                    label.config(text=text)
+
+        total = len(self.model)
+        self.count_label.config(text=f"{total} из {len(self.model.rows)}")
+        if total:
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + self.visible) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
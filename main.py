@@ -1,11 +1,91 @@
 import sys
 import os
+import argparse
+from contextlib import redirect_stdout
 
 sys.path.append(os.path.join(os.path.dirname(__file__)))
 
-from gui.main_window import MainWindow
+from core.engine import CATEGORY_PROBES
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='sysinfo-collector',
+                                     description="SysInfo Collector")
+    subparsers = parser.add_subparsers(dest='command')
+
+    subparsers.add_parser('gui', help="графический интерфейс (по умолчанию)")
+
+    scan_parser = subparsers.add_parser('scan', help="сканирование без графического интерфейса")
+    scan_parser.add_argument('-c', '--categories', nargs='+', choices=list(CATEGORY_PROBES),
+                             default=list(CATEGORY_PROBES),
+                             help="категории сканирования (по умолчанию все)")
+    scan_parser.add_argument('-f', '--format', choices=['json', 'xml', 'binary'], default='json',
+                             help="формат экспорта")
+    scan_parser.add_argument('-o', '--output', default='-',
+                             help="файл для сохранения, '-' для stdout (по умолчанию)")
+    scan_parser.add_argument('-z', '--compress', choices=['gzip', 'xz'], default=None,
+                             help="сжатие вывода при записи")
+    scan_parser.add_argument('--level', type=int, default=None,
+                             help="уровень сжатия (gzip 1-9, xz 0-9)")
+    scan_parser.add_argument('--instrument', action='store_true',
+                             help="добавить в результат scan_meta: время и вызовы psutil по пробам")
+    scan_parser.add_argument('--cpu-samples', type=int, default=1,
+                             help="число замеров загрузки ядер в окне (по умолчанию 1)")
+    scan_parser.add_argument('--cpu-interval', type=float, default=0.1,
+                             help="интервал между замерами загрузки ядер и минимальное окно первого замера, с")
+    scan_parser.add_argument('--per-core', action='store_true',
+                             help="добавить в результат загрузку и частоту каждого ядра")
+    scan_parser.add_argument('--history', metavar='DB',
+                             help="дополнительно сохранить снимок в SQLite-историю")
+
+    sample_parser = subparsers.add_parser('sample', help="непрерывный сбор метрик с заданным интервалом")
+    sample_parser.add_argument('-i', '--interval', type=float, default=1.0,
+                               help="интервал между замерами, с")
+    sample_parser.add_argument('--capacity', type=int, default=3600,
+                               help="размер кольцевого буфера замеров")
+    sample_parser.add_argument('-n', '--count', type=int, default=None,
+                               help="число замеров (по умолчанию до прерывания)")
+    sample_parser.add_argument('-o', '--output', default='-',
+                               help="JSON Lines файл для дозаписи, '-' для stdout (по умолчанию)")
+    sample_parser.add_argument('--max-bytes', type=int, default=None,
+                               help="ротация файла при превышении размера, байт")
+    sample_parser.add_argument('--max-age', type=float, default=None,
+                               help="ротация файла по времени, с")
+    sample_parser.add_argument('--flush-every', type=int, default=1,
+                               help="сбрасывать буфер записи каждые N замеров")
+    sample_parser.add_argument('--fsync-every', type=int, default=0,
+                               help="вызывать fsync каждые N замеров (0 - не вызывать)")
+
+    history_parser = subparsers.add_parser('history', help="запрос снимков из SQLite-истории")
+    history_parser.add_argument('database', help="файл истории")
+    history_parser.add_argument('-c', '--categories', nargs='+', choices=list(CATEGORY_PROBES),
+                                help="только указанные категории")
+    history_parser.add_argument('--since', help="начало интервала (ISO 8601)")
+    history_parser.add_argument('--until', help="конец интервала, не включается (ISO 8601)")
+    history_parser.add_argument('-n', '--latest', type=int, default=None,
+                                help="последние N снимков (по умолчанию 1, если интервал не задан)")
+
+    diff_parser = subparsers.add_parser('diff', help="изменения между двумя снимками в JSON")
+    diff_parser.add_argument('old', help="исходный снимок")
+    diff_parser.add_argument('new', help="новый снимок")
+
+    aggregate_parser = subparsers.add_parser('aggregate', help="сводный отчет по снимкам парка хостов")
+    aggregate_parser.add_argument('paths', nargs='+',
+                                  help="файлы снимков или каталоги с ними (JSON/XML/бинарные, .gz/.xz)")
+    aggregate_parser.add_argument('-p', '--processes', type=int, default=None,
+                                  help="число процессов разбора (по умолчанию по числу ядер)")
+    aggregate_parser.add_argument('--memory-threshold', type=float, default=90.0,
+                                  help="порог загрузки памяти, %% (по умолчанию 90)")
+    aggregate_parser.add_argument('--disk-threshold', type=float, default=90.0,
+                                  help="порог заполнения диска, %% (по умолчанию 90)")
+    aggregate_parser.add_argument('-o', '--output', default='-',
+                                  help="файл для отчета в JSON, '-' для stdout (по умолчанию)")
+
+    return parser
+
+def run_gui():
+    # tkinter загружается только при запуске графического интерфейса
+    from gui.main_window import MainWindow
 
-def main():
     try:
         print("Запуск SysInfo Collector...")
         app = MainWindow()
@@ -13,9 +93,163 @@ def main():
     except Exception as e:
         print(f"Ошибка запуска: {e}")
         return 1
-    
+
     print("Работа приложения завершена")
     return 0
 
+def run_scan(args):
+    from core.scanner import SystemScanner
+    from core.exporter import DataExporter
+
+    categories = {name: name in args.categories for name in CATEGORY_PROBES}
+
+    # Служебные сообщения сканера не должны попадать в stdout вместе с данными
+    with redirect_stdout(sys.stderr):
+        scanner = SystemScanner(cpu_samples=args.cpu_samples, cpu_interval=args.cpu_interval,
+                                cpu_per_core=args.per_core)
+        scan_data = scanner.selective_scan(categories, instrument=args.instrument)
+
+    if args.history:
+        from core.history import HistoryStore
+        with HistoryStore(args.history) as store:
+            store.save(scan_data)
+
+    if args.output == '-' and args.compress:
+        from core.exporter import open_output
+        text = args.format == 'json'
+        with open_output(sys.stdout.buffer, args.compress, args.level, text=text) as stream:
+            if text:
+                DataExporter.write_json(scan_data, stream)
+            elif args.format == 'binary':
+                DataExporter.write_binary(scan_data, stream)
+            else:
+                DataExporter.write_xml(scan_data, stream)
+        sys.stdout.flush()
+        return 0
+
+    if args.output == '-':
+        if args.format == 'json':
+            DataExporter.write_json(scan_data, sys.stdout)
+            sys.stdout.write('\n')
+        elif args.format == 'binary':
+            DataExporter.write_binary(scan_data, sys.stdout.buffer)
+        else:
+            DataExporter.write_xml(scan_data, sys.stdout.buffer)
+            sys.stdout.buffer.write(b'\n')
+        sys.stdout.flush()
+        return 0
+
+    if args.format == 'json':
+        result = DataExporter.export_json(scan_data, args.output, args.compress, args.level)
+    elif args.format == 'binary':
+        result = DataExporter.export_binary(scan_data, args.output, args.compress, args.level)
+    else:
+        result = DataExporter.export_xml(scan_data, args.output, args.compress, args.level)
+
+    if not result['success']:
+        print(f"Ошибка при экспорте: {result['error']}", file=sys.stderr)
+        return 1
+
+    print(f"Данные экспортированы в {result['filename']}", file=sys.stderr)
+    return 0
+
+def run_sample(args):
+    import json
+    from core.sampler import MetricsSampler
+    from core.exporter import JsonLinesWriter
+
+    writer = None
+    if args.output != '-':
+        writer = JsonLinesWriter(args.output, max_bytes=args.max_bytes, max_age=args.max_age,
+                                 flush_every=args.flush_every, fsync_every=args.fsync_every)
+
+    reported = [0]
+
+    def on_sample(sample):
+        if sample['missed_ticks'] > reported[0]:
+            print(f"Пропущено тактов: {int(sample['missed_ticks'] - reported[0])}", file=sys.stderr)
+            reported[0] = sample['missed_ticks']
+        if writer:
+            writer.write(sample)
+        else:
+            sys.stdout.write(json.dumps(sample, separators=(',', ':')) + '\n')
+            sys.stdout.flush()
+
+    sampler = MetricsSampler(interval=args.interval, capacity=args.capacity, on_sample=on_sample)
+    try:
+        sampler.run(count=args.count)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if writer:
+            writer.close()
+    return 0
+
+def run_history(args):
+    import json
+    from core.history import HistoryStore
+
+    with HistoryStore(args.database) as store:
+        if args.since or args.until:
+            snapshots = store.query_range(args.since, args.until, categories=args.categories)
+            if args.latest is not None:
+                snapshots = snapshots[-args.latest:]
+        else:
+            snapshots = store.latest(args.latest or 1, categories=args.categories)
+
+    json.dump(snapshots, sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write('\n')
+    return 0
+
+def run_diff(args):
+    import json
+    from core.diff import diff_scans
+    from core.exporter import DataExporter
+
+    # Снимки могут быть в JSON или XML, в том числе сжатые
+    old = DataExporter.read(args.old)
+    new = DataExporter.read(args.new)
+
+    for change in diff_scans(old, new):
+        sys.stdout.write(json.dumps(change, ensure_ascii=False, separators=(',', ':')) + '\n')
+    return 0
+
+def run_aggregate(args):
+    import json
+    from core.fleet import aggregate
+
+    report = aggregate(args.paths, processes=args.processes,
+                       memory_threshold=args.memory_threshold, disk_threshold=args.disk_threshold)
+
+    if args.output == '-':
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write('\n')
+        return 0
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"Отчет сохранен в {args.output}", file=sys.stderr)
+    return 0
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.command == 'scan':
+        return run_scan(args)
+
+    if args.command == 'sample':
+        return run_sample(args)
+
+    if args.command == 'history':
+        return run_history(args)
+
+    if args.command == 'diff':
+        return run_diff(args)
+
+    if args.command == 'aggregate':
+        return run_aggregate(args)
+
+    return run_gui()
+
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,48 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+SMALL_HOST = ['--mounts', '20', '--interfaces', '30', '--processes', '200',
+              '--packages', '10', '--repeat', '1']
+
+
+def run_bench(*args):
+    return subprocess.run([sys.executable, os.path.join(ROOT, 'benchmarks', 'bench_scanner.py'),
+                           *SMALL_HOST, *args],
+                          cwd=ROOT, capture_output=True, text=True, timeout=120)
+
+
+class TestScannerBenchmark:
+    """Дымовые тесты бенчмарка сканера на синтетическом хосте."""
+
+    def test_report_structure(self, tmp_path):
+        """Тест: отчет в JSON содержит метрики всех категорий и форматов."""
+        output = tmp_path / 'report.json'
+
+        proc = run_bench('--output', str(output))
+
+        assert proc.returncode == 0, proc.stderr
+        report = json.loads(output.read_text())
+        assert report == json.loads(proc.stdout)
+        assert set(report['scan']) == {'hardware', 'software', 'network', 'processes',
+                                       'full_scan', 'full_scan_instrumented'}
+        assert set(report['export']) == {'json', 'xml', 'binary'}
+        assert report['scan']['hardware']['psutil_calls']['disk_usage'] == 20
+        assert report['scan']['full_scan']['latency_ms'] > 0
+        # Временные кортежи всех 200 процессов видны в числе выделений,
+        # хотя после прогона от них ничего не остается
+        assert report['scan']['processes']['allocated_objects'] >= 200
+        assert 'retained_blocks' in report['scan']['processes']
+        assert report['export']['json']['output_kb'] > 0
+
+    def test_baseline_for_different_host_rejected(self, tmp_path):
+        """Негативный тест: базовый отчет другого размера хоста не сравнивается."""
+        baseline = tmp_path / 'baseline.json'
+        baseline.write_text(json.dumps({'host': {'mounts': 1}, 'scan': {}, 'export': {}}))
+
+        proc = run_bench('--baseline', str(baseline))
+
+        assert proc.returncode == 2
@@ -0,0 +1,151 @@
+import pytest
+import io
+import sys
+
+
+@pytest.fixture
+def real_scan():
+    """Фикстура с результатом реального сканирования всех категорий."""
+    from core.scanner import SystemScanner
+    return SystemScanner().selective_scan(
+        {'hardware': True, 'software': True, 'network': True, 'processes': True}
+    )
+
+
+class TestBinaryFormat:
+    """Тесты компактного бинарного формата снимков."""
+
+    @pytest.mark.parametrize("value", [
+        None, True, False, 0, -1, 127, 128, -129, 2**70, -2**70, 0.1, -0.0, float('inf'),
+        '', 'ascii', 'Юникод & <спец>', 'x' * 100, '\udc80',
+        [], {}, [[]], [{}], [1.5, 2.5, -3.0], [1.5, 2, None], (1, 'a'),
+    ])
+    def test_scalar_and_container_roundtrip(self, value):
+        """Тест точного восстановления значений всех поддерживаемых типов."""
+        from core import binary_format
+
+        decoded = binary_format.loads(binary_format.dumps(value))
+
+        expected = list(value) if isinstance(value, tuple) else value
+        assert decoded == expected
+        assert type(decoded) is type(expected)
+
+    def test_sample_data_roundtrip(self, sample_scan_data):
+        """Тест восстановления типового снимка."""
+        from core import binary_format
+
+        assert binary_format.loads(binary_format.dumps(sample_scan_data)) == sample_scan_data
+
+    def test_real_scan_roundtrip(self, real_scan):
+        """Интеграционный тест: результат selective_scan восстанавливается точно."""
+        from core import binary_format
+
+        decoded = binary_format.loads(binary_format.dumps(real_scan))
+
+        assert decoded == real_scan
+        assert list(decoded['scan_categories']) == list(real_scan['scan_categories'])
+
+    def test_key_order_and_types_preserved(self):
+        """Тест сохранения порядка ключей и типов листьев."""
+        from core import binary_format
+        data = {'disks': [{'device': 'a', 'total': 1.0, 'ok': True},
+                          {'device': 'b', 'total': 2.0, 'ok': False},
+                          {'total': 3.0, 'device': 'c', 'ok': None}]}
+
+        decoded = binary_format.loads(binary_format.dumps(data))
+
+        assert [list(disk) for disk in decoded['disks']] == [list(disk) for disk in data['disks']]
+        assert decoded == data
+
+    def test_repeated_records_are_compact(self):
+        """Тест: повторяющиеся ключи и строки не дублируются в выводе."""
+        from core import binary_format
+        records = [{'family': 'AddressFamily.AF_INET', 'address': str(i)} for i in range(100)]
+
+        encoded = binary_format.dumps(records)
+
+        assert encoded.count(b'AddressFamily.AF_INET') == 1
+        assert encoded.count(b'family') == 1
+
+    def test_deep_nesting_beyond_recursion_limit(self):
+        """Тест вложенности глубже лимита рекурсии."""
+        from core import binary_format
+        depth = sys.getrecursionlimit() + 100
+        node = 'leaf'
+        for _ in range(depth):
+            node = {'level': [node]}
+
+        decoded = binary_format.loads(binary_format.dumps(node))
+
+        for _ in range(depth):
+            decoded = decoded['level'][0]
+        assert decoded == 'leaf'
+
+    def test_stream_dump_and_load(self, sample_scan_data):
+        """Тест записи и чтения через поток."""
+        from core import binary_format
+        buffer = io.BytesIO()
+
+        binary_format.dump(sample_scan_data, buffer)
+        buffer.seek(0)
+
+        assert binary_format.load(buffer) == sample_scan_data
+
+    def test_unsupported_type(self):
+        """Негативный тест: неподдерживаемый тип значения."""
+        from core import binary_format
+
+        with pytest.raises(TypeError):
+            binary_format.dumps({'value': object()})
+
+    def test_non_string_key(self):
+        """Негативный тест: нестроковый ключ словаря."""
+        from core import binary_format
+
+        with pytest.raises(TypeError):
+            binary_format.dumps({1: 'value'})
+
+    @pytest.mark.parametrize("mutate", [
+        lambda data: b'JSON' + data[4:],
+        lambda data: data[:4] + b'\x63' + data[5:],
+        lambda data: data[:-1],
+        lambda data: data[:len(data) // 2],
+        lambda data: data + b'\x00',
+    ])
+    def test_corrupted_data(self, sample_scan_data, mutate):
+        """Негативный тест: поврежденные данные отклоняются с ValueError."""
+        from core import binary_format
+        encoded = binary_format.dumps(sample_scan_data)
+
+        with pytest.raises(ValueError):
+            binary_format.loads(mutate(encoded))
+
+
+class TestBinaryExport:
+    """Тесты бинарного экспорта через DataExporter."""
+
+    @pytest.mark.parametrize("compression", [None, 'gzip', 'xz'])
+    def test_export_and_read(self, exporter_instance, sample_scan_data, tmp_path, compression):
+        """Тест экспорта в файл и чтения с определением формата."""
+        result = exporter_instance.export_binary(sample_scan_data, str(tmp_path / 'scan.sicb'),
+                                                 compression=compression)
+
+        assert result['success'] is True
+        assert exporter_instance.read(result['filename']) == sample_scan_data
+
+    def test_automatic_filename(self, exporter_instance, sample_scan_data, tmp_path, monkeypatch):
+        """Тест автоматического имени файла."""
+        monkeypatch.chdir(tmp_path)
+
+        result = exporter_instance.export_binary(sample_scan_data)
+
+        assert result['success'] is True
+        assert result['filename'].startswith('system_info_')
+        assert result['filename'].endswith('.sicb')
+
+    def test_failed_export_leaves_no_file(self, exporter_instance, tmp_path):
+        """Негативный тест: при ошибке кодирования файл не остается на диске."""
+        result = exporter_instance.export_binary({'bad': {1: 'ключ'}}, str(tmp_path / 'bad.sicb'))
+
+        assert result['success'] is False
+        assert not any(tmp_path.iterdir())
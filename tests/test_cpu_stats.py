@@ -0,0 +1,68 @@
+import pytest
+from collections import namedtuple
+
+scputimes = namedtuple('scputimes', ['user', 'system', 'idle', 'iowait', 'guest'])
+
+
+@pytest.fixture(params=['array', 'numpy'])
+def cpu_stats(request, monkeypatch):
+    """Модуль cpu_stats с NumPy и без него."""
+    from core import cpu_stats
+    module = pytest.importorskip('numpy') if request.param == 'numpy' else None
+    monkeypatch.setattr(cpu_stats, 'numpy', module)
+    monkeypatch.setattr(cpu_stats, '_numpy_loaded', True)
+    return cpu_stats
+
+
+class TestCpuStats:
+    """Тесты сводок загрузки ядер."""
+    
+    def test_core_means_over_window(self, cpu_stats):
+        """Тест средней загрузки каждого ядра за окно замеров."""
+        samples = [[10.0, 100.0, 0.0], [30.0, 80.0, 0.0], [20.0, 90.0, 3.0]]
+        
+        assert cpu_stats.to_list(cpu_stats.core_means(samples)) == [20.0, 90.0, 1.0]
+        assert cpu_stats.to_list(cpu_stats.core_means(samples[:1])) == [10.0, 100.0, 0.0]
+    
+    def test_busy_percent_between_readings(self, cpu_stats):
+        """Тест загрузки ядер по разности cpu_times: iowait - простой, guest уже в user."""
+        previous = [scputimes(10, 10, 50, 0, 0), scputimes(0, 0, 0, 0, 0), scputimes(5, 0, 5, 0, 0)]
+        current = [scputimes(40, 20, 80, 10, 20), scputimes(0, 0, 0, 0, 0), scputimes(4, 0, 15, 0, 0)]
+        
+        # Ядро 0: занято 40 из 80; ядро 1 простаивает без единого тика;
+        # у ядра 2 счетчик user сбросился и считается нулевым
+        assert cpu_stats.to_list(cpu_stats.busy_percent(previous, current)) == [50.0, 0.0, 0.0]
+    
+    def test_busy_percent_when_core_count_changes(self, cpu_stats):
+        """Негативный тест: при изменении числа ядер загрузка за интервал нулевая."""
+        current = [scputimes(10, 0, 10, 0, 0)] * 2
+        
+        assert cpu_stats.to_list(cpu_stats.busy_percent(current[:1], current)) == [0.0, 0.0]
+    
+    def test_summary(self, cpu_stats):
+        """Тест min, max, mean, p95 и числа насыщенных ядер."""
+        values = [float(value) for value in range(0, 101, 5)]
+        
+        assert cpu_stats.summarize(values) == {
+            'min': 0.0, 'max': 100.0, 'mean': 50.0, 'p95': 95.0, 'saturated_cores': 3
+        }
+    
+    def test_p95_interpolates_between_ranks(self, cpu_stats):
+        """Тест линейной интерполяции p95 между соседними значениями."""
+        summary = cpu_stats.summarize([10.0, 20.0, 30.0, 40.0], saturation=40.0)
+        
+        assert summary['p95'] == 38.5
+        assert summary['saturated_cores'] == 1
+    
+    def test_without_saturation_threshold(self, cpu_stats):
+        """Тест сводки без порога насыщения (частоты ядер)."""
+        summary = cpu_stats.summarize([2000.0, 3000.0], saturation=None)
+        
+        assert 'saturated_cores' not in summary
+        assert summary['mean'] == 2500.0
+    
+    def test_empty_values(self, cpu_stats):
+        """Негативный тест: пустой набор ядер дает пустую сводку."""
+        assert cpu_stats.summarize([]) == {
+            'min': None, 'max': None, 'mean': None, 'p95': None, 'saturated_cores': 0
+        }
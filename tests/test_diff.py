@@ -0,0 +1,109 @@
+import pytest
+import copy
+
+
+@pytest.fixture
+def scan_pair(sample_scan_data):
+    """Фикстура с парой снимков: исходный и его глубокая копия."""
+    old = copy.deepcopy(sample_scan_data)
+    old['scan_categories']['hardware']['disks'] = [
+        {'device': '/dev/sda1', 'free': 10.0},
+        {'device': '/dev/sdb1', 'free': 20.0},
+    ]
+    old['scan_categories']['network']['interfaces'] = [
+        {'name': 'lo', 'addresses': [{'family': 'AF_INET', 'address': '127.0.0.1', 'netmask': '255.0.0.0'}]},
+        {'name': 'eth0', 'addresses': [{'family': 'AF_INET', 'address': '10.0.0.2', 'netmask': '255.255.255.0'}]},
+    ]
+    return old, copy.deepcopy(old)
+
+
+class TestDiffScans:
+    """Тесты структурного сравнения снимков."""
+
+    def test_identical_snapshots(self, scan_pair):
+        """Тест: одинаковые снимки не дают изменений."""
+        from core.diff import diff_scans
+        old, new = scan_pair
+
+        assert diff_scans(old, new) == []
+
+    def test_scalar_change(self, scan_pair):
+        """Тест изменения скалярного значения."""
+        from core.diff import diff_scans
+        old, new = scan_pair
+        new['scan_categories']['hardware']['memory']['used'] = 12
+
+        assert diff_scans(old, new) == [
+            {'op': 'change', 'path': 'hardware/memory/used', 'old': 8, 'new': 12}
+        ]
+
+    def test_list_items_matched_by_natural_key(self, scan_pair):
+        """Тест сопоставления дисков и интерфейсов по естественным ключам, а не позиции."""
+        from core.diff import diff_scans
+        old, new = scan_pair
+        disks = new['scan_categories']['hardware']['disks']
+        disks.reverse()
+        disks[0]['free'] = 5.0
+        interfaces = new['scan_categories']['network']['interfaces']
+        interfaces.insert(0, {'name': 'veth1', 'addresses': []})
+        interfaces[2]['addresses'][0]['netmask'] = '255.255.0.0'
+
+        changes = diff_scans(old, new)
+
+        assert changes == [
+            {'op': 'change', 'path': 'hardware/disks[/dev/sdb1]/free', 'old': 20.0, 'new': 5.0},
+            {'op': 'change', 'path': 'network/interfaces[eth0]/addresses[AF_INET:10.0.0.2]/netmask',
+             'old': '255.255.255.0', 'new': '255.255.0.0'},
+            {'op': 'add', 'path': 'network/interfaces[veth1]', 'new': {'name': 'veth1', 'addresses': []}},
+        ]
+
+    def test_added_and_removed(self, scan_pair):
+        """Тест добавления и удаления категорий, полей и элементов списков."""
+        from core.diff import diff_scans
+        old, new = scan_pair
+        del new['scan_categories']['software']
+        new['scan_categories']['processes'] = {'count': 1}
+        new['scan_categories']['hardware']['disks'].pop()
+        del new['scan_categories']['hardware']['cpu']['cores']
+
+        changes = diff_scans(old, new)
+        summary = [(change['op'], change['path']) for change in changes]
+
+        assert summary == [
+            ('remove', 'hardware/cpu/cores'),
+            ('remove', 'hardware/disks[/dev/sdb1]'),
+            ('remove', 'software'),
+            ('add', 'processes'),
+        ]
+
+    def test_duplicate_keys_and_unkeyed_lists(self):
+        """Тест повторяющихся ключей и списков без естественного ключа."""
+        from core.diff import diff_scans
+        old = {'scan_categories': {'hardware': {
+            'disks': [{'device': '/dev/sda1', 'mountpoint': '/'},
+                      {'device': '/dev/sda1', 'mountpoint': '/srv'}],
+            'values': [1, 2, 3]
+        }}}
+        new = copy.deepcopy(old)
+        new['scan_categories']['hardware']['disks'][1]['mountpoint'] = '/var'
+        new['scan_categories']['hardware']['values'] = [1, 5]
+
+        changes = diff_scans(old, new)
+
+        assert changes == [
+            {'op': 'change', 'path': 'hardware/disks[/dev/sda1#2]/mountpoint', 'old': '/srv', 'new': '/var'},
+            {'op': 'change', 'path': 'hardware/values[1]', 'old': 2, 'new': 5},
+            {'op': 'remove', 'path': 'hardware/values[2]', 'old': 3},
+        ]
+
+    def test_type_change(self, scan_pair):
+        """Негативный тест: смена типа значения фиксируется как изменение."""
+        from core.diff import diff_scans
+        old, new = scan_pair
+        new['scan_categories']['network']['interfaces'] = None
+
+        changes = diff_scans(old, new)
+
+        assert len(changes) == 1
+        assert changes[0]['op'] == 'change'
+        assert changes[0]['path'] == 'network/interfaces'
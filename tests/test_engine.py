@@ -0,0 +1,328 @@
+import pytest
+import os
+import subprocess
+import sys
+import time
+import threading
+from unittest.mock import patch
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Сканирование с пробой сети, которая никогда не возвращается и не проверяет отмену
+HUNG_SCAN = (
+    "import asyncio, threading\n"
+    "from unittest.mock import patch\n"
+    "from core.scanner import SystemScanner\n"
+    "scanner = SystemScanner()\n"
+    "patch.object(scanner, 'scan_network', side_effect=lambda: threading.Event().wait()).start()\n"
+)
+
+
+def run_hung_scan(code):
+    # Процесс должен завершиться сам, несмотря на брошенный поток пробы
+    return subprocess.run([sys.executable, '-c', HUNG_SCAN + code], cwd=ROOT,
+                          capture_output=True, text=True, timeout=20)
+
+
+class TestScanEngine:
+    """Тесты для движка параллельного сканирования."""
+
+    def test_categories_run_concurrently(self, scanner_instance):
+        """Тест параллельного выполнения категорий."""
+        def slow_probe():
+            time.sleep(0.2)
+            return {'ok': True}
+
+        categories = {'hardware': True, 'software': True, 'network': True}
+
+        with patch.object(scanner_instance, 'scan_hardware', side_effect=slow_probe), \
+             patch.object(scanner_instance, 'scan_software', side_effect=slow_probe), \
+             patch.object(scanner_instance, 'scan_network', side_effect=slow_probe):
+
+            start = time.perf_counter()
+            result = scanner_instance.engine.run(categories)
+            elapsed = time.perf_counter() - start
+
+        # Последовательно было бы ~0.6 с
+        assert elapsed < 0.5
+        assert set(result['scan_categories']) == {'hardware', 'software', 'network'}
+
+    def test_worker_pool_is_bounded(self, scanner_instance):
+        """Тест ограничения числа рабочих потоков."""
+        scanner_instance.engine.max_workers = 1
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def probe():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+            return {}
+
+        categories = {'hardware': True, 'software': True, 'network': True}
+
+        with patch.object(scanner_instance, 'scan_hardware', side_effect=probe), \
+             patch.object(scanner_instance, 'scan_software', side_effect=probe), \
+             patch.object(scanner_instance, 'scan_network', side_effect=probe):
+            scanner_instance.engine.run(categories)
+
+        assert max(peak) == 1
+
+    def test_scan_info_records_timing(self, scanner_instance):
+        """Тест записи времени начала и длительности для каждой категории."""
+        categories = {'hardware': False, 'software': True, 'network': False}
+
+        with patch.object(scanner_instance, 'scan_software', return_value={'os': {}}):
+            result = scanner_instance.selective_scan(categories)
+
+        info = result['scan_info']['software']
+        assert info['status'] == 'completed'
+        assert info['duration'] >= 0
+        assert 'T' in info['started']
+        assert 'hardware' not in result['scan_info']
+
+    def test_status_callback_order(self, scanner_instance):
+        """Тест уведомлений о статусе категорий."""
+        events = []
+        categories = {'hardware': True, 'software': False, 'network': False}
+
+        with patch.object(scanner_instance, 'scan_hardware', return_value={}):
+            scanner_instance.selective_scan(
+                categories, on_status=lambda name, status: events.append((name, status))
+            )
+
+        assert events == [('hardware', 'scanning'), ('hardware', 'completed')]
+
+    def test_probe_error_propagates(self, scanner_instance):
+        """Негативный тест: ошибка категории передается вызывающему коду."""
+        categories = {'hardware': True, 'software': True, 'network': False}
+
+        with patch.object(scanner_instance, 'scan_hardware', side_effect=RuntimeError("сбой")), \
+             patch.object(scanner_instance, 'scan_software', return_value={}):
+            with pytest.raises(RuntimeError, match="сбой"):
+                scanner_instance.selective_scan(categories)
+
+
+class TestAsyncScan:
+    """Тесты асинхронного API сканирования."""
+
+    def test_async_scan_returns_all_categories(self, scanner_instance):
+        """Тест асинхронного сканирования без ограничения по времени."""
+        import asyncio
+        categories = {'hardware': True, 'software': True, 'network': False}
+
+        with patch.object(scanner_instance, 'scan_hardware', return_value={'cpu': {}}), \
+             patch.object(scanner_instance, 'scan_software', return_value={'os': {}}):
+            result = asyncio.run(scanner_instance.scan_async(categories))
+
+        assert result['scan_categories'] == {'hardware': {'cpu': {}}, 'software': {'os': {}}}
+        assert {info['status'] for info in result['scan_info'].values()} == {'completed'}
+
+    def test_event_loop_not_blocked(self, scanner_instance):
+        """Тест: во время сканирования цикл событий продолжает работу."""
+        import asyncio
+        ticks = []
+
+        def slow_probe():
+            time.sleep(0.2)
+            return {}
+
+        async def ticker():
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.02)
+
+        async def scenario():
+            task = asyncio.create_task(ticker())
+            result = await scanner_instance.scan_async({'network': True})
+            task.cancel()
+            return result
+
+        with patch.object(scanner_instance, 'scan_network', side_effect=slow_probe):
+            asyncio.run(scenario())
+
+        assert len(ticks) >= 5
+
+    def test_deadline_returns_partial_results(self, scanner_instance):
+        """Тест: по истечении срока возвращаются готовые категории со статусами."""
+        import asyncio
+
+        def slow_probe():
+            time.sleep(0.5)
+            return {}
+
+        categories = {'hardware': True, 'software': True, 'network': False}
+
+        with patch.object(scanner_instance, 'scan_hardware', side_effect=slow_probe), \
+             patch.object(scanner_instance, 'scan_software', return_value={'os': {}}):
+            start = time.perf_counter()
+            result = asyncio.run(scanner_instance.scan_async(categories, timeout=0.1))
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.4
+        assert result['scan_categories'] == {'software': {'os': {}}}
+        assert result['scan_info']['software']['status'] == 'completed'
+        assert result['scan_info']['hardware'] == {'status': 'timeout'}
+
+    def test_cooperative_stop_releases_threads(self, scanner_instance):
+        """Тест: после отмены задачи рабочие потоки сканирования завершаются."""
+        import asyncio
+        from core.engine import raise_if_cancelled
+        stopped = threading.Event()
+
+        def endless_probe():
+            try:
+                while True:
+                    raise_if_cancelled()
+                    time.sleep(0.01)
+            finally:
+                stopped.set()
+
+        async def scenario():
+            task = asyncio.create_task(scanner_instance.scan_async({'processes': True}))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        before = set(threading.enumerate())
+        with patch.object(scanner_instance, 'scan_processes', side_effect=endless_probe):
+            asyncio.run(scenario())
+
+        assert stopped.wait(1.0)
+        time.sleep(0.05)
+        leaked = [t for t in set(threading.enumerate()) - before if t.name.startswith('scan')]
+        assert leaked == []
+
+    def test_async_hung_probe_does_not_block_exit(self):
+        """Тест: после дедлайна scan_async зависшая проба не мешает завершению интерпретатора."""
+        proc = run_hung_scan(
+            "result = asyncio.run(scanner.scan_async({'network': True}, timeout=0.3))\n"
+            "print(result['scan_info']['network']['status'])\n"
+        )
+
+        assert proc.returncode == 0, proc.stderr
+        assert proc.stdout.splitlines()[-1] == 'timeout'
+
+    def test_async_cancel_with_hung_probe(self):
+        """Тест: отмена задачи с некооперативной пробой не удерживает процесс и поток."""
+        proc = run_hung_scan(
+            "async def scenario():\n"
+            "    task = asyncio.create_task(scanner.scan_async({'network': True}))\n"
+            "    await asyncio.sleep(0.2)\n"
+            "    task.cancel()\n"
+            "    try:\n"
+            "        await task\n"
+            "    except asyncio.CancelledError:\n"
+            "        print('cancelled')\n"
+            "asyncio.run(scenario())\n"
+            "hung = [t for t in threading.enumerate() if t.name.startswith('scan')]\n"
+            "print(len(hung), all(t.daemon for t in hung))\n"
+        )
+
+        assert proc.returncode == 0, proc.stderr
+        assert proc.stdout.splitlines()[-2:] == ['cancelled', '1 True']
+
+    def test_raise_if_cancelled_outside_scan(self):
+        """Тест: вне сканирования проверка отмены ничего не делает."""
+        from core.engine import raise_if_cancelled
+
+        raise_if_cancelled()
+
+    def test_async_probe_error_propagates(self, scanner_instance):
+        """Негативный тест: ошибка категории передается вызывающему коду."""
+        import asyncio
+
+        with patch.object(scanner_instance, 'scan_network', side_effect=RuntimeError("сбой")):
+            with pytest.raises(RuntimeError, match="сбой"):
+                asyncio.run(scanner_instance.scan_async({'network': True}))
+
+
+class TestInterruptibleScan:
+    """Тесты синхронного сканирования с таймаутом и отменой."""
+
+    def test_timeout_returns_partial_results(self, scanner_instance):
+        """Тест: по таймауту возвращаются готовые категории, остальные помечаются."""
+        events = []
+
+        def slow_probe():
+            time.sleep(0.5)
+            return {}
+
+        with patch.object(scanner_instance, 'scan_hardware', side_effect=slow_probe), \
+             patch.object(scanner_instance, 'scan_software', return_value={'os': {}}):
+            start = time.perf_counter()
+            result = scanner_instance.selective_scan(
+                {'hardware': True, 'software': True}, timeout=0.1,
+                on_status=lambda name, status: events.append((name, status))
+            )
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.4
+        assert result['scan_categories'] == {'software': {'os': {}}}
+        assert result['scan_info']['software']['status'] == 'completed'
+        assert result['scan_info']['hardware'] == {'status': 'timeout'}
+        assert ('hardware', 'timeout') in events
+
+    def test_cancel_event_stops_scan(self, scanner_instance):
+        """Тест: установленное событие cancel прерывает сканирование."""
+        from core.engine import raise_if_cancelled
+        cancel = threading.Event()
+        stopped = threading.Event()
+
+        def endless_probe():
+            try:
+                while True:
+                    raise_if_cancelled()
+                    time.sleep(0.01)
+            finally:
+                stopped.set()
+
+        threading.Timer(0.1, cancel.set).start()
+        with patch.object(scanner_instance, 'scan_network', side_effect=endless_probe):
+            result = scanner_instance.selective_scan({'network': True}, cancel=cancel)
+
+        assert result['scan_categories'] == {}
+        assert result['scan_info']['network'] == {'status': 'cancelled'}
+        assert stopped.wait(1.0)
+
+    def test_hung_probe_does_not_block_exit(self):
+        """Тест: после таймаута зависшая проба не мешает завершению интерпретатора."""
+        proc = run_hung_scan(
+            "result = scanner.selective_scan({'network': True}, timeout=0.3)\n"
+            "print(result['scan_info']['network']['status'])\n"
+        )
+
+        assert proc.returncode == 0, proc.stderr
+        assert proc.stdout.splitlines()[-1] == 'timeout'
+
+    def test_hung_probe_does_not_block_exit_after_cancel(self):
+        """Тест: после отмены зависшая проба не мешает завершению интерпретатора."""
+        proc = run_hung_scan(
+            "cancel = threading.Event()\n"
+            "threading.Timer(0.2, cancel.set).start()\n"
+            "result = scanner.selective_scan({'network': True}, cancel=cancel)\n"
+            "print(result['scan_info']['network']['status'])\n"
+        )
+
+        assert proc.returncode == 0, proc.stderr
+        assert proc.stdout.splitlines()[-1] == 'cancelled'
+
+    def test_fast_scan_unaffected_by_timeout(self, scanner_instance):
+        """Тест: успевшее сканирование с таймаутом возвращает все категории."""
+        with patch.object(scanner_instance, 'scan_network', return_value={'interfaces': []}):
+            result = scanner_instance.selective_scan({'network': True}, timeout=5.0,
+                                                     cancel=threading.Event())
+
+        assert result['scan_categories'] == {'network': {'interfaces': []}}
+        assert result['scan_info']['network']['status'] == 'completed'
+
+    def test_error_propagates_with_timeout(self, scanner_instance):
+        """Негативный тест: ошибка пробы не маскируется статусом."""
+        with patch.object(scanner_instance, 'scan_network', side_effect=RuntimeError("сбой")):
+            with pytest.raises(RuntimeError, match="сбой"):
+                scanner_instance.selective_scan({'network': True}, timeout=5.0)
@@ -132,4 +132,217 @@ class TestDataExporter:
         assert parent.find('cpu') is not None
         assert parent.find('cpu/name').text == 'Intel'
         assert len(parent.findall('cpu/cores/item')) == 2
-        assert parent.find('cpu/frequency').text == '3600'
\ No newline at end of file
+        assert parent.find('cpu/frequency').text == '3600'
+
+class TestJsonLinesWriter:
+    """Тесты для дозаписи временных рядов в формате JSON Lines."""
+    
+    def test_appends_compact_records(self, tmp_path):
+        """Тест дозаписи компактных записей по одной на строку."""
+        from core.exporter import JsonLinesWriter
+        path = tmp_path / 'metrics.jsonl'
+        
+        with JsonLinesWriter(str(path)) as writer:
+            writer.write({'cpu': 1.5, 'name': 'узел'})
+            writer.write({'cpu': 2.5, 'name': 'узел'})
+        
+        # Повторное открытие продолжает существующий файл
+        with JsonLinesWriter(str(path)) as writer:
+            writer.write({'cpu': 3.5})
+        
+        lines = path.read_text(encoding='utf-8').splitlines()
+        assert lines[0] == '{"cpu":1.5,"name":"узел"}'
+        assert [json.loads(line)['cpu'] for line in lines] == [1.5, 2.5, 3.5]
+    
+    def test_rotation_by_size(self, tmp_path):
+        """Тест ротации файла при превышении размера."""
+        from core.exporter import JsonLinesWriter
+        path = tmp_path / 'metrics.jsonl'
+        
+        with JsonLinesWriter(str(path), max_bytes=40) as writer:
+            for i in range(5):
+                writer.write({'value': i, 'pad': 'x' * 10})
+        
+        files = sorted(p.name for p in tmp_path.iterdir())
+        assert len(files) == 5
+        assert 'metrics.jsonl' in files
+        assert json.loads(path.read_text())['value'] == 4
+    
+    def test_rotation_by_age(self, tmp_path):
+        """Тест ротации файла по времени."""
+        from core.exporter import JsonLinesWriter
+        path = tmp_path / 'metrics.jsonl'
+        
+        with JsonLinesWriter(str(path), max_age=60) as writer:
+            writer.write({'value': 1})
+            writer._opened_at -= 61
+            writer.write({'value': 2})
+        
+        assert len(list(tmp_path.iterdir())) == 2
+        assert json.loads(path.read_text())['value'] == 2
+    
+    def test_flush_and_fsync_batching(self, tmp_path):
+        """Тест пакетного сброса буфера и fsync."""
+        from core.exporter import JsonLinesWriter
+        path = tmp_path / 'metrics.jsonl'
+        
+        with patch('os.fsync') as mock_fsync:
+            writer = JsonLinesWriter(str(path), flush_every=3, fsync_every=4)
+            for i in range(3):
+                writer.write({'value': i})
+            assert len(path.read_text().splitlines()) == 3
+            assert mock_fsync.call_count == 0
+            
+            writer.write({'value': 3})
+            assert mock_fsync.call_count == 1
+            writer.close()
+        
+        assert len(path.read_text().splitlines()) == 4
+
+
+def _reference_xml(data):
+    """Эталонная сериализация через ElementTree (прежняя реализация export_xml)."""
+    import io
+    from core.exporter import DataExporter
+    
+    root = ET.Element("SystemInfo")
+    timestamp_elem = ET.SubElement(root, "timestamp")
+    timestamp_elem.text = data.get('timestamp', '')
+    categories = ET.SubElement(root, "categories")
+    for category_name, category_data in data.get('scan_categories', {}).items():
+        category_elem = ET.SubElement(categories, category_name)
+        DataExporter._dict_to_xml(category_elem, category_data)
+    
+    buffer = io.BytesIO()
+    ET.ElementTree(root).write(buffer, encoding='utf-8', xml_declaration=True)
+    return buffer.getvalue()
+
+
+class TestStreamingXml:
+    """Тесты потоковой записи XML."""
+    
+    @pytest.mark.parametrize("data", [
+        {'timestamp': '2024-01-01T12:00:00', 'scan_categories': {}},
+        {'scan_categories': {'hardware': {}}},
+        {'timestamp': None, 'scan_categories': {'software': {'installed_software': []}}},
+        {'timestamp': 't', 'scan_categories': {
+            'test': {
+                'name': 'Тест & <спец> "символов" \'в\' данных',
+                'empty': '',
+                'none': None,
+                'flag': True,
+                'nested list': [[1, 2], [], {'a': 1.5}],
+                'surrogate': '\udc80'
+            }
+        }},
+    ])
+    def test_byte_identical_to_elementtree(self, exporter_instance, data):
+        """Тест побайтного совпадения с выводом ElementTree."""
+        import io
+        buffer = io.BytesIO()
+        
+        exporter_instance.write_xml(data, buffer)
+        
+        assert buffer.getvalue() == _reference_xml(data)
+    
+    def test_sample_data_identical(self, exporter_instance, sample_scan_data, tmp_path):
+        """Тест совпадения экспорта в файл с эталоном на типовых данных."""
+        path = tmp_path / 'scan.xml'
+        
+        result = exporter_instance.export_xml(sample_scan_data, str(path))
+        
+        assert result['success'] is True
+        assert path.read_bytes() == _reference_xml(sample_scan_data)
+    
+    def test_deep_nesting_beyond_recursion_limit(self, exporter_instance):
+        """Тест записи вложенности глубже лимита рекурсии."""
+        import io
+        import sys
+        depth = sys.getrecursionlimit() + 100
+        node = 'leaf'
+        for _ in range(depth):
+            node = {'level': node}
+        buffer = io.BytesIO()
+        
+        exporter_instance.write_xml({'timestamp': 't', 'scan_categories': {'deep': node}}, buffer)
+        
+        content = buffer.getvalue()
+        assert content.count(b'<level>') == depth
+        assert content.endswith(b'</deep></categories></SystemInfo>')
+    
+    def test_failed_export_leaves_no_file(self, exporter_instance, tmp_path):
+        """Негативный тест: при ошибке сериализации файл не остается на диске."""
+        path = tmp_path / 'broken.xml'
+        data = {'timestamp': 't', 'scan_categories': {'bad': {1: 'нестроковый ключ'}}}
+        
+        result = exporter_instance.export_xml(data, str(path))
+        
+        assert result['success'] is False
+        assert not path.exists()
+
+
+class TestCompressedExport:
+    """Тесты экспорта со сжатием и чтения снимков."""
+    
+    @pytest.mark.parametrize("compression,magic", [
+        ('gzip', b'\x1f\x8b'),
+        ('xz', b'\xfd7zXZ\x00'),
+    ])
+    def test_json_roundtrip(self, exporter_instance, sample_scan_data, tmp_path, compression, magic):
+        """Тест сжатого JSON-экспорта и обратного чтения."""
+        result = exporter_instance.export_json(sample_scan_data, str(tmp_path / 'scan.json'),
+                                               compression=compression, level=1)
+        
+        assert result['success'] is True
+        assert result['filename'].endswith('.json' + {'gzip': '.gz', 'xz': '.xz'}[compression])
+        with open(result['filename'], 'rb') as f:
+            assert f.read(len(magic)) == magic
+        assert exporter_instance.read(result['filename']) == sample_scan_data
+    
+    def test_compressed_xml_matches_plain(self, exporter_instance, sample_scan_data, tmp_path):
+        """Тест: распакованный XML совпадает с несжатым экспортом."""
+        import gzip
+        plain = exporter_instance.export_xml(sample_scan_data, str(tmp_path / 'scan.xml'))
+        packed = exporter_instance.export_xml(sample_scan_data, str(tmp_path / 'scan.xml.gz'),
+                                              compression='gzip')
+        
+        assert packed['filename'] == str(tmp_path / 'scan.xml.gz')
+        with gzip.open(packed['filename'], 'rb') as f, open(plain['filename'], 'rb') as g:
+            assert f.read() == g.read()
+    
+    def test_read_xml(self, exporter_instance, sample_scan_data, tmp_path):
+        """Тест чтения XML: структура восстанавливается, листья - строки."""
+        result = exporter_instance.export_xml(sample_scan_data, str(tmp_path / 'scan.xml'),
+                                              compression='xz')
+        
+        data = exporter_instance.read(result['filename'])
+        
+        assert data['timestamp'] == sample_scan_data['timestamp']
+        assert data['scan_categories']['hardware']['cpu'] == {'processor': 'Intel', 'cores': '8'}
+        assert data['scan_categories']['network']['interfaces'] == [
+            {'name': 'eth0', 'ip': '192.168.1.1'}
+        ]
+    
+    def test_read_empty_xml(self, exporter_instance, tmp_path):
+        """Тест чтения XML без категорий."""
+        result = exporter_instance.export_xml({'timestamp': 't', 'scan_categories': {}},
+                                              str(tmp_path / 'empty.xml'))
+        
+        assert exporter_instance.read(result['filename']) == {'timestamp': 't', 'scan_categories': {}}
+    
+    def test_unknown_compression(self, exporter_instance, sample_scan_data, tmp_path):
+        """Негативный тест: неизвестный алгоритм сжатия."""
+        result = exporter_instance.export_json(sample_scan_data, str(tmp_path / 'scan.json'),
+                                               compression='zip')
+        
+        assert result['success'] is False
+        assert not any(tmp_path.iterdir())
+    
+    def test_failed_compressed_export_leaves_no_file(self, exporter_instance, tmp_path):
+        """Негативный тест: недописанный сжатый XML удаляется."""
+        data = {'timestamp': 't', 'scan_categories': {'bad': {1: 'нестроковый ключ'}}}
+        
+        result = exporter_instance.export_xml(data, str(tmp_path / 'broken.xml'), compression='gzip')
+        
+        assert result['success'] is False
+        assert not any(tmp_path.iterdir())
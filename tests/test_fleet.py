@@ -0,0 +1,106 @@
+import pytest
+import json
+
+
+def snapshot(hostname, release, memory_percent, disks):
+    """Снимок хоста в формате экспорта."""
+    return {
+        'timestamp': '2024-01-01T12:00:00',
+        'scan_categories': {
+            'hardware': {
+                'memory': {'total': 16.0, 'available': 8.0, 'used_percent': memory_percent},
+                'disks': [
+                    {'device': f'/dev/sd{index}', 'mountpoint': f'/mnt/{index}', 'total': total,
+                     'used': used, 'free': total - used, 'percent': round(used / total * 100, 1),
+                     'status': 'ok'}
+                    for index, (total, used) in enumerate(disks)
+                ]
+            },
+            'software': {
+                'os': {'system': 'Linux', 'release': release, 'version': '#1', 'hostname': hostname}
+            }
+        }
+    }
+
+
+@pytest.fixture
+def fleet_dir(tmp_path):
+    """Каталог со снимками в JSON, XML и сжатом JSON, а также поврежденным файлом."""
+    from core.exporter import DataExporter
+    DataExporter.export_json(snapshot('web-1', '6.1.0', 40.0, [(100.0, 50.0)]),
+                             str(tmp_path / 'system_info_web-1.json'))
+    DataExporter.export_xml(snapshot('web-2', '6.1.0', 95.0, [(100.0, 20.0), (100.0, 40.0)]),
+                            str(tmp_path / 'system_info_web-2.xml'))
+    nested = tmp_path / 'db'
+    nested.mkdir()
+    DataExporter.export_json(snapshot('db-1', '5.15.0', 70.0, [(200.0, 190.0)]),
+                             str(nested / 'system_info_db-1.json'), compression='gzip')
+    (tmp_path / 'broken.json').write_text('{"scan_categories": ', encoding='utf-8')
+    (tmp_path / 'notes.txt').write_text('не снимок', encoding='utf-8')
+    return tmp_path
+
+
+class TestFleetAggregation:
+    """Тесты сводного отчета по снимкам парка."""
+    
+    @pytest.mark.parametrize('processes', [1, 2])
+    def test_report(self, fleet_dir, processes):
+        """Тест распределений, версий ОС и хостов над порогом."""
+        from core.fleet import aggregate
+        report = aggregate([str(fleet_dir)], processes=processes)
+        
+        assert report['hosts'] == 3
+        assert report['os_versions'] == {'Linux 6.1.0': 2, 'Linux 5.15.0': 1}
+        assert report['memory']['count'] == 3
+        assert report['memory']['min'] == 40.0
+        assert report['memory']['max'] == 95.0
+        assert report['memory']['mean'] == 68.33
+        assert report['memory']['histogram']['40-50'] == 1
+        assert report['memory']['histogram']['90-100'] == 1
+        assert report['disk']['histogram']['30-40'] == 1
+        assert report['disk']['histogram']['90-100'] == 1
+        
+        over = {item['host']: item for item in report['over_threshold']}
+        assert set(over) == {'web-2', 'db-1'}
+        assert over['web-2']['memory_percent'] == 95.0
+        assert over['db-1']['disk_max_percent'] == 95.0
+        
+        assert report['error_count'] == 1
+        assert report['errors'][0]['file'].endswith('broken.json')
+    
+    def test_thresholds(self, fleet_dir):
+        """Тест пользовательских порогов."""
+        from core.fleet import aggregate
+        report = aggregate([str(fleet_dir)], processes=1, memory_threshold=99, disk_threshold=50)
+        
+        assert sorted(item['host'] for item in report['over_threshold']) == ['db-1', 'web-1']
+        assert report['thresholds'] == {'memory': 99, 'disk': 50}
+    
+    def test_reducer_keeps_no_per_host_values(self):
+        """Тест: редьюсер хранит только счетчики, а не значения каждого хоста."""
+        from core.fleet import FleetReducer
+        reducer = FleetReducer()
+        for index in range(10000):
+            reducer.add({'file': f'{index}.json', 'host': f'host-{index}', 'os': 'Linux 6.1.0',
+                         'memory_percent': index % 80, 'disk_percent': 10.0,
+                         'disk_max_percent': 10.0})
+        
+        report = reducer.report()
+        assert report['hosts'] == 10000
+        assert sum(report['memory']['histogram'].values()) == 10000
+        assert report['over_threshold'] == []
+        assert len(reducer.memory.bins) == 10
+
+
+class TestAggregateCli:
+    """Тесты команды aggregate."""
+    
+    def test_aggregate_to_file(self, fleet_dir, tmp_path):
+        """Тест сохранения отчета в файл."""
+        import main
+        output = str(tmp_path / 'fleet.json')
+        
+        assert main.main(['aggregate', str(fleet_dir), '-p', '1', '-o', output]) == 0
+        with open(output, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+        assert report['hosts'] == 3
@@ -0,0 +1,108 @@
+import pytest
+from datetime import datetime, timedelta
+
+
+def make_snapshot(minute, categories=('hardware', 'network')):
+    """Снимок с временной меткой 2024-01-01 00:00 + minute минут."""
+    timestamp = (datetime(2024, 1, 1) + timedelta(minutes=minute)).isoformat()
+    return {
+        'timestamp': timestamp,
+        'scan_categories': {
+            category: {'minute': minute, 'name': category} for category in categories
+        },
+        'scan_info': {category: {'status': 'completed'} for category in categories}
+    }
+
+
+@pytest.fixture
+def history_store(tmp_path):
+    """Фикстура для хранилища истории во временном каталоге."""
+    from core.history import HistoryStore
+    store = HistoryStore(str(tmp_path / 'history' / 'scans.db'), batch_size=10)
+    yield store
+    store.close()
+
+
+class TestHistoryStore:
+    """Тесты SQLite-хранилища истории снимков."""
+
+    def test_save_and_latest_roundtrip(self, history_store):
+        """Тест сохранения снимка и чтения последнего."""
+        snapshot = make_snapshot(0)
+
+        history_store.save(snapshot)
+
+        assert history_store.latest() == [snapshot]
+
+    def test_latest_n_newest_first(self, history_store):
+        """Тест выборки последних N снимков от новых к старым."""
+        history_store.save_many([make_snapshot(minute) for minute in range(20)])
+
+        latest = history_store.latest(3)
+
+        assert [s['scan_categories']['hardware']['minute'] for s in latest] == [19, 18, 17]
+
+    def test_latest_by_category(self, history_store):
+        """Тест выборки последних снимков по категории."""
+        history_store.save_many([
+            make_snapshot(0, ('hardware',)),
+            make_snapshot(1, ('network',)),
+            make_snapshot(2, ('hardware', 'network')),
+            make_snapshot(3, ('software',)),
+        ])
+
+        latest = history_store.latest(2, categories=['network'])
+
+        assert [s['scan_categories']['network']['minute'] for s in latest] == [2, 1]
+        assert all(list(s['scan_categories']) == ['network'] for s in latest)
+
+    def test_query_range(self, history_store):
+        """Тест выборки по временному интервалу (конец не включается)."""
+        history_store.save_many([make_snapshot(minute) for minute in range(60)])
+
+        snapshots = history_store.query_range('2024-01-01T00:10:00', datetime(2024, 1, 1, 0, 15))
+
+        assert [s['scan_categories']['network']['minute'] for s in snapshots] == [10, 11, 12, 13, 14]
+        assert snapshots[0]['scan_info']['hardware']['status'] == 'completed'
+
+    def test_query_range_by_category(self, history_store):
+        """Тест выборки по интервалу только для выбранной категории."""
+        history_store.save_many([make_snapshot(minute) for minute in range(5)])
+
+        snapshots = history_store.query_range(start='2024-01-01T00:03:00', categories=['hardware'])
+
+        assert len(snapshots) == 2
+        assert all(list(s['scan_categories']) == ['hardware'] for s in snapshots)
+
+    def test_batched_add(self, history_store):
+        """Тест пакетной записи: буфер сбрасывается по размеру и перед запросами."""
+        for minute in range(15):
+            history_store.add(make_snapshot(minute))
+
+        assert len(history_store._pending) == 5
+        assert history_store.count() == 15
+        assert history_store._pending == []
+
+    def test_empty_scan_is_stored(self, history_store):
+        """Тест сохранения снимка без категорий."""
+        history_store.save({'timestamp': '2024-01-01T00:00:00', 'scan_categories': {}})
+
+        assert history_store.latest() == [{'timestamp': '2024-01-01T00:00:00', 'scan_categories': {}}]
+
+    def test_indexes_used_for_queries(self, history_store):
+        """Тест: запросы по времени и категории используют индексы."""
+        plan = history_store._conn.execute(
+            'EXPLAIN QUERY PLAN SELECT snapshot_id FROM snapshot_categories '
+            'WHERE category = ? ORDER BY ts DESC LIMIT 5', ('hardware',)
+        ).fetchall()
+        assert any('idx_categories_category_ts' in row[-1] for row in plan)
+
+        plan = history_store._conn.execute(
+            'EXPLAIN QUERY PLAN SELECT id FROM snapshots WHERE ts >= ? AND ts < ?', (0, 1)
+        ).fetchall()
+        assert any('idx_snapshots_ts' in row[-1] for row in plan)
+
+    def test_invalid_timestamp(self, history_store):
+        """Негативный тест: некорректная временная метка отклоняется."""
+        with pytest.raises(ValueError):
+            history_store.save({'timestamp': 'вчера', 'scan_categories': {}})
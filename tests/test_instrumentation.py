@@ -0,0 +1,168 @@
+import pytest
+import threading
+from collections import namedtuple
+from unittest.mock import patch, MagicMock
+
+sdiskpart = namedtuple('sdiskpart', ['device', 'mountpoint'])
+sdiskusage = namedtuple('sdiskusage', ['total', 'used', 'free', 'percent'])
+
+
+class TestInstrumentation:
+    """Тесты сбора замеров по пробам."""
+
+    def test_probe_records_time_and_calls(self):
+        """Тест записи времени и числа вызовов psutil для пробы."""
+        from core.instrumentation import Instrumentation
+        instrumentation = Instrumentation()
+        backend = instrumentation.wrap(MagicMock())
+
+        with instrumentation.category('hardware'):
+            backend.cpu_count()
+            with instrumentation.probe('hardware', 'memory'):
+                backend.virtual_memory()
+                backend.swap_memory()
+
+        meta = instrumentation.summary()
+        assert meta['hardware']['psutil_calls'] == 3
+        assert meta['hardware']['probes']['memory']['psutil_calls'] == 2
+        assert meta['hardware']['wall'] >= meta['hardware']['probes']['memory']['wall']
+
+    def test_calls_outside_probes_not_counted(self):
+        """Тест: вызовы вне открытых проб не засчитываются."""
+        from core.instrumentation import Instrumentation
+        instrumentation = Instrumentation()
+        backend = instrumentation.wrap(MagicMock())
+
+        backend.cpu_count()
+
+        assert instrumentation.summary() == {}
+
+    def test_probe_in_other_thread_adds_cpu(self):
+        """Тест: проба в другом потоке учитывается в категории."""
+        from core.instrumentation import Instrumentation
+        instrumentation = Instrumentation()
+        backend = instrumentation.wrap(MagicMock())
+
+        def worker():
+            with instrumentation.probe('hardware', 'disk:/'):
+                backend.disk_usage('/')
+
+        with instrumentation.category('hardware'):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+
+        meta = instrumentation.summary()
+        assert meta['hardware']['psutil_calls'] == 1
+        assert meta['hardware']['probes']['disk:/']['psutil_calls'] == 1
+        assert meta['hardware']['cpu'] >= meta['hardware']['probes']['disk:/']['cpu']
+
+    def test_hooks_receive_records(self):
+        """Тест передачи замеров во внешние хуки."""
+        from core.instrumentation import Instrumentation
+        records = []
+        instrumentation = Instrumentation(hooks=[records.append])
+
+        with instrumentation.category('network'):
+            with instrumentation.probe('network', 'net_if_addrs'):
+                pass
+
+        assert [(r['category'], r['probe']) for r in records] == [
+            ('network', 'net_if_addrs'), ('network', None)
+        ]
+        assert set(records[0]) == {'category', 'probe', 'wall', 'cpu', 'psutil_calls'}
+
+    def test_non_callable_attributes_pass_through(self):
+        """Тест: константы модуля возвращаются без обертки."""
+        from core.instrumentation import Instrumentation
+        module = MagicMock()
+        module.AF_LINK = 17
+
+        assert Instrumentation().wrap(module).AF_LINK == 17
+
+
+class TestScanMeta:
+    """Тесты раздела scan_meta в результате сканирования."""
+
+    def test_scan_meta_absent_by_default(self, scanner_instance):
+        """Тест: без instrument раздел scan_meta не добавляется."""
+        with patch.object(scanner_instance, 'scan_network', return_value={'interfaces': []}):
+            result = scanner_instance.selective_scan({'network': True})
+
+        assert 'scan_meta' not in result
+        assert scanner_instance._psutil.__name__ == 'psutil'
+
+    def test_hardware_probes(self, scanner_instance):
+        """Тест замеров подпроб аппаратной категории, включая каждый диск."""
+        partitions = [sdiskpart('/dev/sda1', '/'), sdiskpart('/dev/sdb1', '/data')]
+        scanner_instance.software_inventory.collect = MagicMock(return_value=([], []))
+
+        with patch('psutil.disk_partitions', return_value=partitions), \
+             patch('psutil.disk_usage', return_value=sdiskusage(1024**3, 0, 1024**3, 0.0)):
+            result = scanner_instance.selective_scan({'hardware': True, 'software': True},
+                                                     instrument=True)
+
+        meta = result['scan_meta']
+        assert list(meta) == ['hardware', 'software']
+        probes = meta['hardware']['probes']
+        assert {'cpu', 'memory', 'disk_partitions', 'disk:/', 'disk:/data'} <= set(probes)
+        assert probes['disk:/data']['psutil_calls'] == 1
+        assert probes['memory']['psutil_calls'] == 1
+        assert meta['hardware']['psutil_calls'] == sum(p['psutil_calls'] for p in probes.values())
+        assert meta['software']['psutil_calls'] == 0
+        assert scanner_instance._psutil.__name__ == 'psutil'
+
+    def test_probe_hooks_called(self, scanner_instance):
+        """Тест вызова хуков сканера при инструментированном сканировании."""
+        records = []
+        scanner_instance.probe_hooks.append(records.append)
+
+        scanner_instance.selective_scan({'network': True}, instrument=True)
+        scanner_instance.selective_scan({'network': True})
+
+        assert [(r['category'], r['probe']) for r in records] == [
+            ('network', 'net_if_addrs'), ('network', 'net_io_counters'), ('network', None)
+        ]
+
+    def test_instrumentation_reset_after_error(self, scanner_instance):
+        """Негативный тест: ошибка пробы не оставляет инструментацию включенной."""
+        records = []
+        scanner_instance.probe_hooks.append(records.append)
+        with patch.object(scanner_instance, 'scan_network', side_effect=RuntimeError('сбой')):
+            with pytest.raises(RuntimeError):
+                scanner_instance.selective_scan({'network': True}, instrument=True)
+
+        result = scanner_instance.selective_scan({'network': True})
+
+        assert 'scan_meta' not in result
+        assert [r['probe'] for r in records] == [None]
+
+    def test_interrupted_scan_does_not_write_into_next(self, scanner_instance):
+        """Тест: проба прерванного по таймауту сканирования пишет замеры в свой scan_meta."""
+        release = threading.Event()
+        straggler_done = threading.Event()
+
+        def straggler():
+            # Проба первого сканирования, продолжающаяся после его таймаута
+            release.wait(2)
+            with scanner_instance._probe('software', 'late'):
+                scanner_instance._psutil.cpu_count()
+            straggler_done.set()
+            return {}
+
+        def own():
+            release.set()
+            straggler_done.wait(2)
+            with scanner_instance._probe('software', 'own'):
+                pass
+            return {}
+
+        probes = iter([straggler, own])
+        with patch.object(scanner_instance, 'scan_software', side_effect=lambda: next(probes)()):
+            first = scanner_instance.selective_scan({'software': True}, instrument=True, timeout=0.05)
+            second = scanner_instance.selective_scan({'software': True}, instrument=True)
+
+        assert straggler_done.is_set()
+        assert first['scan_info']['software']['status'] == 'timeout'
+        assert list(second['scan_meta']['software']['probes']) == ['own']
+        assert second['scan_meta']['software']['psutil_calls'] == 0
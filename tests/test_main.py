@@ -0,0 +1,84 @@
+import pytest
+import json
+import os
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Бюджет на импорт точки входа и модулей сканирования в headless-режиме
+HEADLESS_IMPORT_BUDGET = 0.5
+
+def run_python(code):
+    return subprocess.run([sys.executable, '-c', code], cwd=ROOT,
+                          capture_output=True, text=True, timeout=60)
+
+class TestHeadlessCli:
+    """Тесты headless-режима командной строки."""
+
+    def test_headless_import_budget(self):
+        """Тест: headless-путь не импортирует tkinter и укладывается в бюджет."""
+        code = (
+            "import sys, time\n"
+            "start = time.perf_counter()\n"
+            "import main\n"
+            "import core.scanner, core.exporter\n"
+            "print(time.perf_counter() - start)\n"
+            "print('tkinter' in sys.modules, 'gui.main_window' in sys.modules)\n"
+        )
+        proc = run_python(code)
+
+        assert proc.returncode == 0, proc.stderr
+        elapsed, gui_flags = proc.stdout.splitlines()
+        assert gui_flags == 'False False'
+        assert float(elapsed) < HEADLESS_IMPORT_BUDGET
+
+    def test_scan_to_stdout_json(self):
+        """Тест вывода результатов сканирования в stdout в формате JSON."""
+        proc = subprocess.run([sys.executable, 'main.py', 'scan', '-c', 'software'],
+                              cwd=ROOT, capture_output=True, text=True, timeout=60)
+
+        assert proc.returncode == 0, proc.stderr
+        data = json.loads(proc.stdout)
+        assert list(data['scan_categories']) == ['software']
+        assert 'os' in data['scan_categories']['software']
+
+    def test_scan_to_file_xml(self, tmp_path):
+        """Тест сохранения результатов сканирования в XML-файл."""
+        output = tmp_path / 'out' / 'scan.xml'
+
+        import main
+        exit_code = main.main(['scan', '-c', 'software', '-f', 'xml', '-o', str(output)])
+
+        assert exit_code == 0
+        root = ET.parse(output).getroot()
+        assert root.find('categories/software/os') is not None
+
+    def test_scan_compressed_stdout(self):
+        """Тест сжатого вывода в stdout."""
+        import gzip
+        proc = subprocess.run([sys.executable, 'main.py', 'scan', '-c', 'software', '-z', 'gzip'],
+                              cwd=ROOT, capture_output=True, timeout=60)
+
+        assert proc.returncode == 0, proc.stderr
+        data = json.loads(gzip.decompress(proc.stdout))
+        assert list(data['scan_categories']) == ['software']
+
+    def test_scan_rejects_unknown_category(self):
+        """Негативный тест: неизвестная категория отклоняется."""
+        import main
+
+        with pytest.raises(SystemExit):
+            main.main(['scan', '-c', 'unknown'])
+
+    def test_scan_per_core(self):
+        """Тест сводок и рядов загрузки ядер в headless-сканировании."""
+        proc = subprocess.run([sys.executable, 'main.py', 'scan', '-c', 'hardware', '--per-core',
+                               '--cpu-samples', '2', '--cpu-interval', '0.01'],
+                              cwd=ROOT, capture_output=True, text=True, timeout=60)
+
+        assert proc.returncode == 0, proc.stderr
+        cpu = json.loads(proc.stdout)['scan_categories']['hardware']['cpu']
+        assert cpu['utilization']['samples'] == 2
+        assert len(cpu['per_core']['utilization']) == cpu['total_cores']
@@ -0,0 +1,99 @@
+import pytest
+from unittest.mock import MagicMock
+
+
+@pytest.fixture
+def window():
+    """Фикстура окна без Tk: панель живых метрик собрана из заглушек виджетов."""
+    from gui.main_window import MainWindow
+    window = MainWindow.__new__(MainWindow)
+    window.live_previous = None
+    window.live_panel = {
+        'frame': MagicMock(),
+        'metrics': {
+            key: {'label': MagicMock(), 'bar': None if key == 'network' else MagicMock(),
+                  'text': None, 'width': None}
+            for key in ('cpu', 'memory', 'disk', 'network')
+        }
+    }
+    return window
+
+
+def make_sample(timestamp, **values):
+    sample = {
+        'timestamp': timestamp,
+        'cpu_percent': 25.0,
+        'memory_percent': 50.0,
+        'memory_available': 8 * 1024**3,
+        'disk_used': 40 * 1024**3,
+        'disk_total': 100 * 1024**3,
+        'disk_timeouts': 0.0,
+        'net_bytes_recv': 0.0,
+        'net_bytes_sent': 0.0
+    }
+    sample.update(values)
+    return sample
+
+
+class TestLivePanel:
+    """Тесты обновления панели живых метрик."""
+
+    def test_widgets_updated_only_on_change(self, window):
+        """Тест: текст и полоса меняются, только если изменилось видимое значение."""
+        metric = window.live_panel['metrics']['cpu']
+
+        window.set_live_metric('cpu', "25%", 0.25)
+        window.set_live_metric('cpu', "25%", 0.2501)
+
+        metric['label'].config.assert_called_once_with(text="25%")
+        metric['bar'].place_configure.assert_called_once_with(relwidth=0.25)
+
+        window.set_live_metric('cpu', "26%", 0.26)
+
+        assert metric['label'].config.call_count == 2
+        metric['bar'].place_configure.assert_called_with(relwidth=0.26)
+
+    def test_bar_width_clamped(self, window):
+        """Тест: доля вне диапазона 0..1 ограничивается по краям полосы."""
+        bar = window.live_panel['metrics']['disk']['bar']
+
+        window.set_live_metric('disk', "x", 1.7)
+        window.set_live_metric('disk', "y", -0.5)
+
+        assert [c.kwargs['relwidth'] for c in bar.place_configure.call_args_list] == [1.0, 0.0]
+
+    def test_metric_without_bar_ignores_fraction(self, window):
+        """Тест: у сетевой метрики нет полосы, доля игнорируется."""
+        window.set_live_metric('network', "↓ 1.0 КБ/с", 0.5)
+
+        window.live_panel['metrics']['network']['label'].config.assert_called_once()
+
+    def test_network_rate_from_consecutive_samples(self, window):
+        """Тест: скорость сети считается по двум соседним замерам."""
+        label = window.live_panel['metrics']['network']['label']
+
+        window.update_live_panel(make_sample(10.0, net_bytes_recv=1024.0, net_bytes_sent=0.0))
+        label.config.assert_not_called()
+
+        window.update_live_panel(make_sample(12.0, net_bytes_recv=5120.0, net_bytes_sent=2048.0))
+        label.config.assert_called_once_with(text="↓ 2.0 КБ/с  ↑ 1.0 КБ/с")
+
+    def test_repeated_sample_does_not_touch_widgets(self, window):
+        """Тест: повтор того же замера не вызывает перерисовку виджетов."""
+        window.update_live_panel(make_sample(10.0))
+        window.update_live_panel(make_sample(11.0))
+
+        for key in ('cpu', 'memory', 'disk'):
+            metric = window.live_panel['metrics'][key]
+            metric['label'].config.assert_called_once()
+            metric['bar'].place_configure.assert_called_once()
+
+    def test_disk_timeouts_and_counter_reset(self, window):
+        """Тест: число неответивших дисков в тексте, сброс сетевых счетчиков дает нулевую скорость."""
+        window.update_live_panel(make_sample(10.0, disk_timeouts=2.0, net_bytes_recv=4096.0))
+        window.update_live_panel(make_sample(11.0, disk_timeouts=2.0, net_bytes_recv=0.0))
+
+        disk = window.live_panel['metrics']['disk']
+        disk['label'].config.assert_called_once_with(text="40 / 100 ГБ, без ответа: 2")
+        assert disk['width'] == 0.4
+        assert window.live_panel['metrics']['network']['text'] == "↓ 0.0 КБ/с  ↑ 0.0 КБ/с"
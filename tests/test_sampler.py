@@ -0,0 +1,162 @@
+import pytest
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+
+@pytest.fixture
+def sampler_instance():
+    """Фикстура для сэмплера с коротким интервалом."""
+    from core.sampler import MetricsSampler
+    return MetricsSampler(interval=0.02, capacity=4)
+
+
+class TestRingBuffer:
+    """Тесты кольцевого буфера замеров."""
+
+    def test_wraps_and_keeps_order(self):
+        """Тест перезаписи старых замеров при переполнении."""
+        from core.sampler import RingBuffer
+        buffer = RingBuffer(3, fields=('timestamp', 'value'))
+
+        for i in range(5):
+            buffer.append({'timestamp': i, 'value': i * 10})
+
+        assert len(buffer) == 3
+        assert buffer.column('timestamp') == [2.0, 3.0, 4.0]
+        assert buffer.latest() == {'timestamp': 4.0, 'value': 40.0}
+
+    def test_memory_is_preallocated(self):
+        """Тест: размер хранилища не растет с числом замеров."""
+        from core.sampler import RingBuffer
+        buffer = RingBuffer(10, fields=('value',))
+        before = buffer._columns['value'].buffer_info()
+
+        for i in range(1000):
+            buffer.append({'value': i})
+
+        assert buffer._columns['value'].buffer_info() == before
+
+    def test_empty_buffer(self):
+        """Тест пустого буфера."""
+        from core.sampler import RingBuffer
+        buffer = RingBuffer(2)
+
+        assert len(buffer) == 0
+        assert buffer.latest() is None
+        assert buffer.samples() == []
+
+    def test_invalid_capacity(self):
+        """Негативный тест: нулевая емкость буфера."""
+        from core.sampler import RingBuffer
+
+        with pytest.raises(ValueError):
+            RingBuffer(0)
+
+
+class TestMetricsSampler:
+    """Тесты сэмплера метрик."""
+
+    def test_sample_fields(self, sampler_instance):
+        """Тест состава полей одного замера."""
+        from core.sampler import SAMPLE_FIELDS
+
+        sample = sampler_instance.sample()
+
+        assert set(sample) == set(SAMPLE_FIELDS)
+        assert sample['memory_used'] > 0
+
+    def test_interval_without_drift(self, sampler_instance):
+        """Тест: замеры привязаны к сетке интервала и не накапливают задержку."""
+        def slow_sample():
+            time.sleep(0.01)
+            return {'timestamp': time.monotonic()}
+
+        with patch.object(sampler_instance, 'sample', side_effect=slow_sample):
+            sampler_instance.run(count=4)
+
+        stamps = sampler_instance.buffer.column('timestamp')
+        start = stamps[0]
+        for tick, stamp in enumerate(stamps):
+            assert abs(stamp - (start + tick * 0.02)) < 0.015
+        assert sampler_instance.missed_ticks == 0
+
+    def test_missed_ticks_reported(self, sampler_instance):
+        """Тест учета пропущенных тактов при медленных замерах."""
+        def very_slow_sample():
+            time.sleep(0.05)
+            return {'timestamp': time.time()}
+
+        with patch.object(sampler_instance, 'sample', side_effect=very_slow_sample):
+            sampler_instance.run(count=3)
+
+        assert sampler_instance.missed_ticks >= 4
+
+    def test_background_start_stop(self, sampler_instance):
+        """Тест запуска и остановки сэмплера в фоновом потоке."""
+        with patch.object(sampler_instance, 'sample', return_value={'timestamp': 1.0}):
+            sampler_instance.start()
+            time.sleep(0.1)
+            sampler_instance.stop(timeout=1)
+
+        assert 1 <= len(sampler_instance.buffer) <= 4
+        assert sampler_instance._thread is None
+
+    def test_hung_mount_does_not_leak_threads(self):
+        """Тест: зависшая точка монтирования не порождает новый поток на каждом такте."""
+        from core.sampler import MetricsSampler
+        from core.scanner import SystemScanner
+        partitions = [
+            MagicMock(device='/dev/sda1', mountpoint='/'),
+            MagicMock(device='nfs:/share', mountpoint='/mnt/stale'),
+        ]
+        hang = threading.Event()
+
+        def fake_usage(mountpoint):
+            if mountpoint == '/mnt/stale':
+                hang.wait(10)
+            return MagicMock(total=100, used=40)
+
+        sampler = MetricsSampler(interval=0.001, capacity=4,
+                                 scanner=SystemScanner(disk_timeout=0.02))
+        before = threading.active_count()
+        try:
+            with patch('core.sampler.psutil.disk_partitions', return_value=partitions), \
+                 patch('core.scanner.psutil.disk_usage', side_effect=fake_usage):
+                sampler.run(count=50)
+                during = threading.active_count()
+        finally:
+            hang.set()
+
+        # Один зависший поток на точку монтирования, а не на каждый такт
+        assert during - before <= 2
+        assert sampler.buffer.latest()['disk_timeouts'] == 1
+        assert sampler.buffer.latest()['disk_total'] == 100
+
+    def test_disks_sampled_every_n_ticks(self):
+        """Тест: диски опрашиваются раз в disk_every замеров, между опросами значения повторяются."""
+        from core.sampler import MetricsSampler
+        scanner = MagicMock()
+        usage = MagicMock(total=100, used=40)
+        scanner.probe_disks.return_value = [(MagicMock(), usage, 0.01), (MagicMock(), None, 2.0)]
+        sampler = MetricsSampler(interval=0.001, capacity=8, scanner=scanner, disk_every=3)
+
+        sampler.run(count=7)
+
+        assert scanner.probe_disks.call_count == 3
+        assert sampler.buffer.column('disk_total') == [100.0] * 7
+        assert sampler.buffer.column('disk_timeouts') == [1.0] * 7
+
+    def test_invalid_disk_every(self):
+        """Негативный тест: неположительный период опроса дисков."""
+        from core.sampler import MetricsSampler
+
+        with pytest.raises(ValueError):
+            MetricsSampler(disk_every=0)
+
+    def test_invalid_interval(self):
+        """Негативный тест: неположительный интервал."""
+        from core.sampler import MetricsSampler
+
+        with pytest.raises(ValueError):
+            MetricsSampler(interval=0)
@@ -1,6 +1,8 @@
 import pytest
 import sys
 import platform
+import threading
+import time
 from unittest.mock import patch, MagicMock
 
 class TestSystemScanner:
@@ -105,4 +107,402 @@ class TestSystemScanner:
              patch.object(scanner_instance, 'scan_software'), \
              patch.object(scanner_instance, 'scan_network'):
             
-            scanner_instance.selective_scan(categories)
\ No newline at end of file
+            scanner_instance.selective_scan(categories)
+    
+    def test_disk_probe_timeout(self, scanner_instance):
+        """Тест: зависшая точка монтирования помечается как timeout."""
+        partitions = [
+            MagicMock(device='/dev/sda1', mountpoint='/'),
+            MagicMock(device='nfs:/share', mountpoint='/mnt/stale'),
+            MagicMock(device='/dev/sdb1', mountpoint='/data'),
+        ]
+        hang = threading.Event()
+        
+        def fake_usage(mountpoint):
+            if mountpoint == '/mnt/stale':
+                hang.wait(5)
+            return MagicMock(total=10 * 1024**3, used=4 * 1024**3,
+                             free=6 * 1024**3, percent=40.0)
+        
+        scanner_instance.disk_timeout = 0.2
+        try:
+            with patch('psutil.disk_partitions', return_value=partitions), \
+                 patch('psutil.disk_usage', side_effect=fake_usage):
+                start = time.perf_counter()
+                disks = scanner_instance.scan_hardware()['disks']
+                elapsed = time.perf_counter() - start
+        finally:
+            hang.set()
+        
+        assert elapsed < 1.0
+        assert [d['device'] for d in disks] == ['/dev/sda1', 'nfs:/share', '/dev/sdb1']
+        assert disks[0]['status'] == 'ok'
+        assert disks[0]['free'] == 6.0
+        assert disks[1]['status'] == 'timeout'
+        assert disks[1]['elapsed'] >= 0.2
+        assert disks[2]['status'] == 'ok'
+    
+    def test_disk_probe_skips_inaccessible(self, scanner_instance):
+        """Негативный тест: недоступные точки монтирования пропускаются."""
+        partitions = [
+            MagicMock(device='/dev/sda1', mountpoint='/'),
+            MagicMock(device='/dev/sr0', mountpoint='/media/cdrom'),
+        ]
+        
+        def fake_usage(mountpoint):
+            if mountpoint == '/media/cdrom':
+                raise PermissionError("Отказано в доступе")
+            return MagicMock(total=1024**3, used=0, free=1024**3, percent=0.0)
+        
+        with patch('psutil.disk_partitions', return_value=partitions), \
+             patch('psutil.disk_usage', side_effect=fake_usage):
+            disks = scanner_instance.scan_hardware()['disks']
+        
+        assert [d['device'] for d in disks] == ['/dev/sda1']
+    
+    def test_static_facts_served_from_cache(self, scanner_instance):
+        """Тест: повторное сканирование берет статические сведения из кэша."""
+        with patch('platform.processor', return_value='Intel') as mock_processor, \
+             patch('psutil.cpu_count', return_value=8) as mock_cpu_count, \
+             patch('psutil.cpu_freq', return_value=MagicMock(current=3600.0)) as mock_cpu_freq:
+            
+            first = scanner_instance.scan_hardware()
+            second = scanner_instance.scan_hardware()
+        
+        assert mock_processor.call_count == 1
+        assert mock_cpu_count.call_count == 2
+        # Частота изменчива: общая и по ядрам запрашиваются один раз за сканирование
+        assert mock_cpu_freq.call_count == 4
+        assert first['cached_fields'] == []
+        assert second['cached_fields'] == ['cpu.processor', 'cpu.physical_cores', 'cpu.total_cores']
+        assert second['cpu']['processor'] == 'Intel'
+    
+    def test_fact_ttl_expiry_and_invalidation(self):
+        """Тест истечения TTL и явной инвалидации кэша."""
+        from core.scanner import SystemScanner
+        scanner = SystemScanner(fact_ttls={'os.hostname': 0.05})
+        
+        with patch('socket.gethostname', side_effect=['host-a', 'host-b', 'host-c', 'host-d']), \
+             patch('platform.version', return_value='1.0') as mock_version, \
+             patch.object(scanner.software_inventory, 'collect', return_value=([], [])):
+            
+            assert scanner.scan_software()['os']['hostname'] == 'host-a'
+            assert scanner.scan_software()['cached_fields'] == ['os.version', 'os.hostname']
+            
+            time.sleep(0.06)
+            assert scanner.scan_software()['os']['hostname'] == 'host-b'
+            
+            scanner.invalidate_facts('os.hostname')
+            result = scanner.scan_software()
+            assert result['os']['hostname'] == 'host-c'
+            assert result['cached_fields'] == ['os.version']
+            
+            scanner.invalidate_facts()
+            scanner.scan_software()
+        
+        assert mock_version.call_count == 2
+    
+    def test_fact_ttl_zero_disables_cache(self):
+        """Тест отключения кэширования поля нулевым TTL."""
+        from core.scanner import SystemScanner
+        scanner = SystemScanner(fact_ttls={'cpu.processor': 0})
+        
+        with patch('platform.processor', return_value='AMD') as mock_processor:
+            scanner.scan_hardware()
+            result = scanner.scan_hardware()
+        
+        assert mock_processor.call_count == 2
+        assert 'cpu.processor' not in result['cached_fields']
+    
+    def test_scan_processes_top_n(self):
+        """Тест выборки top-N процессов по CPU и памяти."""
+        from core.scanner import SystemScanner
+        scanner = SystemScanner(process_top_n=2)
+        
+        processes = [
+            MagicMock(info={'pid': pid, 'name': f'proc{pid}', 'cpu_percent': cpu,
+                            'memory_info': MagicMock(rss=rss * 1024**2)})
+            for pid, cpu, rss in [(1, 5.0, 100), (2, 50.0, 10), (3, 20.0, 300), (4, 0.0, 50)]
+        ]
+        # Процесс, к которому нет доступа: psutil подставляет ad_value
+        processes.append(MagicMock(info={'pid': 5, 'name': None, 'cpu_percent': None,
+                                         'memory_info': None}))
+        
+        with patch('psutil.process_iter', return_value=processes) as mock_iter:
+            result = scanner.scan_processes()
+        
+        mock_iter.assert_called_once()
+        assert 'cpu_percent' in mock_iter.call_args.kwargs['attrs']
+        assert result['count'] == 5
+        assert [p['pid'] for p in result['top_cpu']] == [2, 3]
+        assert [p['pid'] for p in result['top_memory']] == [3, 1]
+        assert result['top_memory'][0] == {'pid': 3, 'name': 'proc3', 'cpu_percent': 20.0, 'rss_mb': 300.0}
+    
+    def test_scan_processes_reuses_cpu_baseline(self, scanner_instance):
+        """Тест: повторное сканирование процессов не требует ожидания."""
+        scanner_instance.scan_processes()
+        
+        start = time.perf_counter()
+        result = scanner_instance.scan_processes()
+        elapsed = time.perf_counter() - start
+        
+        assert result['count'] > 0
+        assert elapsed < 1.0
+    
+    def test_selective_scan_processes(self, scanner_instance):
+        """Тест подключения категории процессов к выборочному сканированию."""
+        categories = {'hardware': False, 'software': False, 'network': False, 'processes': True}
+        
+        with patch.object(scanner_instance, 'scan_processes', return_value={'count': 0}):
+            result = scanner_instance.selective_scan(categories)
+        
+        assert result['scan_categories'] == {'processes': {'count': 0}}
+    
+    def test_long_probes_stop_on_cancel(self, scanner_instance):
+        """Тест: циклы по дискам и процессам прерываются при отмене сканирования."""
+        import threading
+        from core import engine
+        from core.engine import ScanCancelled
+        cancel = threading.Event()
+        cancel.set()
+        
+        engine._context.cancel = cancel
+        try:
+            with patch('psutil.process_iter', return_value=[MagicMock()] * 10):
+                with pytest.raises(ScanCancelled):
+                    scanner_instance.scan_processes()
+            with pytest.raises(ScanCancelled):
+                scanner_instance.probe_disks([MagicMock(mountpoint='/')])
+        finally:
+            engine._context.cancel = None
+    
+    def test_progress_events_per_item(self, scanner_instance):
+        """Тест событий прогресса: по одному на диск, интерфейс и пачку процессов."""
+        from core.scanner import PROGRESS_BATCH
+        partitions = [MagicMock(device=f'/dev/sd{c}1', mountpoint=f'/mnt/{c}') for c in 'abc']
+        interfaces = {'eth0': [], 'eth1': []}
+        processes = [
+            MagicMock(info={'pid': pid, 'name': 'p', 'cpu_percent': 0.0,
+                            'memory_info': MagicMock(rss=1024)})
+            for pid in range(PROGRESS_BATCH * 2 + 10)
+        ]
+        usage = MagicMock(total=1024**3, used=0, free=1024**3, percent=0.0)
+        events = []
+        categories = {'hardware': True, 'software': False, 'network': True, 'processes': True}
+        
+        with patch('psutil.disk_partitions', return_value=partitions), \
+             patch('psutil.disk_usage', return_value=usage), \
+             patch('psutil.net_if_addrs', return_value=interfaces), \
+             patch('psutil.pids', return_value=list(range(len(processes)))), \
+             patch('psutil.process_iter', return_value=processes):
+            scanner_instance.selective_scan(categories, on_progress=events.append)
+        
+        by_category = {}
+        for event in events:
+            by_category.setdefault(event['category'], []).append(event)
+        
+        hardware = by_category['hardware']
+        assert [e['item'] for e in hardware[:2]] == ['cpu', 'memory']
+        assert sorted(e['item'] for e in hardware[2:]) == ['/mnt/a', '/mnt/b', '/mnt/c']
+        assert [e['done'] for e in hardware] == [1, 2, 3, 4, 5]
+        assert {e['total'] for e in hardware[1:]} == {5}
+        assert [e['item'] for e in by_category['network']] == ['eth0', 'eth1']
+        assert [e['done'] for e in by_category['processes']] == [
+            PROGRESS_BATCH, PROGRESS_BATCH * 2, len(processes)]
+        assert by_category['processes'][-1]['total'] == len(processes)
+        assert scanner_instance.current_progress == 100
+    
+    def test_current_progress_is_mean_of_categories(self):
+        """Тест: общий прогресс - среднее долей выполнения выбранных категорий."""
+        from core.scanner import ScanProgress
+        progress = ScanProgress({'hardware': True, 'network': True, 'software': False})
+        assert progress.progress == 0
+        
+        assert progress.report('hardware', 1, 2)['progress'] == 25
+        assert progress.report('network', 0, 0)['progress'] == 75
+        # Уточненное число шагов не уменьшает долю категории
+        assert progress.report('hardware', 1, 4)['progress'] == 75
+    
+    def test_interrupted_scan_progress_not_reported_to_next(self, scanner_instance):
+        """Тест: проба прерванного по таймауту сканирования не сообщает прогресс следующему."""
+        release = threading.Event()
+        straggler_done = threading.Event()
+        
+        def straggler():
+            # Проба первого сканирования, продолжающаяся после его таймаута
+            scanner_instance._report_progress('software', 1, 2)
+            release.wait(2)
+            scanner_instance._report_progress('software', 2, 2)
+            straggler_done.set()
+            return {}
+        
+        def own():
+            scanner_instance._report_progress('software', 1, 2)
+            release.set()
+            straggler_done.wait(2)
+            return {}
+        
+        first_events, second_events = [], []
+        probes = iter([straggler, own])
+        with patch.object(scanner_instance, 'scan_software', side_effect=lambda: next(probes)()):
+            scanner_instance.selective_scan({'software': True}, timeout=0.1,
+                                            on_progress=first_events.append)
+            scanner_instance.selective_scan({'software': True}, on_progress=second_events.append)
+        
+        assert straggler_done.is_set()
+        assert [e['progress'] for e in first_events] == [50.0, 100.0]
+        assert [e['progress'] for e in second_events] == [50.0]
+        assert scanner_instance.current_progress == 50
+    
+    def test_network_rates_from_consecutive_scans(self, scanner_instance):
+        """Тест скоростей интерфейсов по двум соседним сканированиям."""
+        from collections import namedtuple
+        snetio = namedtuple('snetio', ['bytes_sent', 'bytes_recv', 'packets_sent', 'packets_recv',
+                                       'errin', 'errout', 'dropin', 'dropout'])
+        addresses = {'eth0': [], 'eth1': [], 'veth9': []}
+        first = {
+            'eth0': snetio(1000, 5000, 10, 50, 0, 0, 0, 0),
+            'eth1': snetio(9000, 9000, 90, 90, 1, 0, 0, 0),
+        }
+        second = {
+            'eth0': snetio(3000, 9000, 30, 90, 0, 0, 2, 0),
+            # Интерфейс пересоздан: счетчики начались заново
+            'eth1': snetio(400, 800, 4, 8, 0, 0, 0, 0),
+            # Новый интерфейс: скоростей еще нет
+            'veth9': snetio(100, 100, 1, 1, 0, 0, 0, 0),
+        }
+        
+        with patch('psutil.net_if_addrs', return_value=addresses), \
+             patch('psutil.net_io_counters', side_effect=[first, second]) as mock_counters, \
+             patch('time.monotonic', side_effect=[100.0, 102.0]):
+            initial = scanner_instance.scan_network()
+            result = scanner_instance.scan_network()
+        
+        assert mock_counters.call_args.kwargs == {'pernic': True}
+        assert initial['io_interval'] is None
+        assert initial['interfaces'][0]['io']['rx_bytes_per_s'] is None
+        assert 'io' not in initial['interfaces'][2]
+        
+        eth0, eth1, veth9 = result['interfaces']
+        assert result['io_interval'] == 2.0
+        assert eth0['io'] == {
+            'errors_in': 0, 'errors_out': 0, 'drops_in': 2, 'drops_out': 0,
+            'rx_bytes_per_s': 2000.0, 'tx_bytes_per_s': 1000.0,
+            'rx_packets_per_s': 20.0, 'tx_packets_per_s': 10.0
+        }
+        assert eth1['io']['rx_bytes_per_s'] == 400.0
+        assert eth1['io']['tx_packets_per_s'] == 2.0
+        assert veth9['io']['tx_bytes_per_s'] is None
+    
+    def test_network_state_drops_removed_interfaces(self, scanner_instance):
+        """Тест: исчезнувшие интерфейсы не остаются в сохраненном замере."""
+        from collections import namedtuple
+        snetio = namedtuple('snetio', ['bytes_sent', 'bytes_recv', 'packets_sent', 'packets_recv',
+                                       'errin', 'errout', 'dropin', 'dropout'])
+        counters = [{'eth0': snetio(*[0] * 8), 'veth1': snetio(*[0] * 8)},
+                    {'eth0': snetio(*[0] * 8)}]
+        
+        with patch('psutil.net_if_addrs', return_value={'eth0': []}), \
+             patch('psutil.net_io_counters', side_effect=counters):
+            scanner_instance.scan_network()
+            scanner_instance.scan_network()
+        
+        assert set(scanner_instance._net_io_sample[1]) == {'eth0'}
+    
+    def test_disk_io_rates_mapped_to_devices(self, scanner_instance):
+        """Тест пропускной способности, IOPS и await дисков по соседним сканированиям."""
+        from collections import namedtuple
+        sdiskio = namedtuple('sdiskio', ['read_count', 'write_count', 'read_bytes', 'write_bytes',
+                                         'read_time', 'write_time'])
+        partitions = [
+            MagicMock(device='/dev/sda1', mountpoint='/'),
+            MagicMock(device='/dev/mapper/vg-data', mountpoint='/data'),
+            MagicMock(device='tmpfs', mountpoint='/run'),
+        ]
+        usage = MagicMock(total=1024**3, used=0, free=1024**3, percent=0.0)
+        first = {'sda1': sdiskio(100, 50, 4096000, 2048000, 300, 200),
+                 'dm-3': sdiskio(10, 10, 0, 0, 0, 0)}
+        second = {'sda1': sdiskio(300, 250, 8192000, 3072000, 1100, 1400),
+                  'dm-3': sdiskio(10, 10, 0, 0, 0, 0)}
+        
+        def fake_realpath(path):
+            return '/dev/dm-3' if path == '/dev/mapper/vg-data' else path
+        
+        # Часы сканера стоят на месте внутри сканирования и сдвигаются между ними;
+        # отсчет загрузки ядер, снятый при создании сканера, уже в прошлом
+        clock = [time.monotonic() + 10.0]
+
+        with patch('psutil.disk_partitions', return_value=partitions), \
+             patch('psutil.disk_usage', return_value=usage), \
+             patch('psutil.disk_io_counters', side_effect=[first, second]) as mock_counters, \
+             patch('os.path.realpath', side_effect=fake_realpath) as mock_realpath, \
+             patch('core.scanner.time.monotonic', side_effect=lambda: clock[0]):
+            initial = scanner_instance.scan_hardware()['disks']
+            clock[0] += 4.0
+            sda, data, tmpfs = scanner_instance.scan_hardware()['disks']
+        
+        assert mock_counters.call_args.kwargs == {'perdisk': True}
+        assert initial[0]['io']['read_iops'] is None
+        assert sda['io'] == {
+            'read_bytes_per_s': 1024000.0, 'write_bytes_per_s': 256000.0,
+            'read_iops': 50.0, 'write_iops': 50.0, 'await_ms': 5.0
+        }
+        # Простаивающее устройство: операций за интервал нет, await не определен
+        assert data['io']['read_iops'] == 0.0
+        assert data['io']['await_ms'] is None
+        assert 'io' not in tmpfs
+        # Имя устройства разрешается один раз, а не на каждом сканировании
+        assert [c.args[0] for c in mock_realpath.call_args_list].count('/dev/mapper/vg-data') == 1
+    
+    def test_per_core_cpu_window(self):
+        """Тест окна загрузки ядер и необязательных рядов по ядрам."""
+        from collections import namedtuple
+        from core.scanner import SystemScanner
+        scputimes = namedtuple('scputimes', ['user', 'system', 'idle', 'iowait', 'guest'])
+        
+        def times(step, *busy):
+            # Накопленные времена ядер: за шаг каждое ядро проходит 100 единиц
+            # времени, из них busy - занятое, остальное поровну idle и iowait;
+            # гостевое время уже входит в user
+            return [scputimes(value / 2, value / 2, (100.0 * step - value) / 2,
+                              (100.0 * step - value) / 2, value / 4)
+                    for value in busy]
+        
+        readings = [times(0, 0, 0, 0, 0), times(1, 100, 10, 95, 0), times(2, 190, 40, 190, 0)]
+        frequencies = [MagicMock(current=value) for value in (3000.0, 2000.0, 3000.0, 2000.0)]
+        
+        with patch('psutil.cpu_times', side_effect=readings) as mock_times, \
+             patch('psutil.cpu_freq', side_effect=lambda percpu=False: frequencies if percpu else None):
+            scanner = SystemScanner(cpu_samples=2, cpu_interval=0.01, cpu_per_core=True)
+            cpu = scanner.scan_hardware()['cpu']
+        
+        assert mock_times.call_args.kwargs == {'percpu': True}
+        utilization = cpu['utilization']
+        assert utilization['samples'] == 2
+        assert utilization['window'] >= 0.01
+        assert {key: utilization[key] for key in ('min', 'max', 'mean', 'saturated_cores')} == {
+            'min': 0.0, 'max': 95.0, 'mean': 52.5, 'saturated_cores': 2
+        }
+        assert cpu['core_frequency']['mean'] == 2500.0
+        assert cpu['per_core'] == {'utilization': [95.0, 20.0, 95.0, 0.0],
+                                   'frequency': [3000.0, 2000.0, 3000.0, 2000.0]}
+    
+    def test_first_window_not_shorter_than_interval(self):
+        """Тест: первое сканирование нового сканера измеряет загрузку не менее cpu_interval."""
+        from core.scanner import SystemScanner
+        scanner = SystemScanner(cpu_interval=0.2)
+        
+        first = scanner.scan_hardware()['cpu']['utilization']
+        second = scanner.scan_hardware()['cpu']['utilization']
+        
+        assert first['samples'] == 1
+        assert first['window'] >= 0.2
+        assert second['window'] >= 0.2
+    
+    def test_per_core_series_off_by_default(self, scanner_instance):
+        """Тест: по умолчанию в снимок попадают только сводки по ядрам."""
+        cpu = scanner_instance.scan_hardware()['cpu']
+        
+        assert 'per_core' not in cpu
+        assert cpu['utilization']['samples'] == 1
+        assert set(cpu['utilization']) >= {'min', 'max', 'mean', 'p95', 'saturated_cores'}
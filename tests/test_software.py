@@ -0,0 +1,158 @@
+import pytest
+import os
+import sqlite3
+import struct
+import time
+from unittest.mock import patch
+
+
+def make_rpm_header(entries):
+    """Сборка заголовка RPM в формате, хранящемся в rpmdb.sqlite."""
+    index = b''
+    data = b''
+    for tag, tag_type, value in entries:
+        if tag_type == 6:
+            payload = value.encode('utf-8') + b'\0'
+        else:
+            data += b'\0' * (-len(data) % 4)
+            payload = struct.pack('>i', value)
+        index += struct.pack('>IIII', tag, tag_type, len(data), 1)
+        data += payload
+    return struct.pack('>II', len(entries), len(data)) + index + data
+
+
+def write_dpkg_status(path, count):
+    paragraphs = []
+    for i in range(count):
+        status = 'install ok installed' if i % 10 else 'deinstall ok config-files'
+        paragraphs.append(
+            f"Package: pkg{i}\n"
+            f"Status: {status}\n"
+            f"Priority: optional\n"
+            f"Architecture: amd64\n"
+            f"Version: 1.{i}-1\n"
+            f"Description: test package {i}\n"
+            f" Some long description.\n"
+            f" Status: not a field\n"
+        )
+    path.write_text('\n'.join(paragraphs), encoding='utf-8')
+
+
+@pytest.fixture
+def inventory_paths(tmp_path):
+    """Фикстура с тестовыми источниками: dpkg, rpmdb и каталог site-packages."""
+    dpkg_status = tmp_path / 'status'
+    write_dpkg_status(dpkg_status, 20)
+
+    rpmdb = tmp_path / 'rpmdb.sqlite'
+    connection = sqlite3.connect(str(rpmdb))
+    connection.execute('CREATE TABLE Packages (hnum INTEGER PRIMARY KEY AUTOINCREMENT, blob BLOB NOT NULL)')
+    connection.executemany('INSERT INTO Packages (blob) VALUES (?)', [
+        (make_rpm_header([(1000, 6, 'bash'), (1001, 6, '5.2.15'), (1002, 6, '3.fc39'),
+                          (1022, 6, 'x86_64')]),),
+        (make_rpm_header([(1000, 6, 'openssl'), (1001, 6, '3.1.1'), (1002, 6, '4.fc39'),
+                          (1003, 4, 1), (1022, 6, 'x86_64')]),),
+    ])
+    connection.commit()
+    connection.close()
+
+    site_dir = tmp_path / 'site-packages'
+    site_dir.mkdir()
+    (site_dir / 'requests-2.31.0.dist-info').mkdir()
+    (site_dir / 'six-1.16.0-py3.11.egg-info').mkdir()
+    legacy = site_dir / 'legacy.egg-info'
+    legacy.mkdir()
+    (legacy / 'PKG-INFO').write_text('Metadata-Version: 1.0\nName: legacy\nVersion: 0.9\n')
+    (site_dir / 'requests').mkdir()
+
+    return {'dpkg_status': str(dpkg_status), 'rpmdb_paths': (str(rpmdb),),
+            'site_dirs': [str(site_dir)]}
+
+
+class TestSoftwareInventory:
+    """Тесты инвентаризации установленного ПО."""
+
+    def test_collects_all_sources(self, inventory_paths):
+        """Тест сбора пакетов из dpkg, rpmdb и метаданных Python."""
+        from core.software import SoftwareInventory
+        inventory = SoftwareInventory(**inventory_paths)
+
+        packages, cached = inventory.collect()
+
+        by_source = {}
+        for package in packages:
+            by_source.setdefault(package['source'], []).append(package)
+        assert len(by_source['dpkg']) == 18
+        assert {'name': 'pkg1', 'version': '1.1-1', 'arch': 'amd64', 'source': 'dpkg'} in by_source['dpkg']
+        assert {p['name']: p['version'] for p in by_source['rpm']} == {
+            'bash': '5.2.15-3.fc39', 'openssl': '1:3.1.1-4.fc39'}
+        assert {p['name']: p['version'] for p in by_source['python']} == {
+            'requests': '2.31.0', 'six': '1.16.0', 'legacy': '0.9'}
+        assert cached == []
+
+    def test_repeat_scan_served_from_cache(self, inventory_paths):
+        """Тест: на неизменном хосте повторный сбор не разбирает источники заново."""
+        from core.software import SoftwareInventory
+        inventory = SoftwareInventory(**inventory_paths)
+        first, _ = inventory.collect()
+
+        with patch('core.software.parse_dpkg_status') as mock_dpkg, \
+             patch('core.software.parse_rpmdb') as mock_rpm, \
+             patch('core.software.parse_site_dir') as mock_site:
+            second, cached = inventory.collect()
+
+        assert second == first
+        assert len(cached) == 3
+        mock_dpkg.assert_not_called()
+        mock_rpm.assert_not_called()
+        mock_site.assert_not_called()
+
+    def test_changed_source_is_reparsed(self, inventory_paths):
+        """Тест: изменение файла-источника сбрасывает кэш только этого источника."""
+        from core.software import SoftwareInventory
+        inventory = SoftwareInventory(**inventory_paths)
+        inventory.collect()
+
+        status = inventory_paths['dpkg_status']
+        with open(status, 'a', encoding='utf-8') as f:
+            f.write("\nPackage: newpkg\nStatus: install ok installed\nVersion: 2.0\n")
+        stat = os.stat(status)
+        os.utime(status, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        packages, cached = inventory.collect()
+
+        assert 'newpkg' in {p['name'] for p in packages}
+        assert 'dpkg' not in cached
+        assert 'rpm' in cached
+
+    def test_missing_sources_are_skipped(self, tmp_path):
+        """Негативный тест: отсутствующие источники не приводят к ошибке."""
+        from core.software import SoftwareInventory
+        inventory = SoftwareInventory(dpkg_status=str(tmp_path / 'nope'),
+                                      rpmdb_paths=(str(tmp_path / 'nope.sqlite'),),
+                                      site_dirs=[str(tmp_path / 'nope')])
+
+        assert inventory.collect() == ([], [])
+
+    def test_corrupt_rpmdb_is_skipped(self, inventory_paths, tmp_path):
+        """Негативный тест: поврежденная база RPM пропускается."""
+        from core.software import SoftwareInventory
+        broken = tmp_path / 'broken.sqlite'
+        broken.write_bytes(b'not a database')
+        inventory = SoftwareInventory(dpkg_status=None, rpmdb_paths=(str(broken),), site_dirs=[])
+
+        assert inventory.collect() == ([], [])
+
+    def test_large_dpkg_status_is_fast(self, tmp_path):
+        """Тест производительности: 5000 пакетов dpkg разбираются быстрее секунды."""
+        from core.software import SoftwareInventory
+        status = tmp_path / 'status'
+        write_dpkg_status(status, 5000)
+        inventory = SoftwareInventory(dpkg_status=str(status), rpmdb_paths=(), site_dirs=[])
+
+        start = time.perf_counter()
+        packages, _ = inventory.collect()
+        elapsed = time.perf_counter() - start
+
+        assert len(packages) == 4500
+        assert elapsed < 1.0
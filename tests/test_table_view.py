@@ -0,0 +1,68 @@
+import pytest
+import time
+
+
+class TestTableModel:
+    """Тесты модели виртуализированной таблицы."""
+    
+    @pytest.fixture
+    def model(self):
+        from gui.table_view import TableModel
+        columns = [
+            {'title': "Интерфейс"},
+            {'title': "Адрес"},
+            {'title': "Размер", 'format': lambda value: f"{value} ГБ"}
+        ]
+        rows = [
+            ('eth0', '10.0.0.2', 30),
+            ('veth1', None, 10),
+            ('eth1', '192.168.1.5', None),
+            ('lo', '127.0.0.1', 20)
+        ]
+        return TableModel(columns, rows)
+    
+    def test_window_formats_visible_rows_only(self, model):
+        """Тест: окно возвращает только запрошенные строки в виде текста."""
+        assert len(model) == 4
+        assert model.window(1, 2) == [('veth1', '', '10 ГБ'), ('eth1', '192.168.1.5', '')]
+        assert model.window(3, 10) == [('lo', '127.0.0.1', '20 ГБ')]
+    
+    def test_sort_toggles_direction_and_keeps_empty_last(self, model):
+        """Тест сортировки: повторный выбор колонки меняет направление, пустые значения в конце."""
+        model.sort(2)
+        assert [row[0] for row in model.window(0, 4)] == ['veth1', 'lo', 'eth0', 'eth1']
+        
+        model.sort(2)
+        assert model.descending
+        assert [row[0] for row in model.window(0, 4)] == ['eth0', 'lo', 'veth1', 'eth1']
+        
+        model.sort(0)
+        assert not model.descending
+        assert [row[0] for row in model.window(0, 4)] == ['eth0', 'eth1', 'lo', 'veth1']
+    
+    def test_filter_matches_formatted_text(self, model):
+        """Тест фильтра: поиск без учета регистра по отображаемому тексту."""
+        model.sort(0)
+        model.set_filter(' ETH ')
+        assert len(model) == 3
+        assert [row[0] for row in model.window(0, 10)] == ['eth0', 'eth1', 'veth1']
+        
+        model.set_filter('20 гб')
+        assert model.window(0, 10) == [('lo', '127.0.0.1', '20 ГБ')]
+        
+        model.set_filter('')
+        assert len(model) == 4
+    
+    def test_open_does_not_depend_on_row_count(self):
+        """Тест: создание модели на 50 000 строк не обходит строки."""
+        from gui.table_view import TableModel
+        rows = [(f'veth{index}', f'10.0.{index >> 8 & 255}.{index & 255}') for index in range(50000)]
+        
+        start = time.perf_counter()
+        model = TableModel([{'title': "Интерфейс"}, {'title': "Адрес"}], rows)
+        page = model.window(25000, 30)
+        elapsed = time.perf_counter() - start
+        
+        assert len(model) == 50000
+        assert page[0] == ('veth25000', '10.0.97.168')
+        assert elapsed < 0.01